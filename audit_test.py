@@ -4,14 +4,17 @@ WebSitioPro Endpoint Audit Test
 Comprehensive testing of /api/make/auto-create endpoint for Make.com integration
 """
 
-import requests
 import json
 import time
 import os
 
+from websitio import get_client
+
+client = get_client()
+
 def test_local_endpoint():
     """Test the local Replit endpoint"""
-    local_url = "http://localhost:5000/api/make/auto-create"
+    local_url = client.url("/api/make/auto-create")
     headers = {"Content-Type": "application/json"}
     
     # Test payload as specified in audit request
@@ -29,7 +32,7 @@ def test_local_endpoint():
     print(f"Payload: {json.dumps(test_payload, indent=2)}")
     
     try:
-        response = requests.post(local_url, json=test_payload, headers=headers, timeout=10)
+        response = client.post(local_url, json=test_payload, headers=headers, timeout=10)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
@@ -57,7 +60,7 @@ def test_local_endpoint():
 
 def test_make_webhook():
     """Test the Make.com webhook"""
-    webhook_url = "https://hook.us2.make.com/6mcqk72uclcv86i1rtkao3bm2hhq3vh6"
+    webhook_url = client.webhook_url("6mcqk72uclcv86i1rtkao3bm2hhq3vh6")
     headers = {"Content-Type": "application/json"}
     
     test_payload = {
@@ -74,7 +77,7 @@ def test_make_webhook():
     print(f"Payload: {json.dumps(test_payload, indent=2)}")
     
     try:
-        response = requests.post(webhook_url, json=test_payload, headers=headers, timeout=30)
+        response = client.post(webhook_url, json=test_payload, headers=headers, timeout=30)
         print(f"Status Code: {response.status_code}")
         print(f"Response: {response.text}")
         
@@ -124,7 +127,7 @@ def audit_endpoint_code():
         print("✓ websitio_test.py exists")
         with open('websitio_test.py', 'r') as f:
             content = f.read()
-            if 'hook.us2.make.com' in content:
+            if 'client.webhook_url(' in content:
                 print("✓ Make.com webhook URL configured")
             if 'Content-Type' in content and 'application/json' in content:
                 print("✓ Proper headers configured")
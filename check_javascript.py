@@ -3,57 +3,55 @@
 Check if the JavaScript image loading function is actually in the HTML
 """
 
-import requests
+from websitio import ApiError, get_client
+
+client = get_client()
 
 def check_javascript():
     """Check for specific JavaScript functions in the template"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
     template_id = "ChIJI0Jqhp0rTI8RydmtO71J-k4_1751626655994"
     
     print(f"=== Checking JavaScript in Template ===")
     
     try:
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
-        html_content = response.text
+        page = client.preview_page(template_id)
+        script_text = page.script_text
+        style_text = page.style_text
         
-        # Check for specific functions and elements
+        # Check for specific functions and elements, each in the part of the page it belongs to
         checks = [
-            ("loadCoverImage function", "loadCoverImage"),
-            ("addEventListener for DOMContentLoaded", "addEventListener('DOMContentLoaded'"),
-            ("img.onload function", "img.onload"),
-            ("img.onerror function", "img.onerror"),
-            ("header-image.loading CSS", ".header-image.loading"),
-            ("header-image.error CSS", ".header-image.error"),
-            ("JavaScript code block", "<script>"),
-            ("Background image style", "background-image"),
-            ("Cover URL assignment", "headerElement.style.backgroundImage")
+            ("loadCoverImage function", "loadCoverImage" in page.js_functions),
+            ("addEventListener for DOMContentLoaded", "addEventListener('DOMContentLoaded'" in script_text),
+            ("img.onload function", "img.onload" in script_text),
+            ("img.onerror function", "img.onerror" in script_text),
+            ("header-image.loading CSS", ".header-image.loading" in style_text),
+            ("header-image.error CSS", ".header-image.error" in style_text),
+            ("JavaScript code block", bool(page.script_blocks)),
+            ("Background image style", bool(page.inline_background_urls) or "background-image" in style_text),
+            ("Cover URL assignment", "headerElement.style.backgroundImage" in script_text)
         ]
         
-        for name, search_term in checks:
-            if search_term in html_content:
+        for name, found in checks:
+            if found:
                 print(f"✓ {name} found")
             else:
                 print(f"✗ {name} missing")
                 
         # Show actual JavaScript content
-        script_start = html_content.find('<script>')
-        if script_start != -1:
-            script_end = html_content.find('</script>', script_start)
-            if script_end != -1:
-                script_content = html_content[script_start:script_end + 9]
-                print(f"\nJavaScript content found ({len(script_content)} characters)")
-                
-                # Check specifically for cover image loading
-                if 'loadCoverImage' in script_content:
-                    print("✓ loadCoverImage function is in JavaScript")
-                else:
-                    print("✗ loadCoverImage function not found in JavaScript")
+        if page.script_blocks:
+            print(f"\nJavaScript content found ({len(script_text)} characters)")
+            
+            # Check specifically for cover image loading
+            if 'loadCoverImage' in script_text:
+                print("✓ loadCoverImage function is in JavaScript")
             else:
-                print("\nJavaScript block incomplete")
+                print("✗ loadCoverImage function not found in JavaScript")
         else:
             print("\nNo JavaScript block found")
             
+    except ApiError as e:
+        print(f"✗ Preview failed: {e.status_code}")
     except Exception as e:
         print(f"Error: {e}")
 
@@ -9,9 +9,16 @@ async function cleanupDuplicates() {
   try {
     console.log('🧹 Starting duplicate cleanup...');
     
-    // Get all templates
-    const response = await fetch(`${API_BASE}/api/templates`);
-    const templates = await response.json();
+    // Get all template summaries, one page at a time
+    const templates = [];
+    let cursor = null;
+    do {
+      const query = cursor ? `?limit=500&cursor=${encodeURIComponent(cursor)}` : '?limit=500';
+      const response = await fetch(`${API_BASE}/api/templates${query}`);
+      const page = await response.json();
+      templates.push(...page.templates);
+      cursor = page.nextCursor;
+    } while (cursor);
     
     console.log(`📋 Found ${templates.length} total templates`);
     
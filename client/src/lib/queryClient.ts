@@ -23,22 +23,40 @@ export async function apiRequest(
   return res;
 }
 
+// Last ETag and body per URL. Refetches send If-None-Match, and a 304 reuses
+// the body, so an unchanged config (GET /api/config/:id) isn't downloaded again
+const validated = new Map<string, { etag: string; data: any }>();
+
 type UnauthorizedBehavior = "returnNull" | "throw";
 export const getQueryFn: <T>(options: {
   on401: UnauthorizedBehavior;
 }) => QueryFunction<T> =
   ({ on401: unauthorizedBehavior }) =>
   async ({ queryKey }) => {
-    const res = await fetch(queryKey[0] as string, {
+    const url = queryKey[0] as string;
+    const cached = validated.get(url);
+    const res = await fetch(url, {
       credentials: "include",
+      headers: cached ? { "If-None-Match": cached.etag } : {},
     });
 
+    if (res.status === 304 && cached) {
+      return cached.data;
+    }
+
     if (unauthorizedBehavior === "returnNull" && res.status === 401) {
       return null;
     }
 
     await throwIfResNotOk(res);
-    return await res.json();
+    const data = await res.json();
+    const etag = res.headers.get("ETag");
+    if (etag) {
+      validated.set(url, { etag, data });
+    } else {
+      validated.delete(url);
+    }
+    return data;
   };
 
 export const queryClient = new QueryClient({
@@ -47,7 +65,8 @@ export const queryClient = new QueryClient({
       queryFn: getQueryFn({ on401: "throw" }),
       refetchInterval: false,
       refetchOnWindowFocus: false,
-      staleTime: Infinity,
+      // Configs are revalidated on every use (a 304 while unchanged); the rest stays cached
+      staleTime: ({ queryKey }) => (String(queryKey[0]).startsWith("/api/config/") ? 0 : Infinity),
       retry: false,
     },
     mutations: {
@@ -33,6 +33,9 @@ interface TemplateData {
   lastModified?: string;
 }
 
+// Clients fetched per request; more are loaded on demand
+const CLIENT_PAGE_SIZE = 100;
+
 export default function ClientSelectorPage() {
   const [clients, setClients] = useState<ClientInfo[]>([]);
   const [filteredClients, setFilteredClients] = useState<ClientInfo[]>([]);
@@ -40,6 +43,8 @@ export default function ClientSelectorPage() {
   const [searchTerm, setSearchTerm] = useState('');
   const [filterType, setFilterType] = useState('all');
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const [nextCursor, setNextCursor] = useState<number | null>(null);
 
   useEffect(() => {
     loadClients();
@@ -49,15 +54,22 @@ export default function ClientSelectorPage() {
     filterClients();
   }, [clients, searchTerm, filterType]);
 
-  const loadClients = async () => {
-    setIsLoading(true);
+  const loadClients = async (cursor?: number) => {
+    if (cursor) {
+      setIsLoadingMore(true);
+    } else {
+      setIsLoading(true);
+    }
     try {
-      // Load clients from the configs endpoint (where template editors create clients)
-      const response = await fetch('/api/configs');
+      // Load clients from the configs endpoint (where template editors create clients);
+      // it returns summary fields a page at a time, newest first
+      const params = new URLSearchParams({ limit: String(CLIENT_PAGE_SIZE) });
+      if (cursor) params.set('cursor', String(cursor));
+      const response = await fetch(`/api/configs?${params}`);
       if (response.ok) {
-        const configs = await response.json();
+        const page = await response.json();
 
-        const clientList: ClientInfo[] = configs.map((config: any) => {
+        const clientList: ClientInfo[] = page.configs.map((config: any) => {
           // Use the correct field names based on template type
           let displayName = config.name || 'Unnamed Client';
           let businessName = config.name || '';
@@ -82,20 +94,23 @@ export default function ClientSelectorPage() {
             businessName: businessName,
             lastModified: actualTimestamp,
             createdAt: actualTimestamp,
-            templateId: config.id?.toString() || 'unknown'
+            templateId: config.id?.toString() || 'unknown',
+            clientApproval: config.clientApproval
           };
         });
 
-        setClients(clientList);
-      } else {
+        setClients(previous => cursor ? [...previous, ...clientList] : clientList);
+        setNextCursor(page.nextCursor);
+      } else if (!cursor) {
         // Fallback to empty list if API doesn't exist yet
         setClients([]);
       }
     } catch (error) {
       console.error('Failed to load clients:', error);
-      setClients([]);
+      if (!cursor) setClients([]);
     } finally {
       setIsLoading(false);
+      setIsLoadingMore(false);
     }
   };
 
@@ -493,6 +508,19 @@ export default function ClientSelectorPage() {
               </div>
             )}
 
+            {/* Load More */}
+            {!isLoading && nextCursor !== null && (
+              <div className="text-center mt-4">
+                <button
+                  className="btn btn-outline-primary"
+                  onClick={() => loadClients(nextCursor)}
+                  disabled={isLoadingMore}
+                >
+                  {isLoadingMore ? 'Loading...' : 'Load more clients'}
+                </button>
+              </div>
+            )}
+
             <div className="text-center mt-5">
               <div className="alert alert-info">
                 <strong>Team Collaboration:</strong> Each team member can work on different client websites simultaneously. 
@@ -3,15 +3,16 @@
 Debug the exact template preview to see what's happening with the cover image
 """
 
-import requests
 import json
 import re
 
+from websitio import get_client
+
+client = get_client()
+
 def debug_template_preview():
     """Debug the specific template that was just created"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
-    
     # Get the template ID from the latest creation
     template_id = "ChIJI0Jqhp0rTI8RydmtO71J-k4_1751628287644"
     
@@ -21,7 +22,7 @@ def debug_template_preview():
     # 1. Get the template data
     print("\n1. Getting template data...")
     try:
-        response = requests.get(f"{base_url}/api/templates/{template_id}", timeout=30)
+        response = client.get(f"/api/templates/{template_id}")
         if response.status_code == 200:
             template_data = response.json()
             print(f"✓ Template data loaded")
@@ -67,7 +68,7 @@ def debug_template_preview():
     # 2. Get the preview HTML
     print("\n2. Getting preview HTML...")
     try:
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
+        response = client.get(f"/templates/{template_id}/preview")
         if response.status_code == 200:
             html_content = response.text
             print(f"✓ Preview HTML loaded ({len(html_content)} characters)")
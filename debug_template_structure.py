@@ -3,14 +3,15 @@
 Debug the template data structure to understand why heroImage isn't working
 """
 
-import requests
 import json
 
+from websitio import get_client
+
+client = get_client()
+
 def debug_template_structure():
     """Debug the latest template data structure"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
-    
     # Get the latest Mexpat template
     template_id = "ChIJI0Jqhp0rTI8RydmtO71J-k4_1751629876300"
     
@@ -18,7 +19,7 @@ def debug_template_structure():
     print(f"Template ID: {template_id}")
     
     try:
-        response = requests.get(f"{base_url}/api/templates/{template_id}", timeout=30)
+        response = client.get(f"/api/templates/{template_id}")
         if response.status_code == 200:
             template_data = response.json()
             
@@ -4,12 +4,15 @@ Establish webhook data structure for Make.com
 Sends consistent payloads to detect field structure
 """
 
-import requests
 import json
 import time
 
+from websitio import get_client
+
+client = get_client()
+
 def test_webhook_structure():
-    webhook_url = "https://hook.us2.make.com/w6qv7b5bqcd9lyigl48hbhtvkey86qlo"
+    webhook_url = client.webhook_url("w6qv7b5bqcd9lyigl48hbhtvkey86qlo")
     
     # Primary test payload
     payload = {
@@ -28,7 +31,7 @@ def test_webhook_structure():
     print(f"Payload: {json.dumps(payload, indent=2)}")
     
     try:
-        response = requests.post(webhook_url, json=payload, headers=headers, timeout=30)
+        response = client.post(webhook_url, json=payload, headers=headers, timeout=30)
         print(f"Status Code: {response.status_code}")
         print(f"Response: {response.text}")
         
@@ -44,7 +47,7 @@ def test_webhook_structure():
         return False
 
 def send_structure_payloads():
-    webhook_url = "https://hook.us2.make.com/w6qv7b5bqcd9lyigl48hbhtvkey86qlo"
+    webhook_url = client.webhook_url("w6qv7b5bqcd9lyigl48hbhtvkey86qlo")
     
     payloads = [
         {
@@ -81,7 +84,7 @@ def send_structure_payloads():
         print(f"\nPayload {i}: {payload['name']}")
         
         try:
-            response = requests.post(webhook_url, json=payload, headers=headers, timeout=30)
+            response = client.post(webhook_url, json=payload, headers=headers, timeout=30)
             print(f"Status: {response.status_code} - {response.text}")
             
         except Exception as e:
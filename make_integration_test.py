@@ -8,9 +8,13 @@ import requests
 import json
 import time
 
+from websitio import get_client
+
+client = get_client()
+
 def test_tulum_bakery():
     """Test with Tulum Bakery payload as specified"""
-    webhook_url = "https://hook.us2.make.com/vlcril6b6o88s994ov4uqytoi22a61h8"
+    webhook_url = client.webhook_url("vlcril6b6o88s994ov4uqytoi22a61h8")
     headers = {"Content-Type": "application/json"}
     
     # Test payload as specified in instructions
@@ -30,7 +34,7 @@ def test_tulum_bakery():
     
     try:
         print("Sending payload to Make.com webhook...")
-        response = requests.post(webhook_url, json=payload, headers=headers, timeout=30)
+        response = client.post(webhook_url, json=payload, headers=headers, timeout=30)
         
         print(f"Status Code: {response.status_code}")
         print(f"Response: {response.text}")
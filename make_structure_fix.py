@@ -4,14 +4,17 @@ Make.com Data Structure Fix
 Sends consistent payload format to establish stable webhook structure
 """
 
-import requests
 import json
 import time
 
+from websitio import get_client
+
+client = get_client()
+
 def send_structure_payload():
     """Send consistent payload to establish Make.com data structure"""
     
-    webhook_url = "https://hook.us2.make.com/vlcril6b6o88s994ov4uqytoi22a61h8"
+    webhook_url = client.webhook_url("vlcril6b6o88s994ov4uqytoi22a61h8")
     
     # Standardized payload format for Make.com structure detection
     payload = {
@@ -36,7 +39,7 @@ def send_structure_payload():
     print("\nSending payload...")
     
     try:
-        response = requests.post(webhook_url, json=payload, headers=headers, timeout=30)
+        response = client.post(webhook_url, json=payload, headers=headers, timeout=30)
         
         print(f"Status Code: {response.status_code}")
         print(f"Response: {response.text}")
@@ -61,7 +64,7 @@ def send_structure_payload():
 def send_multiple_consistent_payloads():
     """Send multiple identical payloads to reinforce structure"""
     
-    webhook_url = "https://hook.us2.make.com/vlcril6b6o88s994ov4uqytoi22a61h8"
+    webhook_url = client.webhook_url("vlcril6b6o88s994ov4uqytoi22a61h8")
     
     payloads = [
         {
@@ -102,7 +105,7 @@ def send_multiple_consistent_payloads():
         print(f"Payload: {json.dumps(payload, indent=2)}")
         
         try:
-            response = requests.post(webhook_url, json=payload, headers=headers, timeout=30)
+            response = client.post(webhook_url, json=payload, headers=headers, timeout=30)
             print(f"Status: {response.status_code} - {response.text}")
             
             if response.status_code != 200:
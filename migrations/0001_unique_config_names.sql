@@ -0,0 +1,22 @@
+-- Demo and homepage configs are looked up by name, so names must be unique.
+-- Duplicates are not renamed here: a client's clean URL is built from its
+-- name, so the migration stops and lists them for manual cleanup instead.
+DO $$
+DECLARE
+  duplicates text;
+BEGIN
+  SELECT string_agg(format('%L (ids %s)', "name", "ids"), '; ')
+  INTO duplicates
+  FROM (
+    SELECT "name", string_agg("id"::text, ', ' ORDER BY "id") AS "ids"
+    FROM "website_configs"
+    GROUP BY "name"
+    HAVING count(*) > 1
+  ) AS "d";
+
+  IF duplicates IS NOT NULL THEN
+    RAISE EXCEPTION 'website_configs has duplicate names: %', duplicates
+      USING HINT = 'Rename or delete the extra rows (renaming a client changes its URL), then run the migration again.';
+  END IF;
+END $$;--> statement-breakpoint
+ALTER TABLE "website_configs" ADD CONSTRAINT "website_configs_name_unique" UNIQUE("name");
\ No newline at end of file
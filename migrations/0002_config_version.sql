@@ -0,0 +1,2 @@
+-- Bumped by every update of a config; ETags for GET /api/config/:id are derived from it
+ALTER TABLE "website_configs" ADD COLUMN "version" integer DEFAULT 1 NOT NULL;
\ No newline at end of file
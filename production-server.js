@@ -6,6 +6,7 @@
 import express from 'express';
 import cors from 'cors';
 import path from 'path';
+import { compressResponses, precompressedStatic } from './server/compression.js';
 
 // Import routes using dynamic import for ES modules compatibility
 let registerRoutes;
@@ -27,6 +28,9 @@ async function startServer() {
   app.use(express.json({ limit: '50mb' }));
   app.use(express.urlencoded({ extended: true, limit: '50mb' }));
 
+  // gzip/brotli for JSON and HTML responses above COMPRESS_THRESHOLD_BYTES
+  app.use(compressResponses());
+
   // CORS configuration for external access
   app.use(cors({
     origin: '*',
@@ -73,6 +77,9 @@ async function startServer() {
     });
   });
 
+  // Generated sites (dist/static/<templateId>/), from their .br/.gz copies when accepted
+  app.use('/static', precompressedStatic(path.resolve(process.cwd(), 'dist/static')));
+
   // Register all API routes
   try {
     await registerRoutes(app);
@@ -10,6 +10,7 @@ import cors from 'cors';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import fs from 'fs/promises';
+import { compressResponses } from './server/compression.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -29,6 +30,9 @@ app.use(cors({
 app.use(express.json({ limit: '50mb' }));
 app.use(express.urlencoded({ extended: true, limit: '50mb' }));
 
+// gzip/brotli for JSON and HTML responses above COMPRESS_THRESHOLD_BYTES
+app.use(compressResponses());
+
 // Enhanced headers for external access
 app.use((req, res, next) => {
   res.header('Access-Control-Allow-Origin', '*');
@@ -2,6 +2,18 @@ import type { Express, Request, Response } from "express";
 import { z } from "zod";
 import fs from "fs/promises";
 import path from "path";
+import { templateSaved } from "./template-events";
+import { getTemplateStats, rebuildTemplateStats } from "./template-stats";
+import {
+  appendWhatsAppLog,
+  exportWhatsAppLogs,
+  getWhatsAppLogCounts,
+  queryWhatsAppLogs,
+  type WhatsAppLogQuery
+} from "./whatsapp-log";
+import { createLogger } from "./logger";
+
+const log = createLogger("agent");
 
 // Simplified business data schema for Make integration
 const mockBusinessSchema = z.object({
@@ -252,7 +264,12 @@ export function registerAgentRoutes(app: Express) {
   // Main agent endpoint for creating templates from business data
   app.post("/api/agent/create-template", async (req: Request, res: Response) => {
     try {
-      console.log("Agent: Received business data:", req.body);
+      // The payload holds names, phones and addresses; only ids at info
+      log.info('Received business data', {
+        place_id: req.body?.Place_ID || req.body?.place_id,
+        category: req.body?.Template_Type || req.body?.category
+      });
+      log.debug('Business data payload', { body: req.body });
       
       // Transform Google Sheets format to expected format
       const rawData = req.body;
@@ -271,7 +288,7 @@ export function registerAgentRoutes(app: Express) {
         fb_likes: rawData.fb_likes || '100'
       };
       
-      console.log("Agent: Transformed data:", transformedData);
+      log.debug('Transformed data', { data: transformedData });
       
       // Validate transformed business data
       const validation = mockBusinessSchema.safeParse(transformedData);
@@ -294,8 +311,9 @@ export function registerAgentRoutes(app: Express) {
       
       const templatePath = path.join(templatesDir, `${templateData.templateId}.json`);
       await fs.writeFile(templatePath, JSON.stringify(templateData, null, 2));
+      templateSaved(templateData.templateId, templateData);
       
-      console.log("Agent: Template saved:", templateData.templateId);
+      log.info('Template saved', { templateId: templateData.templateId });
       
       // Send to Make webhook for automation
       try {
@@ -317,7 +335,8 @@ export function registerAgentRoutes(app: Express) {
         };
         
         // Make webhook call would go here
-        console.log("Agent: Would send to Make webhook:", makeData);
+        log.info('Would send to Make webhook', { place_id: makeData.place_id, templateId: makeData.template_id });
+        log.debug('Make webhook payload', { data: makeData });
         
         // For now, simulate webhook success
         const webhookSuccess = true;
@@ -424,85 +443,27 @@ export function registerAgentRoutes(app: Express) {
     }
   });
   
-  // Get agent statistics
-  app.get("/api/agent/stats", async (_req: Request, res: Response) => {
+  // Get agent statistics (served from incrementally maintained counters)
+  app.get("/api/agent/stats", async (req: Request, res: Response) => {
     try {
-      const templatesDir = path.resolve(process.cwd(), 'templates');
-      
-      try {
-        const files = await fs.readdir(templatesDir);
-        const jsonFiles = files.filter(file => file.endsWith('.json'));
-        
-        const categoryStats: Record<string, number> = {
-          "Professionals": 0,
-          "Services": 0,
-          "Restaurants": 0,
-          "Tourist Businesses": 0,
-          "Retail": 0
-        };
-        
-        const locationStats: Record<string, number> = {
-          "Chetumal": 0,
-          "Bacalar": 0,
-          "Cancun": 0,
-          "Quintana Roo": 0,
-          "Yucatan": 0
-        };
-        
-        for (const file of jsonFiles) {
-          try {
-            const templatePath = path.join(templatesDir, file);
-            const templateData = JSON.parse(await fs.readFile(templatePath, 'utf-8'));
-            
-            // Count by template type
-            if (templateData.templateType === "professionals") categoryStats["Professionals"]++;
-            else if (templateData.templateType === "services") categoryStats["Services"]++;
-            else if (templateData.templateType === "restaurants") categoryStats["Restaurants"]++;
-            else if (templateData.templateType === "tourism") categoryStats["Tourist Businesses"]++;
-            else if (templateData.templateType === "retail") categoryStats["Retail"]++;
-            
-            // Count by location
-            if (templateData.location && locationStats[templateData.location] !== undefined) {
-              locationStats[templateData.location]++;
-            }
-          } catch (fileError) {
-            console.error(`Agent: Error reading template ${file}:`, fileError);
-          }
-        }
-        
-        res.json({
-          totalTemplates: jsonFiles.length,
-          categoryBreakdown: categoryStats,
-          locationBreakdown: locationStats,
-          lastUpdated: new Date().toISOString()
-        });
-        
-      } catch (dirError) {
-        res.json({
-          totalTemplates: 0,
-          categoryBreakdown: {
-            "Professionals": 0,
-            "Services": 0,
-            "Restaurants": 0,
-            "Tourist Businesses": 0,
-            "Retail": 0
-          },
-          locationBreakdown: {
-            "Chetumal": 0,
-            "Bacalar": 0,
-            "Cancun": 0,
-            "Quintana Roo": 0,
-            "Yucatan": 0
-          },
-          lastUpdated: new Date().toISOString()
-        });
-      }
-      
+      const days = Math.min(Math.max(parseInt(String(req.query.days ?? ''), 10) || 30, 1), 366);
+      res.json(await getTemplateStats(days));
     } catch (error) {
       console.error("Agent: Stats failed:", error);
       res.status(500).json({ error: "Failed to get agent statistics" });
     }
   });
+
+  // Recount stats from templates/ (after bulk cleanup or manual edits)
+  app.post("/api/agent/stats/rebuild", async (_req: Request, res: Response) => {
+    try {
+      const rebuilt = await rebuildTemplateStats();
+      res.json({ success: true, totalTemplates: rebuilt.totalTemplates, rebuiltAt: rebuilt.rebuiltAt });
+    } catch (error) {
+      console.error("Agent: Stats rebuild failed:", error);
+      res.status(500).json({ error: "Failed to rebuild agent statistics" });
+    }
+  });
   
   // WhatsApp logging endpoint for Make automation
   app.post("/api/agent/log-whatsapp", async (req: Request, res: Response) => {
@@ -535,18 +496,14 @@ export function registerAgentRoutes(app: Express) {
         googleSheetsReady: true
       };
       
-      // Store WhatsApp log (for Google Sheets integration)
-      const logsDir = path.resolve(process.cwd(), 'whatsapp-logs');
-      await fs.mkdir(logsDir, { recursive: true });
-      
-      const logPath = path.join(logsDir, `${logEntry.templateId}_whatsapp.json`);
-      await fs.writeFile(logPath, JSON.stringify(logEntry, null, 2));
+      // Append to the WhatsApp log (for Google Sheets integration)
+      const logged = await appendWhatsAppLog(logEntry);
       
-      console.log("WhatsApp message logged:", logEntry);
+      log.info('WhatsApp message logged', { seq: logged.seq });
       
       res.json({
         success: true,
-        logId: `${logEntry.templateId}_whatsapp`,
+        logId: `${logged.templateId}_whatsapp_${logged.seq}`,
         message: "WhatsApp message logged for automation",
         scheduleDetails: {
           campaign: logEntry.campaign,
@@ -566,60 +523,82 @@ export function registerAgentRoutes(app: Express) {
   });
   
   // Get WhatsApp logs for verification
-  app.get("/api/agent/whatsapp-logs", async (_req: Request, res: Response) => {
+  // Query: campaign, templateId, since/until (ISO loggedAt), order=asc|desc,
+  // limit (max 1000), cursor (from the previous page's nextCursor)
+  app.get("/api/agent/whatsapp-logs", async (req: Request, res: Response) => {
     try {
-      const logsDir = path.resolve(process.cwd(), 'whatsapp-logs');
+      const query = parseWhatsAppLogQuery(req);
+      if ('error' in query) {
+        return res.status(400).json(query);
+      }
       
-      try {
-        const files = await fs.readdir(logsDir);
-        const jsonFiles = files.filter(file => file.endsWith('_whatsapp.json'));
-        
-        const logs = [];
-        for (const file of jsonFiles) {
-          try {
-            const logPath = path.join(logsDir, file);
-            const logData = JSON.parse(await fs.readFile(logPath, 'utf-8'));
-            logs.push(logData);
-          } catch (fileError) {
-            console.error(`Error reading log ${file}:`, fileError);
-          }
+      const [page, counts] = await Promise.all([queryWhatsAppLogs(query), getWhatsAppLogCounts()]);
+      const weekdayCompleted = counts.campaigns["weekday_evening"] || 0;
+      const weekendCompleted = counts.campaigns["weekend_morning"] || 0;
+      
+      res.json({
+        totalLogs: counts.total,
+        weekdayEvening: weekdayCompleted,
+        weekendMorning: weekendCompleted,
+        logs: page.logs,
+        nextCursor: page.nextCursor,
+        campaignProgress: {
+          weekdayTarget: 15,
+          weekdayCompleted,
+          weekendTarget: 15,
+          weekendCompleted
         }
-        
-        // Group by campaign type
-        const weekdayLogs = logs.filter(log => log.campaign === "weekday_evening");
-        const weekendLogs = logs.filter(log => log.campaign === "weekend_morning");
-        
-        res.json({
-          totalLogs: logs.length,
-          weekdayEvening: weekdayLogs.length,
-          weekendMorning: weekendLogs.length,
-          logs: logs.sort((a, b) => new Date(b.loggedAt).getTime() - new Date(a.loggedAt).getTime()),
-          campaignProgress: {
-            weekdayTarget: 15,
-            weekdayCompleted: weekdayLogs.length,
-            weekendTarget: 15, 
-            weekendCompleted: weekendLogs.length
-          }
-        });
-        
-      } catch (dirError) {
-        res.json({
-          totalLogs: 0,
-          weekdayEvening: 0,
-          weekendMorning: 0,
-          logs: [],
-          campaignProgress: {
-            weekdayTarget: 15,
-            weekdayCompleted: 0,
-            weekendTarget: 15,
-            weekendCompleted: 0
-          }
-        });
-      }
+      });
       
     } catch (error) {
       console.error("WhatsApp logs retrieval failed:", error);
       res.status(500).json({ error: "Failed to get WhatsApp logs" });
     }
   });
-}
\ No newline at end of file
+  
+  // Stream the whole (filtered) WhatsApp log, oldest first, as JSONL or CSV
+  app.get("/api/agent/whatsapp-logs/export", async (req: Request, res: Response) => {
+    try {
+      const query = parseWhatsAppLogQuery(req);
+      if ('error' in query) {
+        return res.status(400).json(query);
+      }
+      const format = req.query.format === 'csv' ? 'csv' : 'jsonl';
+      
+      res.setHeader('Content-Type', format === 'csv' ? 'text/csv; charset=utf-8' : 'application/x-ndjson; charset=utf-8');
+      res.setHeader('Content-Disposition', `attachment; filename="whatsapp-logs.${format}"`);
+      await exportWhatsAppLogs(res, query, format);
+      
+    } catch (error) {
+      console.error("WhatsApp logs export failed:", error);
+      if (!res.headersSent) {
+        res.status(500).json({ error: "Failed to export WhatsApp logs" });
+      } else {
+        res.destroy();
+      }
+    }
+  });
+}
+
+function parseWhatsAppLogQuery(req: Request): WhatsAppLogQuery | { error: string; allowed?: string[] } {
+  const param = (name: string) => typeof req.query[name] === 'string' ? req.query[name] as string : undefined;
+  const order = param('order');
+  const cursor = param('cursor');
+  
+  if (order && !['asc', 'desc'].includes(order)) {
+    return { error: 'Invalid order', allowed: ['asc', 'desc'] };
+  }
+  if (cursor && !/^\d+$/.test(cursor)) {
+    return { error: 'Invalid cursor' };
+  }
+  
+  return {
+    campaign: param('campaign'),
+    templateId: param('templateId'),
+    since: param('since'),
+    until: param('until'),
+    order: order as 'asc' | 'desc' | undefined,
+    limit: param('limit') ? parseInt(param('limit')!, 10) || undefined : undefined,
+    cursor: cursor ? parseInt(cursor, 10) : undefined
+  };
+}
@@ -0,0 +1,113 @@
+/**
+ * Micro-benchmark for the site generator's compiled templates
+ * Renders a few representative configs in a tight loop and reports renders
+ * per second for generateHTML (as a string and as a Buffer), generateCSS and
+ * generateJS. Each HTML row is compared with a baseline on the same page
+ * template: the string against building it with += the way the generator did
+ * before templates were compiled, the Buffer against encoding the string
+ * output, which is what a caller that needs bytes would otherwise do.
+ * Run it before and after changing templateGenerator.ts to compare.
+ * Usage: npm run bench:templates [-- --seconds 2]
+ */
+
+import { WebsiteConfig } from "@shared/schema";
+import { generateCSS, generateHTML, generateHTMLBuffer, generateJS, pageContext, pageMarkup } from "./templateGenerator";
+
+const base = {
+  logo: "",
+  defaultLanguage: "es",
+  showWhyWebsiteButton: true,
+  showDomainButton: true,
+  whatsappNumber: "529831234567",
+  whatsappMessage: "Hola!",
+  facebookUrl: "",
+  googleMapsEmbed: "",
+  address: "Av. Héroes 123, Chetumal",
+  phone: "+52 983 123 4567",
+  email: "contacto@example.com",
+  analyticsCode: "",
+  primaryColor: "#00A859",
+  secondaryColor: "#C8102E",
+  backgroundColor: "#FFFFFF",
+  translations: {
+    en: { tagline: "Welcome", subtitle: "Professional services you can trust", aboutText: "About our business" },
+    es: { tagline: "Bienvenidos", subtitle: "Servicios profesionales en los que puedes confiar", aboutText: "Acerca de nuestro negocio" }
+  },
+  templates: []
+};
+
+const configs = [
+  {
+    ...base,
+    id: 1,
+    name: "Dra. Ana López",
+    templateType: "professionals",
+    showChatbot: false,
+    chatbotQuestions: [],
+    profileImage: "https://example.com/profile.jpg",
+    coverImage: "https://example.com/cover.jpg"
+  },
+  {
+    ...base,
+    id: 2,
+    name: "Taquería El Sol",
+    templateType: "restaurant",
+    defaultLanguage: "en",
+    showChatbot: true,
+    chatbotQuestions: [
+      { key: "hours", question: { en: "Opening hours?", es: "¿Horario?" }, answer: { en: "9am - 9pm", es: "9 a 21 h" } },
+      { key: "location", question: { en: "Where are you?", es: "¿Dónde están?" }, answer: { en: "Downtown", es: "En el centro" } }
+    ]
+  }
+] as unknown as WebsiteConfig[];
+
+// Baseline: the page built with string concatenation rather than compiled segments
+function generateHTMLConcat(config: WebsiteConfig): string {
+  const ctx = pageContext(config);
+  const { segments, slots } = pageMarkup;
+  let html = segments[0];
+  for (let i = 0; i < slots.length; i++) {
+    html += slots[i](ctx);
+    html += segments[i + 1];
+  }
+  return html;
+}
+
+function measure(render: (config: WebsiteConfig) => string | Buffer, seconds: number) {
+  // Warm up so the JIT has settled before timing
+  for (let i = 0; i < 200; i++) render(configs[i % configs.length]);
+
+  let renders = 0;
+  let bytes = 0;
+  const started = process.hrtime.bigint();
+  const deadline = started + BigInt(Math.round(seconds * 1e9));
+  while (process.hrtime.bigint() < deadline) {
+    for (const config of configs) {
+      // byteLength forces V8 to flatten the string, as writing or sending it would
+      const output = render(config);
+      bytes += typeof output === "string" ? Buffer.byteLength(output) : output.length;
+      renders += 1;
+    }
+  }
+  const elapsed = Number(process.hrtime.bigint() - started) / 1e9;
+  return { rate: renders / elapsed, throughput: bytes / elapsed };
+}
+
+function report(name: string, result: ReturnType<typeof measure>, baseline?: ReturnType<typeof measure>) {
+  const speedup = baseline ? `  ${(result.rate / baseline.rate).toFixed(2)}x baseline` : "";
+  console.log(`${name.padEnd(28)} ${Math.round(result.rate).toLocaleString().padStart(10)} renders/s  ${(result.throughput / 1e6).toFixed(1).padStart(8)} MB/s${speedup}`);
+}
+
+const secondsArg = process.argv.indexOf("--seconds");
+const seconds = secondsArg > -1 ? parseFloat(process.argv[secondsArg + 1]) || 2 : 2;
+
+const concatenated = measure(generateHTMLConcat, seconds);
+report("baseline: += concatenation", concatenated);
+report("generateHTML", measure(generateHTML, seconds), concatenated);
+
+const encoded = measure(config => Buffer.from(generateHTML(config), "utf-8"), seconds);
+report("baseline: Buffer.from(html)", encoded);
+report("generateHTMLBuffer", measure(generateHTMLBuffer, seconds), encoded);
+
+report("generateCSS", measure(generateCSS, seconds));
+report("generateJS", measure(generateJS, seconds));
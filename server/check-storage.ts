@@ -0,0 +1,102 @@
+/**
+ * Smoke test and timing for DatabaseStorage against a real database
+ * Creates, reads, lists, updates and deletes a throwaway config through the
+ * driver picked by STORAGE_DRIVER, then reports the average time of the hot
+ * lookups. For a local Postgres:
+ *   DATABASE_URL=postgres://localhost/websitio STORAGE_DRIVER=pg npm run storage:check -- --create-tables
+ * --create-tables creates website_configs (as in server/schema.ts) if it is missing.
+ * Usage: npm run storage:check [-- --create-tables] [-- --rounds 200]
+ */
+
+import { sql } from "drizzle-orm";
+import { DatabaseStorage } from "./storage";
+import { connectDatabase } from "./db";
+
+const args = process.argv.slice(2);
+const roundsArg = args.indexOf("--rounds");
+const rounds = roundsArg >= 0 ? parseInt(args[roundsArg + 1], 10) || 100 : 100;
+
+async function createTables(connection: ReturnType<typeof connectDatabase>) {
+  await connection.db.execute(sql`CREATE TABLE IF NOT EXISTS "website_configs" (
+    "id" serial PRIMARY KEY,
+    "name" text NOT NULL UNIQUE,
+    "templateType" text NOT NULL DEFAULT 'default',
+    "logo" text NOT NULL DEFAULT '',
+    "heroImage" text NOT NULL DEFAULT '',
+    "profileImage" text NOT NULL DEFAULT '',
+    "whatsappMessage" jsonb NOT NULL DEFAULT '{"es":"","en":""}',
+    "facebookUrl" text NOT NULL DEFAULT '',
+    "instagramUrl" text NOT NULL DEFAULT '',
+    "defaultLanguage" text NOT NULL DEFAULT 'es',
+    "showWhyWebsiteButton" boolean NOT NULL DEFAULT false,
+    "showDomainButton" boolean NOT NULL DEFAULT false,
+    "showChatbot" boolean NOT NULL DEFAULT false,
+    "whatsappNumber" text NOT NULL DEFAULT '',
+    "clientApproval" jsonb NOT NULL DEFAULT '{}',
+    "templateShowcaseCards" jsonb NOT NULL DEFAULT '[]',
+    "createdAt" timestamp NOT NULL DEFAULT now(),
+    "updatedAt" timestamp NOT NULL DEFAULT now(),
+    "version" integer NOT NULL DEFAULT 1
+  )`);
+}
+
+function check(condition: unknown, message: string) {
+  if (!condition) throw new Error(`Check failed: ${message}`);
+}
+
+async function time(label: string, run: () => Promise<unknown>) {
+  const started = performance.now();
+  for (let i = 0; i < rounds; i++) await run();
+  const average = (performance.now() - started) / rounds;
+  console.log(`${label.padEnd(28)} ${average.toFixed(2)} ms`);
+}
+
+async function main() {
+  const connection = connectDatabase();
+  const storage = new DatabaseStorage(connection);
+  console.log(`Driver: ${connection.driver}`);
+
+  try {
+    if (args.includes("--create-tables")) await createTables(connection);
+
+    const name = `storage-check ${Date.now()}`;
+    const first = await storage.getOrCreateWebsiteConfigByName(name, { templateType: "professionals" });
+    check(first.created, "getOrCreate creates a missing config");
+    const second = await storage.getOrCreateWebsiteConfigByName(name, { templateType: "professionals" });
+    check(!second.created && second.config.id === first.config.id, "getOrCreate returns the existing config");
+
+    const racers = await Promise.all(
+      [1, 2, 3, 4].map(() => storage.getOrCreateWebsiteConfigByName(`${name} race`, { templateType: "professionals" }))
+    );
+    check(racers.filter(result => result.created).length === 1, "concurrent getOrCreate creates one config");
+    check(new Set(racers.map(result => result.config.id)).size === 1, "concurrent getOrCreate agrees on the id");
+
+    const id = first.config.id;
+    check((await storage.getWebsiteConfig(id))?.name === name, "getWebsiteConfig finds the config");
+    check((await storage.getWebsiteConfigByName(name))?.id === id, "getWebsiteConfigByName finds the config");
+
+    const page = await storage.listWebsiteConfigSummaries({ name: "storage-check", limit: 10 });
+    check(page.configs.some(config => config.id === id), "listWebsiteConfigSummaries includes the config");
+
+    const updated = await storage.updateWebsiteConfig(id, { ...first.config, logo: "logo.png", updatedAt: new Date() });
+    check(updated?.logo === "logo.png", "updateWebsiteConfig saves changes");
+    check(updated?.version === first.config.version + 1, "updateWebsiteConfig bumps the version");
+
+    await time("getWebsiteConfig", () => storage.getWebsiteConfig(id));
+    await time("getWebsiteConfigByName", () => storage.getWebsiteConfigByName(name));
+    await time("getOrCreate (existing)", () => storage.getOrCreateWebsiteConfigByName(name, {}));
+
+    await storage.deleteWebsiteConfig(id);
+    await storage.deleteWebsiteConfig(racers[0].config.id);
+    check((await storage.getWebsiteConfig(id)) === null, "deleteWebsiteConfig removes the config");
+
+    console.log("Storage check passed");
+  } finally {
+    await storage.close();
+  }
+}
+
+main().catch(error => {
+  console.error("Storage check failed:", error);
+  process.exit(1);
+});
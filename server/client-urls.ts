@@ -1,10 +1,31 @@
 /**
  * Server-side client URL handling and routing
+ * Clean URLs are resolved from an in-memory index of client id -> expected
+ * URL, loaded from storage once, kept current by configSaved/configDeleted
+ * (config-events.ts) and reloaded in the background every
+ * CLIENT_URL_INDEX_TTL_MS. Ids with no config are remembered in a bounded
+ * negative cache, so crawlers probing random paths don't reach the database.
  */
 
 import type { Express, Request, Response, NextFunction } from "express";
 import { storage } from "./storage";
 
+const INDEX_TTL_MS = parseInt(process.env.CLIENT_URL_INDEX_TTL_MS || '', 10) || 5 * 60 * 1000;
+const UNKNOWN_TTL_MS = parseInt(process.env.CLIENT_URL_UNKNOWN_TTL_MS || '', 10) || 60 * 1000;
+const UNKNOWN_MAX_ENTRIES = parseInt(process.env.CLIENT_URL_UNKNOWN_MAX || '', 10) || 10000;
+
+// Expected clean URL (slug + id) per client id
+const clientUrls = new Map<number, string>();
+
+// Client ids with no config -> when to check again, oldest first
+const unknownClients = new Map<number, number>();
+
+let loadedAt = 0;
+let loading: Promise<void> | null = null;
+
+// Writes reported while a reload is in flight, re-applied on top of its result
+let writesDuringLoad: Map<number, string | null> | null = null;
+
 /**
  * Generates a clean URL slug from a business name
  */
@@ -26,6 +47,86 @@ function generateClientUrl(businessName: string, clientId: number): string {
   return `${slug}${clientId}`;
 }
 
+async function loadIndex() {
+  writesDuringLoad = new Map();
+  try {
+    const configs = await storage.getAllWebsiteConfigs();
+    // An empty list is also how a failed query comes back; keep what we have
+    if (configs.length > 0 || clientUrls.size === 0) {
+      clientUrls.clear();
+      configs.forEach(config => clientUrls.set(config.id, generateClientUrl(config.name, config.id)));
+    }
+    writesDuringLoad.forEach((url, id) => url === null ? clientUrls.delete(id) : clientUrls.set(id, url));
+    loadedAt = Date.now();
+  } finally {
+    writesDuringLoad = null;
+  }
+}
+
+async function ensureIndex() {
+  if (loading) {
+    // Only the first load is waited for; later reloads serve the current index
+    if (loadedAt === 0) await loading;
+    return;
+  }
+  if (loadedAt > 0 && Date.now() - loadedAt < INDEX_TTL_MS) return;
+
+  const first = loadedAt === 0;
+  loading = loadIndex()
+    .catch(error => console.error('Error loading client URL index:', error))
+    .finally(() => {
+      loading = null;
+    });
+  if (first) await loading;
+}
+
+/**
+ * Records a client's current URL (call after a config is created or updated)
+ */
+function rememberClientUrl(clientId: number, businessName: string) {
+  const url = generateClientUrl(businessName, clientId);
+  clientUrls.set(clientId, url);
+  unknownClients.delete(clientId);
+  writesDuringLoad?.set(clientId, url);
+}
+
+/**
+ * Drops a client from the index (call after a config is deleted)
+ */
+function forgetClientUrl(clientId: number) {
+  clientUrls.delete(clientId);
+  writesDuringLoad?.set(clientId, null);
+}
+
+/**
+ * Expected clean URL for a client id, or null when there is no such client
+ * Ids missing from the index (created by another process since the last
+ * load, or not clients at all) are looked up once and then remembered.
+ */
+async function resolveClientUrl(clientId: number): Promise<string | null> {
+  await ensureIndex();
+
+  const known = clientUrls.get(clientId);
+  if (known) return known;
+
+  const recheckAt = unknownClients.get(clientId);
+  if (recheckAt !== undefined && recheckAt > Date.now()) return null;
+  unknownClients.delete(clientId);
+
+  const config = await storage.getWebsiteConfig(clientId);
+  if (config) {
+    rememberClientUrl(clientId, config.name);
+    return clientUrls.get(clientId)!;
+  }
+
+  unknownClients.set(clientId, Date.now() + UNKNOWN_TTL_MS);
+  for (const oldest of unknownClients.keys()) {
+    if (unknownClients.size <= UNKNOWN_MAX_ENTRIES) break;
+    unknownClients.delete(oldest);
+  }
+  return null;
+}
+
 /**
  * Parses a client URL to extract the client ID
  */
@@ -73,16 +174,14 @@ async function clientUrlMiddleware(req: Request, res: Response, next: NextFuncti
   }
 
   try {
-    // Validate that the client exists
-    const config = await storage.getWebsiteConfig(clientId);
+    // Validate that the client exists (from memory in the common case)
+    const expectedUrl = await resolveClientUrl(clientId);
     
-    if (!config) {
+    if (!expectedUrl) {
       return next(); // Client doesn't exist, let normal 404 handle it
     }
 
     // Validate that the URL slug matches the business name
-    const expectedUrl = generateClientUrl(config.name, clientId);
-    
     if (urlSlug !== expectedUrl) {
       // Redirect to correct URL
       return res.redirect(301, `/${expectedUrl}`);
@@ -171,6 +270,9 @@ export {
   generateClientSlug,
   generateClientUrl,
   parseClientUrl,
+  resolveClientUrl,
+  rememberClientUrl,
+  forgetClientUrl,
   clientUrlMiddleware,
   registerClientUrlRoutes
 };
\ No newline at end of file
@@ -0,0 +1,233 @@
+/**
+ * Response compression shared by the dev/production servers and the build
+ * Generated sites and built client assets get .br/.gz siblings at build time
+ * (maximum quality, paid once) and are served by negotiating Accept-Encoding;
+ * bodies sent repeatedly from memory are compressed once and memoized; dynamic
+ * JSON/HTML above a size threshold is compressed on the fly at a fast level.
+ * Plain ESM so the standalone JS servers can import it as well.
+ */
+
+import express from 'express';
+import fs from 'fs';
+import fsp from 'fs/promises';
+import path from 'path';
+import { promisify } from 'util';
+import zlib from 'zlib';
+
+const brotliCompress = promisify(zlib.brotliCompress);
+const gzipCompress = promisify(zlib.gzip);
+
+/** Content worth compressing, by file extension */
+export const COMPRESSIBLE_FILE = /\.(html?|css|m?js|json|map|svg|txt|xml|webmanifest)$/i;
+
+/** Content worth compressing, by Content-Type */
+const COMPRESSIBLE_TYPE = /^(text\/|application\/(json|javascript|xml)|image\/svg\+xml)/i;
+
+/** Dynamic bodies smaller than this go out uncompressed (COMPRESS_THRESHOLD_BYTES) */
+export const COMPRESS_THRESHOLD = parseInt(process.env.COMPRESS_THRESHOLD_BYTES || '', 10) || 1024;
+
+const SUFFIX = { br: '.br', gzip: '.gz' };
+
+/**
+ * Preferred encoding the client accepts: 'br', 'gzip' or null
+ * Honours q-values (q=0 refuses) and *; brotli wins ties since it is smaller.
+ * @param {string | undefined} acceptEncoding
+ * @returns {'br' | 'gzip' | null}
+ */
+export function negotiateEncoding(acceptEncoding) {
+  if (!acceptEncoding) return null;
+  const q = { br: undefined, gzip: undefined };
+  let wildcard;
+  for (const part of acceptEncoding.split(',')) {
+    const [token, ...params] = part.trim().toLowerCase().split(';');
+    const qParam = params.map(p => p.trim()).find(p => p.startsWith('q='));
+    const value = qParam ? parseFloat(qParam.slice(2)) : 1;
+    const weight = Number.isNaN(value) ? 0 : value;
+    if (token === 'br' || token === 'gzip') q[token] = weight;
+    else if (token === 'x-gzip' && q.gzip === undefined) q.gzip = weight;
+    else if (token === '*') wildcard = weight;
+  }
+  const br = q.br ?? wildcard ?? 0;
+  const gzip = q.gzip ?? wildcard ?? 0;
+  if (br <= 0 && gzip <= 0) return null;
+  return br >= gzip ? 'br' : 'gzip';
+}
+
+/**
+ * Compresses a body; 'static' is for output compressed once and served many
+ * times, 'dynamic' for per-response compression where latency matters
+ * @param {Buffer | string} body
+ * @param {'br' | 'gzip'} encoding
+ * @param {'static' | 'dynamic'} [mode]
+ * @returns {Promise<Buffer>}
+ */
+export function compress(body, encoding, mode = 'dynamic') {
+  if (encoding === 'br') {
+    return brotliCompress(body, {
+      params: {
+        [zlib.constants.BROTLI_PARAM_MODE]: zlib.constants.BROTLI_MODE_TEXT,
+        [zlib.constants.BROTLI_PARAM_QUALITY]: mode === 'static' ? zlib.constants.BROTLI_MAX_QUALITY : 5,
+        [zlib.constants.BROTLI_PARAM_SIZE_HINT]: Buffer.byteLength(body)
+      }
+    });
+  }
+  return gzipCompress(body, { level: mode === 'static' ? zlib.constants.Z_BEST_COMPRESSION : 6 });
+}
+
+/**
+ * Brotli and gzip copies of a body, for writing next to a static file;
+ * an encoding is left out when it doesn't make the body smaller
+ * @param {Buffer | string} body
+ * @returns {Promise<{ br?: Buffer, gzip?: Buffer }>}
+ */
+export async function precompress(body) {
+  const size = Buffer.byteLength(body);
+  const [br, gzip] = await Promise.all([compress(body, 'br', 'static'), compress(body, 'gzip', 'static')]);
+  return {
+    ...(br.length < size ? { br } : {}),
+    ...(gzip.length < size ? { gzip } : {})
+  };
+}
+
+/**
+ * Path of the precompressed sibling of a file (index.html -> index.html.br)
+ * @param {string} filePath
+ * @param {'br' | 'gzip'} encoding
+ */
+export function encodedPath(filePath, encoding) {
+  return filePath + SUFFIX[encoding];
+}
+
+/**
+ * Writes .br/.gz siblings for every compressible file under a directory
+ * (the built client in dist/public); returns the number of files compressed
+ * @param {string} dir
+ * @param {number} [minBytes] Files smaller than this are left alone
+ */
+export async function precompressDirectory(dir, minBytes = COMPRESS_THRESHOLD) {
+  let count = 0;
+  for (const entry of await fsp.readdir(dir, { withFileTypes: true })) {
+    const file = path.join(dir, entry.name);
+    if (entry.isDirectory()) {
+      count += await precompressDirectory(file, minBytes);
+      continue;
+    }
+    if (!entry.isFile() || !COMPRESSIBLE_FILE.test(entry.name)) continue;
+    const body = await fsp.readFile(file);
+    if (body.length < minBytes) continue;
+    const encoded = await precompress(body);
+    for (const encoding of Object.keys(encoded)) {
+      await fsp.writeFile(encodedPath(file, encoding), encoded[encoding]);
+    }
+    count += 1;
+  }
+  return count;
+}
+
+/**
+ * express.static that prefers a .br/.gz sibling the client can accept
+ * Returns [negotiation, express.static(root, options)] for app.use; files
+ * without a sibling (or clients that accept neither) get the original.
+ * @param {string} root
+ * @param {object} [options] Passed to express.static
+ */
+export function precompressedStatic(root, options = {}) {
+  const base = path.resolve(root);
+
+  const negotiate = (req, res, next) => {
+    if (req.method !== 'GET' && req.method !== 'HEAD') return next();
+
+    const queryAt = req.url.indexOf('?');
+    let urlPath = queryAt === -1 ? req.url : req.url.slice(0, queryAt);
+    if (urlPath.endsWith('/')) urlPath += 'index.html';
+    let filePath;
+    try {
+      filePath = path.join(base, decodeURIComponent(urlPath));
+    } catch {
+      return next();
+    }
+    if (!filePath.startsWith(base + path.sep) || !COMPRESSIBLE_FILE.test(filePath)) return next();
+
+    res.vary('Accept-Encoding');
+    const encoding = negotiateEncoding(req.headers['accept-encoding']);
+    if (!encoding) return next();
+
+    fs.stat(encodedPath(filePath, encoding), (error, stat) => {
+      if (error || !stat.isFile()) return next();
+      // send() keeps a Content-Type that is already set, so the sibling is
+      // labelled as the original file rather than as .br/.gz
+      res.type(path.extname(filePath));
+      res.setHeader('Content-Encoding', encoding);
+      req.url = encodedPath(urlPath, encoding) + (queryAt === -1 ? '' : req.url.slice(queryAt));
+      next();
+    });
+  };
+
+  return [negotiate, express.static(base, options)];
+}
+
+/**
+ * Compressed copy of a body that is sent many times from memory (rendered
+ * pages, shared site assets): compressed at static quality on first use and
+ * memoized on the holder
+ * @param {{ body: Buffer, encoded?: Record<string, Promise<Buffer>> }} holder
+ * @param {'br' | 'gzip'} encoding
+ * @returns {Promise<Buffer>}
+ */
+export function encodedBody(holder, encoding) {
+  holder.encoded ??= {};
+  holder.encoded[encoding] ??= compress(holder.body, encoding, 'static');
+  return holder.encoded[encoding];
+}
+
+/**
+ * Middleware compressing dynamic responses (JSON, HTML, text) on the fly once
+ * they reach the threshold; responses that already carry a Content-Encoding
+ * (precompressed files and pages) pass through untouched
+ * @param {{ threshold?: number }} [options]
+ */
+export function compressResponses({ threshold = COMPRESS_THRESHOLD } = {}) {
+  return (req, res, next) => {
+    const encoding = negotiateEncoding(req.headers['accept-encoding']);
+    const originalSend = res.send;
+
+    res.send = function (body) {
+      // Objects come back through here as a JSON string via res.json
+      if (typeof body !== 'string' && !Buffer.isBuffer(body)) {
+        return originalSend.call(this, body);
+      }
+      if (typeof body === 'string') {
+        // What res.send would do for a string, since it is sent as a Buffer below
+        if (!this.get('Content-Type')) this.type('html');
+        if (!/charset=/i.test(this.get('Content-Type'))) this.set('Content-Type', `${this.get('Content-Type')}; charset=utf-8`);
+      }
+
+      const size = Buffer.byteLength(body);
+      const type = this.get('Content-Type') || '';
+      if (size < threshold || !COMPRESSIBLE_TYPE.test(type) || this.get('Content-Encoding') ||
+          this.statusCode === 204 || this.statusCode === 304) {
+        return originalSend.call(this, body);
+      }
+      this.vary('Accept-Encoding');
+      if (!encoding || req.method === 'HEAD' || /no-transform/.test(this.get('Cache-Control') || '')) {
+        return originalSend.call(this, body);
+      }
+
+      compress(body, encoding, 'dynamic').then(encoded => {
+        if (this.headersSent) return;
+        this.setHeader('Content-Encoding', encoding);
+        // Each coding is its own representation, so a strong ETag gets a suffix
+        // (the form render-cache.ts's etagMatches accepts back)
+        const etag = this.get('ETag');
+        if (etag && etag.startsWith('"')) this.setHeader('ETag', `${etag.slice(0, -1)}-${encoding}"`);
+        originalSend.call(this, encoded);
+      }, error => {
+        console.warn('Response compression failed:', error);
+        if (!this.headersSent) originalSend.call(this, body);
+      });
+      return this;
+    };
+
+    next();
+  };
+}
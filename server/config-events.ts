@@ -0,0 +1,22 @@
+/**
+ * Single place the routes report website config writes and deletions to
+ * Keeps in-memory views of website_configs (the client URL index) in step
+ * with the database; the storage cache invalidates itself.
+ */
+
+import { forgetClientUrl, rememberClientUrl } from "./client-urls";
+
+/**
+ * Call after a website config has been created or updated
+ */
+export function configSaved(config: { id: number; name: string } | null | undefined) {
+  if (!config) return;
+  rememberClientUrl(config.id, config.name);
+}
+
+/**
+ * Call after a website config has been deleted
+ */
+export function configDeleted(id: number) {
+  forgetClientUrl(id);
+}
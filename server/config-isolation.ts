@@ -18,6 +18,21 @@ export const ISOLATION_RULES: ConfigIsolationRules = {
   homepageConfigName: 'WebSitioPro Homepage'
 };
 
+// Template demo pages, each backed by a config named `${demoId} Configuration`
+export const DEMO_CONFIG_IDS = [
+  'professionals-demo',
+  'tourism-demo',
+  'retail-demo',
+  'services-demo',
+  'restaurants-demo'
+] as const;
+
+export type DemoConfigId = typeof DEMO_CONFIG_IDS[number];
+
+export function isDemoConfigId(requestedId: string): requestedId is DemoConfigId {
+  return (DEMO_CONFIG_IDS as readonly string[]).includes(requestedId);
+}
+
 /**
  * Validates if a configuration ID is safe to modify
  */
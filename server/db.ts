@@ -1,28 +1,87 @@
-import { Pool, neonConfig } from '@neondatabase/serverless';
-import { drizzle } from 'drizzle-orm/neon-serverless';
+/**
+ * Database connections for DatabaseStorage
+ * STORAGE_DRIVER picks the driver:
+ *   neon-http (default)  one HTTPS request per query, nothing to pool
+ *   neon-pool            @neondatabase/serverless Pool over WebSockets
+ *   pg                   node-postgres Pool, e.g. a local Postgres in tests
+ * The pooled drivers keep DB_POOL_SIZE connections (default 10) and honour
+ * DB_IDLE_TIMEOUT_MS and DB_CONNECTION_TIMEOUT_MS.
+ */
+
+import { neon, neonConfig, Pool as NeonPool } from '@neondatabase/serverless';
+import { drizzle as drizzleNeonHttp } from 'drizzle-orm/neon-http';
+import { drizzle as drizzleNeonPool } from 'drizzle-orm/neon-serverless';
+import { drizzle as drizzleNodePg } from 'drizzle-orm/node-postgres';
+import type { PgDatabase } from 'drizzle-orm/pg-core';
+import pg from 'pg';
 import ws from "ws";
-import * as schema from "@shared/schema";
 
 neonConfig.webSocketConstructor = ws;
 
-if (!process.env.DATABASE_URL) {
-  throw new Error(
-    "DATABASE_URL must be set. Did you forget to provision a database?",
-  );
+export type StorageDriver = 'neon-http' | 'neon-pool' | 'pg';
+
+export const STORAGE_DRIVERS: StorageDriver[] = ['neon-http', 'neon-pool', 'pg'];
+
+export interface DatabaseConnection {
+  driver: StorageDriver;
+  db: PgDatabase<any, any>;
+  // True when queries can share a connection in an interactive transaction
+  pooled: boolean;
+  close(): Promise<void>;
+}
+
+const envInt = (name: string, fallback: number) => parseInt(process.env[name] || '', 10) || fallback;
+
+function poolOptions(connectionString: string) {
+  return {
+    connectionString,
+    max: envInt('DB_POOL_SIZE', 10),
+    idleTimeoutMillis: envInt('DB_IDLE_TIMEOUT_MS', 30000),
+    connectionTimeoutMillis: envInt('DB_CONNECTION_TIMEOUT_MS', 10000)
+  };
 }
 
-export const pool = new Pool({ 
-  connectionString: process.env.DATABASE_URL,
-  max: 10,
-  idleTimeoutMillis: 30000,
-  connectionTimeoutMillis: 10000,
-  keepAlive: true,
-  keepAliveInitialDelayMillis: 10000
-});
-
-// Add error handling for pool connections
-pool.on('error', (err) => {
-  console.error('Database pool error:', err);
-});
-
-export const db = drizzle({ client: pool, schema });
\ No newline at end of file
+/**
+ * Opens the configured driver against DATABASE_URL (or the given URL)
+ */
+export function connectDatabase(
+  databaseUrl: string | undefined = process.env.DATABASE_URL,
+  driver: string = process.env.STORAGE_DRIVER || 'neon-http'
+): DatabaseConnection {
+  if (!databaseUrl) throw new Error('DATABASE_URL is not set');
+
+  switch (driver) {
+    case 'neon-http':
+      return {
+        driver,
+        db: drizzleNeonHttp(neon(databaseUrl)),
+        pooled: false,
+        close: async () => {}
+      };
+
+    case 'neon-pool': {
+      const pool = new NeonPool(poolOptions(databaseUrl));
+      pool.on('error', error => console.error('Database pool error:', error));
+      return {
+        driver,
+        db: drizzleNeonPool({ client: pool }),
+        pooled: true,
+        close: () => pool.end()
+      };
+    }
+
+    case 'pg': {
+      const pool = new pg.Pool({ ...poolOptions(databaseUrl), keepAlive: true });
+      pool.on('error', error => console.error('Database pool error:', error));
+      return {
+        driver,
+        db: drizzleNodePg({ client: pool }),
+        pooled: true,
+        close: () => pool.end()
+      };
+    }
+
+    default:
+      throw new Error(`Unknown STORAGE_DRIVER "${driver}" (expected ${STORAGE_DRIVERS.join(', ')})`);
+  }
+}
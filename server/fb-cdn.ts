@@ -0,0 +1,129 @@
+/**
+ * Facebook CDN URL expiry analysis and liveness probing
+ * Signed scontent-*.fbcdn.net URLs carry their expiry as a hex unix timestamp
+ * in the `oe` query parameter. Decoding it lets the generator pick a fallback
+ * image at render time instead of waiting for the image to fail in the
+ * visitor's browser. Mirrors websitio/fbcdn.py.
+ */
+
+export type CdnStatus = "valid" | "expiring" | "expired" | "unsigned" | "not-facebook";
+
+export interface CdnClassification {
+  status: CdnStatus;
+  expiresAt: Date | null;
+}
+
+// URLs that expire within this window are treated as already unusable for
+// pages that will be viewed later
+const DEFAULT_MARGIN_MS = parseInt(process.env.FB_CDN_EXPIRY_MARGIN_MS || '', 10) || 60 * 60 * 1000;
+const PROBE_TTL_MS = 10 * 60 * 1000;
+const PROBE_TIMEOUT_MS = 3000;
+const PROBE_CACHE_LIMIT = 5000;
+
+export function isFacebookCdnUrl(url: string): boolean {
+  return !!url && (url.includes('scontent') || url.includes('fbcdn.net'));
+}
+
+/**
+ * Expiry encoded in the `oe` parameter, or null when absent/unparseable
+ */
+export function decodeFacebookCdnExpiry(url: string): Date | null {
+  try {
+    const oe = new URL(url).searchParams.get('oe');
+    if (!oe || !/^[0-9a-fA-F]+$/.test(oe)) return null;
+    return new Date(parseInt(oe, 16) * 1000);
+  } catch {
+    return null;
+  }
+}
+
+export function classifyFacebookCdnUrl(
+  url: string,
+  now: number = Date.now(),
+  marginMs: number = DEFAULT_MARGIN_MS
+): CdnClassification {
+  if (!isFacebookCdnUrl(url)) return { status: "not-facebook", expiresAt: null };
+
+  const expiresAt = decodeFacebookCdnExpiry(url);
+  if (!expiresAt) return { status: "unsigned", expiresAt: null };
+
+  const remaining = expiresAt.getTime() - now;
+  if (remaining <= 0) return { status: "expired", expiresAt };
+  if (remaining <= marginMs) return { status: "expiring", expiresAt };
+  return { status: "valid", expiresAt };
+}
+
+interface ProbeResult {
+  alive: boolean;
+  checkedAt: number;
+}
+
+// Insertion-ordered, so the oldest entry is evicted first
+const probeCache = new Map<string, ProbeResult>();
+const probesInFlight = new Map<string, Promise<boolean>>();
+
+/**
+ * Cached liveness of a URL, or undefined when it has not been probed recently
+ */
+export function getCachedProbe(url: string): boolean | undefined {
+  const cached = probeCache.get(url);
+  if (!cached || Date.now() - cached.checkedAt > PROBE_TTL_MS) return undefined;
+  return cached.alive;
+}
+
+async function probeOne(url: string): Promise<boolean> {
+  const controller = new AbortController();
+  const timer = setTimeout(() => controller.abort(), PROBE_TIMEOUT_MS);
+  try {
+    const response = await fetch(url, { method: 'HEAD', signal: controller.signal });
+    return response.ok;
+  } catch {
+    return false;
+  } finally {
+    clearTimeout(timer);
+  }
+}
+
+/**
+ * HEAD-probes URLs concurrently, sharing in-flight probes and caching results
+ */
+export async function probeFacebookCdnUrls(urls: string[], concurrency: number = 8): Promise<Map<string, boolean>> {
+  const results = new Map<string, boolean>();
+  const pending = Array.from(new Set(urls)).filter(url => {
+    const cached = getCachedProbe(url);
+    if (cached !== undefined) results.set(url, cached);
+    return cached === undefined;
+  });
+
+  async function worker() {
+    while (pending.length > 0) {
+      const url = pending.shift()!;
+      let probe = probesInFlight.get(url);
+      if (!probe) {
+        probe = probeOne(url);
+        probesInFlight.set(url, probe);
+      }
+      const alive = await probe;
+      probesInFlight.delete(url);
+      probeCache.delete(url);
+      probeCache.set(url, { alive, checkedAt: Date.now() });
+      if (probeCache.size > PROBE_CACHE_LIMIT) {
+        probeCache.delete(probeCache.keys().next().value as string);
+      }
+      results.set(url, alive);
+    }
+  }
+
+  await Promise.all(Array.from({ length: Math.min(concurrency, pending.length) }, worker));
+  return results;
+}
+
+/**
+ * Render-time decision: can this URL be put in the page as-is?
+ * Uses the oe expiry and any cached probe result, never the network.
+ */
+export function isUsableFacebookCdnUrl(url: string): boolean {
+  const { status } = classifyFacebookCdnUrl(url);
+  if (status !== "valid") return false;
+  return getCachedProbe(url) !== false;
+}
@@ -1,17 +1,26 @@
 import express, { type Request, Response, NextFunction } from "express";
 import { registerRoutes } from "./routes";
 import { setupVite, log } from "./vite";
+import { createTrafficCapture } from "./traffic-capture";
+import { requestLogger } from "./logger";
+import { compressResponses, precompressedStatic } from "./compression";
 import path from "path";
 const app = express();
 
 // Enable trust proxy for proper IP handling behind Replit's proxy
 app.set('trust proxy', true);
 
+// No automatic weak ETags: a 304 is only ever answered for the versioned
+// ETags routes set themselves (configs, rendered pages, site assets), so a
+// fallback or error body can never be revalidated as if it were a config
+app.set('etag', false);
+
 // Add CORS headers for external access
 app.use((req, res, next) => {
   res.header('Access-Control-Allow-Origin', '*');
   res.header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS');
-  res.header('Access-Control-Allow-Headers', 'Origin, X-Requested-With, Content-Type, Accept, Authorization');
+  res.header('Access-Control-Allow-Headers', 'Origin, X-Requested-With, Content-Type, Accept, Authorization, If-None-Match');
+  res.header('Access-Control-Expose-Headers', 'ETag');
   
   if (req.method === 'OPTIONS') {
     res.sendStatus(200);
@@ -23,35 +32,17 @@ app.use((req, res, next) => {
 app.use(express.json());
 app.use(express.urlencoded({ extended: false }));
 
-app.use((req, res, next) => {
-  const start = Date.now();
-  const path = req.path;
-  let capturedJsonResponse: Record<string, any> | undefined = undefined;
-
-  const originalResJson = res.json;
-  res.json = function (bodyJson, ...args) {
-    capturedJsonResponse = bodyJson;
-    return originalResJson.apply(res, [bodyJson, ...args]);
-  };
-
-  res.on("finish", () => {
-    const duration = Date.now() - start;
-    if (path.startsWith("/api")) {
-      let logLine = `${req.method} ${path} ${res.statusCode} in ${duration}ms`;
-      if (capturedJsonResponse) {
-        logLine += ` :: ${JSON.stringify(capturedJsonResponse)}`;
-      }
+// Compress JSON and HTML responses above COMPRESS_THRESHOLD_BYTES
+app.use(compressResponses());
 
-      if (logLine.length > 80) {
-        logLine = logLine.slice(0, 79) + "…";
-      }
-
-      log(logLine);
-    }
-  });
+// Record webhook traffic for replay when TRAFFIC_CAPTURE_FILE is set
+const trafficCapture = createTrafficCapture();
+if (trafficCapture) {
+  app.use(trafficCapture);
+}
 
-  next();
-});
+// One structured line per /api request; see logger.ts for levels and sampling
+app.use(requestLogger());
 
 (async () => {
   // Add explicit health endpoint BEFORE other routes
@@ -81,7 +72,8 @@ app.use((req, res, next) => {
 app.get("/favicon.ico", (req, res) => res.status(204).end());
   // Setup based on environment
   if (process.env.NODE_ENV === "production") {
-  app.use(express.static(path.join(__dirname, "../dist/public")));
+  // Built client assets, with the .br/.gz siblings written at build time
+  app.use(precompressedStatic(path.join(__dirname, "../dist/public")));
   app.get("*", (req, res) => {
     res.setHeader("Content-Type", "text/html");
     res.sendFile(path.join(__dirname, "../dist/public", "index.html"));
@@ -0,0 +1,271 @@
+/**
+ * Structured, buffered logging for the API server
+ * Entries below LOG_LEVEL (default info) cost one comparison: fields are only
+ * formatted for entries that are written, and values such as request or
+ * response bodies are previewed by a bounded walk that stops after
+ * LOG_BODY_CHARS characters, so a large body is never serialized in full.
+ * Lines are collected and written to stdout in one chunk per event-loop turn
+ * (or once LOG_BUFFER_BYTES is reached) instead of one write per line.
+ *
+ * requestLogger() logs one line per /api request:
+ *   LOG_ROUTE_LEVELS   per-path minimum level by prefix, e.g.
+ *                      "/api/templates=warn,/api/agent/whatsapp-logs=silent"
+ *   LOG_SAMPLE_RATE    share of successful requests logged (default 1);
+ *                      4xx and 5xx responses are always logged
+ * LOG_FORMAT=json writes one JSON object per line (default in production);
+ * otherwise lines keep the "time [source] message" shape of vite.ts's log().
+ */
+
+import type { Request, Response, NextFunction } from "express";
+import fs from "fs";
+
+export type LogLevel = "debug" | "info" | "warn" | "error";
+type Threshold = LogLevel | "silent";
+
+export type LogFields = Record<string, unknown>;
+
+export interface Logger {
+  debug(message: string, fields?: LogFields): void;
+  info(message: string, fields?: LogFields): void;
+  warn(message: string, fields?: LogFields): void;
+  error(message: string, fields?: LogFields): void;
+  enabled(level: LogLevel): boolean;
+  child(source: string): Logger;
+}
+
+const LEVELS: Record<Threshold, number> = { debug: 10, info: 20, warn: 30, error: 40, silent: 100 };
+
+const parseThreshold = (value: string | undefined, fallback: Threshold): Threshold =>
+  value && value in LEVELS ? value as Threshold : fallback;
+
+const MIN_LEVEL = LEVELS[parseThreshold(process.env.LOG_LEVEL, "info")];
+const JSON_FORMAT = (process.env.LOG_FORMAT || (process.env.NODE_ENV === "production" ? "json" : "pretty")) === "json";
+const BODY_CHARS = parseInt(process.env.LOG_BODY_CHARS || "", 10) || 80;
+const BUFFER_BYTES = parseInt(process.env.LOG_BUFFER_BYTES || "", 10) || 64 * 1024;
+const SAMPLE_RATE = Math.min(Math.max(parseFloat(process.env.LOG_SAMPLE_RATE ?? "1") || 0, 0), 1);
+
+// Prefix -> level, longest prefix first so the most specific route wins
+const ROUTE_LEVELS: [string, Threshold][] = (process.env.LOG_ROUTE_LEVELS || "")
+  .split(",")
+  .map(rule => rule.trim().split("="))
+  .filter(([prefix, level]) => prefix && level in LEVELS)
+  .map(([prefix, level]): [string, Threshold] => [prefix, level as Threshold])
+  .sort((a, b) => b[0].length - a[0].length);
+
+const MAX_DEPTH = 4;
+
+// Thrown by the preview walk once it has produced enough characters
+const FULL = Symbol("full");
+
+/**
+ * JSON-like rendering of a value, cut at maxChars
+ * Walks only as much of the value as fits, so the cost is bounded by maxChars
+ * rather than by the size of the value.
+ */
+export function preview(value: unknown, maxChars = BODY_CHARS): string {
+  let out = "";
+  const seen = new WeakSet<object>();
+
+  const write = (text: string) => {
+    if (out.length + text.length > maxChars) {
+      out += text.slice(0, maxChars - out.length);
+      throw FULL;
+    }
+    out += text;
+  };
+
+  const walk = (item: unknown, depth: number) => {
+    if (typeof item === "string") {
+      // Escape no more of a long string than can be shown
+      write(JSON.stringify(item.length > maxChars ? item.slice(0, maxChars) : item));
+      return;
+    }
+    if (item === null || typeof item !== "object") {
+      write(item === undefined ? "undefined" : typeof item === "bigint" ? `${item}n` : String(item));
+      return;
+    }
+    if (item instanceof Date) {
+      write(isNaN(item.getTime()) ? "Invalid Date" : item.toISOString());
+      return;
+    }
+    if (Buffer.isBuffer(item)) {
+      write(`<Buffer ${item.length} bytes>`);
+      return;
+    }
+    if (item instanceof Error) {
+      write(`${item.name}: ${item.message}`);
+      return;
+    }
+    if (seen.has(item)) {
+      write("[Circular]");
+      return;
+    }
+    if (depth >= MAX_DEPTH) {
+      write(Array.isArray(item) ? "[…]" : "{…}");
+      return;
+    }
+    seen.add(item);
+
+    if (Array.isArray(item)) {
+      write("[");
+      for (let i = 0; i < item.length; i++) {
+        if (i > 0) write(",");
+        walk(item[i], depth + 1);
+      }
+      write("]");
+    } else {
+      write("{");
+      let first = true;
+      for (const key in item) {
+        if (!Object.prototype.hasOwnProperty.call(item, key)) continue;
+        const field = (item as Record<string, unknown>)[key];
+        if (field === undefined || typeof field === "function") continue;
+        if (!first) write(",");
+        first = false;
+        write(`${JSON.stringify(key)}:`);
+        walk(field, depth + 1);
+      }
+      write("}");
+    }
+    seen.delete(item);
+  };
+
+  try {
+    walk(value, 0);
+    return out;
+  } catch (error) {
+    if (error !== FULL) throw error;
+    return out.slice(0, Math.max(maxChars - 1, 0)) + "…";
+  }
+}
+
+// Lines waiting for the next flush
+let buffer: string[] = [];
+let bufferedBytes = 0;
+let flushScheduled = false;
+
+/**
+ * Writes buffered lines now (the logger does this on its own; for scripts
+ * that exit straight after logging)
+ */
+export function flushLogs() {
+  flushScheduled = false;
+  if (buffer.length === 0) return;
+  const chunk = buffer.join("\n") + "\n";
+  buffer = [];
+  bufferedBytes = 0;
+  process.stdout.write(chunk);
+}
+
+process.on("exit", () => {
+  // stdout writes are asynchronous on pipes; exit won't wait for them
+  if (buffer.length > 0) fs.writeSync(1, buffer.join("\n") + "\n");
+});
+
+function emit(line: string) {
+  buffer.push(line);
+  bufferedBytes += line.length + 1;
+  if (bufferedBytes >= BUFFER_BYTES) {
+    flushLogs();
+  } else if (!flushScheduled) {
+    flushScheduled = true;
+    setImmediate(flushLogs);
+  }
+}
+
+function timeOfDay(date: Date) {
+  return date.toLocaleTimeString("en-US", {
+    hour: "numeric",
+    minute: "2-digit",
+    second: "2-digit",
+    hour12: true,
+  });
+}
+
+function format(level: LogLevel, source: string, message: string, fields?: LogFields) {
+  const now = new Date();
+  if (JSON_FORMAT) {
+    const entry: Record<string, unknown> = { time: now.toISOString(), level, source, msg: message };
+    if (fields) {
+      for (const key in fields) {
+        const value = fields[key];
+        // Scalars go out as they are; anything structured as a bounded preview
+        entry[key] = value === null || typeof value !== "object" || value instanceof Date ? value : preview(value);
+      }
+    }
+    return JSON.stringify(entry);
+  }
+
+  let line = `${timeOfDay(now)} [${source}] ${level === "info" ? "" : `${level.toUpperCase()} `}${message}`;
+  if (fields) {
+    for (const key in fields) {
+      const value = fields[key];
+      line += ` ${key}=${typeof value === "string" && !/\s/.test(value) ? value : preview(value)}`;
+    }
+  }
+  return line;
+}
+
+function write(level: LogLevel, source: string, message: string, fields?: LogFields) {
+  emit(format(level, source, message, fields));
+}
+
+export function createLogger(source: string): Logger {
+  const at = (level: LogLevel) => (message: string, fields?: LogFields) => {
+    if (LEVELS[level] >= MIN_LEVEL) write(level, source, message, fields);
+  };
+  return {
+    debug: at("debug"),
+    info: at("info"),
+    warn: at("warn"),
+    error: at("error"),
+    enabled: level => LEVELS[level] >= MIN_LEVEL,
+    child: name => createLogger(name),
+  };
+}
+
+export const logger = createLogger("express");
+
+function routeThreshold(path: string): number {
+  for (const [prefix, level] of ROUTE_LEVELS) {
+    if (path.startsWith(prefix)) return Math.max(LEVELS[level], MIN_LEVEL);
+  }
+  return MIN_LEVEL;
+}
+
+/**
+ * One log line per /api request: method, path, status, duration and a
+ * preview of the JSON response. The response body is only held by
+ * reference until the request finishes, and is previewed only if the line
+ * is written.
+ */
+export function requestLogger(pathPrefix = "/api") {
+  return (req: Request, res: Response, next: NextFunction) => {
+    const path = req.path;
+    if (!path.startsWith(pathPrefix)) return next();
+
+    const threshold = routeThreshold(path);
+    if (threshold >= LEVELS.silent) return next();
+
+    const start = Date.now();
+    let body: unknown;
+
+    const originalResJson = res.json;
+    res.json = function (bodyJson, ...args) {
+      body = bodyJson;
+      return originalResJson.apply(res, [bodyJson, ...args]);
+    };
+
+    res.on("finish", () => {
+      const level: LogLevel = res.statusCode >= 500 ? "error" : res.statusCode >= 400 ? "warn" : "info";
+      if (LEVELS[level] < threshold) return;
+      if (level === "info" && SAMPLE_RATE < 1 && Math.random() >= SAMPLE_RATE) return;
+
+      const fields: LogFields = { status: res.statusCode, ms: Date.now() - start };
+      if (body !== undefined) fields.body = body;
+      write(level, "express", `${req.method} ${path}`, fields);
+    });
+
+    next();
+  };
+}
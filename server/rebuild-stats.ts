@@ -0,0 +1,15 @@
+/**
+ * Recounts data/template-stats.json from templates/
+ * Usage: npm run stats:rebuild
+ */
+
+import { rebuildTemplateStats } from "./template-stats";
+
+rebuildTemplateStats()
+  .then(stats => {
+    console.log(`Template stats rebuilt: ${stats.totalTemplates} templates`);
+  })
+  .catch(error => {
+    console.error("Template stats rebuild failed:", error);
+    process.exit(1);
+  });
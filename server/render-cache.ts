@@ -0,0 +1,103 @@
+/**
+ * In-memory cache of rendered preview pages
+ * Pages are keyed by template id and render hash (see renderHash), kept in
+ * least-recently-used order and bounded by total body size. The render hash
+ * doubles as a strong ETag, so a conditional request is answered with a 304
+ * without rendering or reading anything from the cache. Compressed copies of a
+ * page (see encodedBody) live on the cached entry and go with it on eviction;
+ * they are not counted against the size bound.
+ */
+
+import { WebsiteConfig } from '@shared/schema';
+import { generateHTMLBuffer, renderHash, warmFacebookCdnProbes } from './templateGenerator';
+
+export interface RenderedPage {
+  body: Buffer;
+  etag: string;
+  encoded?: Record<string, Promise<Buffer>>;
+}
+
+const MAX_BYTES = parseInt(process.env.RENDER_CACHE_MAX_BYTES || '', 10) || 32 * 1024 * 1024;
+
+// Map iteration order is insertion order; hits are re-inserted to mark them recent
+const pages = new Map<string, RenderedPage>();
+const latestHash = new Map<string, string>();
+let totalBytes = 0;
+
+function evict(cacheKey: string) {
+  const page = pages.get(cacheKey);
+  if (!page) return;
+  pages.delete(cacheKey);
+  totalBytes -= page.body.length;
+}
+
+function store(key: string, hash: string, page: RenderedPage) {
+  // Only the newest render of a template is ever requested again
+  const previous = latestHash.get(key);
+  if (previous && previous !== hash) evict(`${key}:${previous}`);
+  latestHash.set(key, hash);
+
+  if (page.body.length > MAX_BYTES) return;
+  pages.set(`${key}:${hash}`, page);
+  totalBytes += page.body.length;
+  for (const oldest of pages.keys()) {
+    if (totalBytes <= MAX_BYTES) break;
+    evict(oldest);
+  }
+}
+
+/**
+ * Strong ETag for a render of the given config
+ */
+export function renderETag(config: WebsiteConfig): string {
+  return `"${renderHash(config).slice(0, 32)}"`;
+}
+
+/**
+ * ETag for a content-coded copy of a page; each coding is a different
+ * representation, so it needs its own strong ETag
+ */
+export function encodedETag(etag: string, encoding: string | null): string {
+  return encoding ? `${etag.slice(0, -1)}-${encoding}"` : etag;
+}
+
+/**
+ * True when an If-None-Match header lists the given ETag, or any encoded
+ * variant of it (or is *)
+ */
+export function etagMatches(ifNoneMatch: string | undefined, etag: string): boolean {
+  if (!ifNoneMatch) return false;
+  return ifNoneMatch.split(',').some(candidate => {
+    const value = candidate.trim().replace(/^W\//, '').replace(/-(br|gzip)"$/, '"');
+    return value === '*' || value === etag;
+  });
+}
+
+/**
+ * Rendered HTML for a template, from the cache when the inputs are unchanged
+ * @param key Template id (or other stable key) the page belongs to
+ */
+export function getRenderedPage(key: string, config: WebsiteConfig, etag: string = renderETag(config)): RenderedPage {
+  const hash = etag.slice(1, -1);
+  const cacheKey = `${key}:${hash}`;
+  const cached = pages.get(cacheKey);
+  if (cached) {
+    pages.delete(cacheKey);
+    pages.set(cacheKey, cached);
+    return cached;
+  }
+
+  warmFacebookCdnProbes(config);
+  const page = { body: generateHTMLBuffer(config), etag };
+  store(key, hash, page);
+  return page;
+}
+
+/**
+ * Drops cached renders of a template (after it is rewritten or deleted)
+ */
+export function invalidateRenderedPages(key: string) {
+  const hash = latestHash.get(key);
+  if (hash) evict(`${key}:${hash}`);
+  latestHash.delete(key);
+}
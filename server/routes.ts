@@ -1,34 +1,67 @@
-import type { Express, Request, Response } from "express";
+import express, { type Express, type Request, type Response } from "express";
 import { createServer, type Server } from "http";
-import { storage } from "./storage";
+import { CONFIG_SUMMARY_FIELDS, ConfigNameConflictError, storage } from "./storage";
+import { CachedStorage } from "./storage-cache";
 import { z } from "zod";
-import { insertWebsiteConfigSchema } from "@shared/schema";
+import { insertWebsiteConfigSchema, type WebsiteConfig } from "@shared/schema";
 import fs from "fs/promises";
 import path from "path";
 import { generateStaticFiles } from "./templateGenerator";
+import { encodedETag, etagMatches, getRenderedPage, renderETag } from "./render-cache";
+import { encodedBody, negotiateEncoding, precompressedStatic } from "./compression";
+import { registerSiteAssetRoutes } from "./site-assets";
 import { registerAgentRoutes } from "./agent-routes";
 import { 
   validateConfigAccess, 
   createSafeDemoConfig, 
-  filterClientConfigs, 
   logConfigAccess,
-  ISOLATION_RULES 
+  isDemoConfigId,
+  ISOLATION_RULES,
+  type DemoConfigId
 } from "./config-isolation";
 import { 
   clientUrlMiddleware,
   registerClientUrlRoutes
 } from "./client-urls";
 import { sendClientApprovalNotification } from "./sendgrid";
+import { markTemplateRendered, registerTemplateStatusRoutes } from "./template-status";
+import { queryTemplates, type TemplateSortKey } from "./template-index";
+import { templateDeleted, templateSaved } from "./template-events";
+import { configDeleted, configSaved } from "./config-events";
+import { createLogger } from "./logger";
+
+const log = createLogger("routes");
 
 export async function registerRoutes(app: Express): Promise<Server> {
-  // API route for getting all website configurations (for client manager)
-  app.get("/api/configs", async (_req: Request, res: Response) => {
+  // API route for listing client configurations (for client manager), newest first;
+  // homepage and demo configs are filtered out in SQL
+  // Query: templateType, name (substring), fields (comma-separated columns; default
+  // id,name,templateType,createdAt,updatedAt,clientApproval), limit (max 500),
+  // cursor (from the previous page's nextCursor)
+  app.get("/api/configs", async (req: Request, res: Response) => {
     try {
-      const configs = await storage.getAllWebsiteConfigs();
-      // Filter out homepage configuration from client listings using isolation system
-      const clientConfigs = filterClientConfigs(configs);
-      res.json(clientConfigs);
+      const param = (name: string) => typeof req.query[name] === 'string' ? req.query[name] as string : undefined;
+      const fields = param('fields')?.split(',').map(field => field.trim()).filter(Boolean);
+      const cursor = param('cursor');
+
+      const unknownFields = fields?.filter(field => !CONFIG_SUMMARY_FIELDS.includes(field)) || [];
+      if (unknownFields.length > 0) {
+        return res.status(400).json({ error: 'Invalid fields', invalid: unknownFields, allowed: CONFIG_SUMMARY_FIELDS });
+      }
+      if (cursor && !/^\d+$/.test(cursor)) {
+        return res.status(400).json({ error: 'Invalid cursor' });
+      }
+
+      const page = await storage.listWebsiteConfigSummaries({
+        templateType: param('templateType'),
+        name: param('name'),
+        fields,
+        limit: param('limit') ? parseInt(param('limit')!, 10) || undefined : undefined,
+        cursor: cursor ? parseInt(cursor, 10) : undefined
+      });
+      res.json(page);
     } catch (error) {
+      console.error("Error listing website configurations:", error);
       res.status(500).json({ error: "Failed to fetch website configurations" });
     }
   });
@@ -51,25 +84,24 @@ export async function registerRoutes(app: Express): Promise<Server> {
   app.get("/api/config/:id", async (req: Request, res: Response) => {
     try {
       const idParam = req.params.id;
-      console.log(`[DEBUG] Getting config for ID: ${idParam}`);
+      log.debug('Getting config', { id: idParam });
 
-      // Add universal cache prevention for all config requests to prevent stale data
+      // Fallbacks and errors are never stored; stored configs are sent by
+      // sendConfig, which lets clients keep them and revalidate by version
       res.set({
         'Cache-Control': 'no-cache, no-store, must-revalidate, max-age=0',
         'Pragma': 'no-cache',
-        'Expires': '0',
-        'ETag': '', // Disable ETag caching
-        'Last-Modified': ''
+        'Expires': '0'
       });
 
       // Special handling for homepage - bypass isolation system with additional debugging
       if (idParam === "homepage") {
-  console.log(`[DEBUG] Homepage access - bypassing isolation system`);
+  log.debug('Homepage access - bypassing isolation system');
   try {
     const config = await storage.getWebsiteConfig(1);
-    console.log(`[DEBUG] Homepage direct query result:`, config ? 'SUCCESS' : 'NOT FOUND');
+    log.debug('Homepage direct query', { found: !!config });
     if (config) {
-      return res.json(config);
+      return sendConfig(req, res, config);
     }
     // Fallback default config
     const defaultConfig = {
@@ -120,33 +152,17 @@ export async function registerRoutes(app: Express): Promise<Server> {
       let config;
 
       // Handle special demo template IDs
-      if (idParam === "professionals-demo" || idParam === "tourism-demo" || 
-          idParam === "retail-demo" || idParam === "services-demo" || 
-          idParam === "restaurants-demo") {
-
-        // Try to find existing config by name
-        const configs = await storage.getAllWebsiteConfigs();
-        config = configs.find(c => c.name === accessValidation.configName);
-
-        // If demo config doesn't exist, create it with safe defaults
-        if (!config) {
-          const templateType = idParam.replace('-demo', '');
-          const safeDemoConfig = {
-            name: accessValidation.configName,
-            ...createSafeDemoConfig(templateType)
-          };
-          config = await storage.createWebsiteConfig(safeDemoConfig);
-          logConfigAccess('CREATE-DEMO', idParam, true, `Created safe demo config for ${templateType}`);
-        }
+      if (isDemoConfigId(idParam)) {
+        config = await getDemoConfig(idParam, accessValidation.configName);
       } else if (idParam === "homepage" || idParam === "editor-demo") {
         // Direct database access for homepage to bypass storage issues
-        console.log(`[DEBUG] Direct database access for homepage`);
+        log.debug('Direct database access for homepage');
         try {
           config = await storage.getWebsiteConfig(1);
-          console.log(`[DEBUG] Direct access result:`, config ? 'Found' : 'Not found');
+          log.debug('Homepage direct access', { found: !!config });
           
           if (!config) {
-            console.log(`[DEBUG] Homepage not found by ID 1, trying general search`);
+            log.debug('Homepage not found by ID 1, trying general search');
             const configs = await storage.getAllWebsiteConfigs();
             config = configs.find(c => 
               c.name === "Website homepage" ||
@@ -230,6 +246,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
             }
           };
           config = await storage.createWebsiteConfig(defaultConfig);
+          configSaved(config);
         }
       } else {
         // Handle numeric IDs
@@ -244,7 +261,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         return res.status(404).json({ error: "Configuration not found" });
       }
 
-      res.json(config);
+      sendConfig(req, res, config);
     } catch (error) {
       console.error("Route error fetching config:", error);
       res.status(500).json({ error: "Failed to fetch website configuration" });
@@ -267,8 +284,12 @@ export async function registerRoutes(app: Express): Promise<Server> {
       }
 
       const newConfig = await storage.createWebsiteConfig(validationResult.data);
+      configSaved(newConfig);
       res.status(201).json(newConfig);
     } catch (error) {
+      if (error instanceof ConfigNameConflictError) {
+        return res.status(409).json({ error: error.message });
+      }
       res.status(500).json({ error: "Failed to create website configuration" });
     }
   });
@@ -283,12 +304,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       // For homepage editor, bypass isolation system temporarily
       if (isHomepageEditor) {
-        const configs = await storage.getAllWebsiteConfigs();
-        let config = configs.find(c => c.name === 'WebSitioPro Homepage');
+        let config = await storage.getWebsiteConfigByName('WebSitioPro Homepage');
 
         // If homepage config doesn't exist, find by ID 1
         if (!config) {
-          config = configs.find(c => c.id === 1);
+          config = await storage.getWebsiteConfig(1);
         }
 
         if (!config) {
@@ -315,9 +335,13 @@ export async function registerRoutes(app: Express): Promise<Server> {
           if (!updatedConfig) {
             return res.status(404).json({ error: "Configuration not found" });
           }
+          configSaved(updatedConfig);
 
           return res.json(updatedConfig);
         } catch (dbError) {
+          if (dbError instanceof ConfigNameConflictError) {
+            return res.status(409).json({ error: dbError.message });
+          }
           console.error("Database error during homepage update:", dbError);
           return res.status(500).json({ 
             error: "Database connection failed. Please try again.", 
@@ -339,24 +363,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
       let config;
 
       // Handle special demo template IDs
-      if (idParam === "professionals-demo" || idParam === "tourism-demo" || 
-          idParam === "retail-demo" || idParam === "services-demo" || 
-          idParam === "restaurants-demo") {
-
-        // Try to find existing config by name
-        const configs = await storage.getAllWebsiteConfigs();
-        config = configs.find(c => c.name === accessValidation.configName);
-
-        // If demo config doesn't exist, create it with safe defaults
-        if (!config) {
-          const templateType = idParam.replace('-demo', '');
-          const safeDemoConfig = {
-            name: accessValidation.configName,
-            ...createSafeDemoConfig(templateType)
-          };
-          config = await storage.createWebsiteConfig(safeDemoConfig);
-          logConfigAccess('CREATE-DEMO', idParam, true, `Created safe demo config for ${templateType}`);
-        }
+      if (isDemoConfigId(idParam)) {
+        config = await getDemoConfig(idParam, accessValidation.configName);
       } else if (idParam === "homepage" || idParam === "editor-demo") {
         // Homepage access - find existing config
         const configs = await storage.getAllWebsiteConfigs();
@@ -378,8 +386,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         }
       } else if (idParam === "default") {
         // Legacy fallback - redirect to homepage
-        const configs = await storage.getAllWebsiteConfigs();
-        config = configs.find(c => c.name === "homepage Configuration");
+        config = await storage.getWebsiteConfigByName("homepage Configuration");
 
         if (!config) {
           const defaultConfig = {
@@ -391,6 +398,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
             email: 'info@websitiopro.com'
           };
           config = await storage.createWebsiteConfig(defaultConfig);
+          configSaved(config);
         }
       } else {
         // Handle numeric IDs
@@ -420,7 +428,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         });
       }
 
-      console.log(`Updating config ${config.id} with data:`, JSON.stringify(validationResult.data, null, 2));
+      log.debug('Updating config', { id: config.id, data: validationResult.data });
 
       try {
         const updatedConfig = await storage.updateWebsiteConfig(config.id, validationResult.data);
@@ -428,10 +436,14 @@ export async function registerRoutes(app: Express): Promise<Server> {
           console.error(`Configuration with ID ${config.id} not found`);
           return res.status(404).json({ error: "Configuration not found" });
         }
+        configSaved(updatedConfig);
 
-        console.log(`Successfully updated config ${config.id}:`, JSON.stringify(updatedConfig, null, 2));
+        log.info('Updated config', { id: config.id });
         res.json(updatedConfig);
       } catch (dbError) {
+        if (dbError instanceof ConfigNameConflictError) {
+          return res.status(409).json({ error: dbError.message });
+        }
         console.error("Database error during config update:", dbError);
         return res.status(500).json({ 
           error: "Database connection failed. Please try again.", 
@@ -453,6 +465,7 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
     }
 
     await storage.deleteWebsiteConfig(id);
+    configDeleted(id);
     res.status(204).send();
   } catch (error) {
     console.error('Error deleting config:', error);
@@ -460,10 +473,33 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
   }
 });
 
-  // API route for generating static HTML files from the current configuration
+  // API route for generating static HTML files from the current configuration,
+  // a stored configuration (configId) or a saved template (templateId)
   app.post("/api/generate-static", async (req: Request, res: Response) => {
     try {
       const configId = req.body.configId ? parseInt(req.body.configId) : undefined;
+      const templateId = typeof req.body.templateId === 'string' ? req.body.templateId : undefined;
+
+      if (templateId) {
+        if (!/^[A-Za-z0-9_-]+$/.test(templateId)) {
+          return res.status(400).json({ error: "Invalid templateId" });
+        }
+        let templateData;
+        try {
+          const templatePath = path.join(path.resolve(process.cwd(), 'templates'), `${templateId}.json`);
+          templateData = JSON.parse(await fs.readFile(templatePath, { encoding: 'utf-8' }));
+        } catch {
+          return res.status(404).json({ error: "Template not found" });
+        }
+        const outputPath = await generateStaticFiles(templatePreviewConfig(templateId, templateData) as any, templateId);
+        markTemplateRendered(templateId, outputPath);
+        return res.json({
+          success: true,
+          message: "Static files generated successfully",
+          outputPath,
+          url: `/static/${templateId}/index.html`
+        });
+      }
 
       let config;
       if (configId && !isNaN(configId)) {
@@ -505,6 +541,7 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
 
       const templatePath = path.join(templatesDir, `${templateId}.json`);
       await fs.writeFile(templatePath, JSON.stringify(templateData, null, 2));
+      templateSaved(templateId, templateData);
 
       res.json({ success: true, templateId, message: 'Template saved successfully' });
     } catch (error) {
@@ -513,43 +550,37 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
     }
   });
 
-  // API route for getting all templates (for client list)
+  // API route for listing template summaries (for client list)
+  // Query: templateType, location, name (substring), sort=createdAt|name|lastModified,
+  // order=asc|desc, limit (max 500), cursor (from the previous page's nextCursor)
   app.get("/api/templates", async (req: Request, res: Response) => {
     try {
-      const templatesDir = path.resolve(process.cwd(), 'templates');
+      const param = (name: string) => typeof req.query[name] === 'string' ? req.query[name] as string : undefined;
+      const sort = param('sort');
+      const order = param('order');
 
-      // Create templates directory if it doesn't exist
-      try {
-        await fs.mkdir(templatesDir, { recursive: true });
-      } catch (error) {
-        // Directory might already exist, continue
+      if (sort && !['createdAt', 'name', 'lastModified'].includes(sort)) {
+        return res.status(400).json({ error: 'Invalid sort', allowed: ['createdAt', 'name', 'lastModified'] });
       }
-
-      const files = await fs.readdir(templatesDir);
-      const jsonFiles = files.filter(file => file.endsWith('.json'));
-
-      const templates = [];
-      for (const file of jsonFiles) {
-        try {
-          const templatePath = path.join(templatesDir, file);
-          const templateData = JSON.parse(await fs.readFile(templatePath, { encoding: 'utf-8' }));
-          const stats = await fs.stat(templatePath);
-
-          templates.push({
-            templateId: file.replace('.json', ''),
-            ...templateData,
-            lastModified: stats.mtime.toISOString()
-          });
-        } catch (error) {
-          console.error(`Error reading template ${file}:`, error);
-        }
+      if (order && !['asc', 'desc'].includes(order)) {
+        return res.status(400).json({ error: 'Invalid order', allowed: ['asc', 'desc'] });
       }
 
-      // Sort by creation date (newest first)
-      templates.sort((a, b) => new Date(b.createdAt || 0).getTime() - new Date(a.createdAt || 0).getTime());
+      const page = await queryTemplates({
+        templateType: param('templateType'),
+        location: param('location'),
+        name: param('name'),
+        sort: sort as TemplateSortKey | undefined,
+        order: order as 'asc' | 'desc' | undefined,
+        limit: param('limit') ? parseInt(param('limit')!, 10) || undefined : undefined,
+        cursor: param('cursor')
+      });
 
-      res.json(templates);
+      res.json(page);
     } catch (error) {
+      if (error instanceof Error && error.message === 'Invalid cursor') {
+        return res.status(400).json({ error: 'Invalid cursor' });
+      }
       console.error('Error loading templates:', error);
       res.status(500).json({ error: 'Failed to load templates' });
     }
@@ -578,6 +609,7 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
       const templatePath = path.join(templatesDir, `${templateId}.json`);
 
       await fs.unlink(templatePath);
+      templateDeleted(templateId);
       res.json({ success: true, message: 'Template deleted successfully' });
     } catch (error) {
       console.error('Error deleting template:', error);
@@ -650,7 +682,8 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
       };
 
       // Generate static files
-      const outputDir = await generateStaticFiles(config as any);
+      const outputDir = await generateStaticFiles(config as any, templateId);
+      markTemplateRendered(templateId, outputDir);
 
       res.json({ 
         success: true, 
@@ -664,80 +697,27 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
     }
   });
 
-  // Serve generated template preview
+  // Serve generated template preview, rendered in memory and cached by content
   app.get('/templates/:id/preview', async (req, res) => {
     try {
       const templateId = req.params.id;
 
       // Try to load template data first
+      let templateData;
       try {
         const templatesDir = path.resolve(process.cwd(), 'templates');
         const templatePath = path.join(templatesDir, `${templateId}.json`);
-        const templateData = JSON.parse(await fs.readFile(templatePath, { encoding: 'utf-8' }));
-
-        // Convert template data to config and generate fresh HTML
-        const config = {
-          id: parseInt(templateId.split('_')[0]) || 1,
-          name: templateData.businessName || templateData.clientName || 'Template Business',
-          logo: templateData.profileImage || '',
-          defaultLanguage: 'es',
-          showWhyWebsiteButton: true,
-          showDomainButton: true,
-          showChatbot: false,
-          whatsappNumber: templateData.phone || '',
-          whatsappMessage: 'Hello!',
-          facebookUrl: templateData.facebook_url || '',
-          googleMapsEmbed: '',
-          address: templateData.address || '',
-          phone: templateData.phone || '',
-          email: templateData.email || '',
-          profileImage: templateData.profileImage || '',
-          coverImage: templateData.coverImage || '',
-          officeHours: {
-            mondayFriday: {
-              es: '9:00 AM - 6:00 PM',
-              en: '9:00 AM - 6:00 PM'
-            },
-            saturday: {
-              es: '10:00 AM - 2:00 PM',
-              en: '10:00 AM - 2:00 PM'
-            }
-          },
-          analyticsCode: '',
-          primaryColor: '#00A859',
-          secondaryColor: '#C8102E',
-          backgroundColor: '#FFFFFF',
-          translations: {
-            en: {
-              tagline: templateData.businessName || 'Welcome',
-              subtitle: 'Professional services you can trust',
-              aboutText: 'About our business'
-            },
-            es: {
-              tagline: templateData.businessName || 'Bienvenidos',
-              subtitle: 'Servicios profesionales en los que puedes confiar',
-              aboutText: 'Acerca de nuestro negocio'
-            }
-          },
-          heroImage: templateData.coverImage || '',
-          templates: [],
-          chatbotQuestions: []
-        };
-
-        // Generate fresh static files with template data
-        const outputDir = await generateStaticFiles(config as any);
-        const htmlContent = await fs.readFile(path.join(outputDir, 'index.html'), { encoding: 'utf-8' });
-        res.setHeader('Content-Type', 'text/html');
-        res.send(htmlContent);
-
+        templateData = JSON.parse(await fs.readFile(templatePath, { encoding: 'utf-8' }));
       } catch {
         // Fallback to default config if template not found
         const config = await storage.getDefaultWebsiteConfig();
-        const outputDir = await generateStaticFiles(config);
-        const htmlContent = await fs.readFile(path.join(outputDir, 'index.html'), { encoding: 'utf-8' });
-        res.setHeader('Content-Type', 'text/html');
-        res.send(htmlContent);
+        return await sendRenderedPage(req, res, `config-${config.id}`, config);
       }
+
+      // Convert template data to config and render fresh HTML
+      const config = templatePreviewConfig(templateId, templateData);
+      markTemplateRendered(templateId);
+      await sendRenderedPage(req, res, templateId, config as any);
     } catch (error) {
       console.error('Error serving template preview:', error);
       res.status(500).send('Error loading template preview');
@@ -749,17 +729,7 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
     try {
       // Get default config or create a sample professionals config
       const config = await storage.getDefaultWebsiteConfig();
-
-      // Generate the template files
-      const outputDir = await generateStaticFiles(config);
-
-      // Read the generated HTML file
-      const htmlPath = path.join(outputDir, 'index.html');
-      const htmlContent = await fs.readFile(htmlPath, { encoding: 'utf-8' });
-
-      // Serve the HTML content
-      res.setHeader('Content-Type', 'text/html');
-      res.send(htmlContent);
+      await sendRenderedPage(req, res, `config-${config.id}`, config);
     } catch (error) {
       console.error('Error generating professionals template:', error);
       res.status(500).send('Error generating template');
@@ -792,10 +762,10 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
   // Test endpoint for webhook payload validation
   app.post("/api/test", async (req: Request, res: Response) => {
     try {
-      console.log("Test endpoint received payload:", req.body);
+      log.debug('Test endpoint received payload', { body: req.body });
 
       // Log headers for debugging
-      console.log("Test endpoint headers:", req.headers);
+      log.debug('Test endpoint headers', { headers: req.headers });
 
       // Return simple success response
       res.status(200).json({ status: "received" });
@@ -808,7 +778,7 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
   // Notify endpoint for Make.com integration status updates
   app.post("/api/notify", async (req: Request, res: Response) => {
     try {
-      console.log("Notify endpoint received payload:", req.body);
+      log.debug('Notify endpoint received payload', { body: req.body });
 
       const { place_id, status } = req.body;
 
@@ -821,7 +791,7 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
       }
 
       // Log the notification for tracking
-      console.log(`Notification: ${place_id} - ${status}`);
+      log.info('Notification', { place_id, status });
 
       // Return expected response format
       res.status(200).json({
@@ -835,7 +805,20 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
   });
 
   // Register agent routes for Make automation
+  // Hit/miss counters for the website config cache (see storage-cache.ts)
+  app.get("/api/storage/cache-stats", (_req: Request, res: Response) => {
+    res.json(storage instanceof CachedStorage ? { enabled: true, ...storage.stats() } : { enabled: false });
+  });
+
   registerAgentRoutes(app);
+  registerTemplateStatusRoutes(app);
+
+  // Shared runtime CSS/JS linked from every generated page
+  registerSiteAssetRoutes(app);
+
+  // Per-template builds written by generateStaticFiles (dist/static/<templateId>/),
+  // served from their .br/.gz copies when the client accepts them
+  app.use('/static', precompressedStatic(path.resolve(process.cwd(), 'dist/static')));
 
   // Register client URL routes for clean URLs
   registerClientUrlRoutes(app);
@@ -864,7 +847,9 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
 
   app.post("/api/make/auto-create", async (req: Request, res: Response) => {
     try {
-      console.log("Make webhook received data:", req.body);
+      // The payload holds names, phones and addresses; only ids at info
+      log.info('Make webhook received data', { place_id: req.body?.place_id, category: req.body?.category });
+      log.debug('Make webhook payload', { body: req.body });
 
       // Validate required fields
       const { name, address, phone, category, place_id, facebook_url, profileImage, coverImage } = req.body;
@@ -905,6 +890,7 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
         await fs.mkdir(templatesDir, { recursive: true });
         const templatePath = path.join(templatesDir, `${templateId}.json`);
         await fs.writeFile(templatePath, JSON.stringify(templateData, null, 2));
+        templateSaved(templateId, templateData);
       } catch (saveError) {
         console.warn('Template save warning:', saveError);
       }
@@ -974,9 +960,11 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
         });
       }
 
-      console.log(`[EmailJS] Sending approval notification to: ${to_email}`);
-      console.log(`[EmailJS] Client: ${client_name} (${client_email})`);
-      console.log(`[EmailJS] Business: ${business_name} (${template_type})`);
+      log.info('EmailJS approval notification', { to: to_email, templateType: template_type });
+      log.debug('EmailJS approval notification details', {
+        client: `${client_name} (${client_email})`,
+        business: business_name
+      });
 
       // Prepare EmailJS template parameters
       const templateParams = {
@@ -1007,7 +995,7 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
       });
 
       if (emailjsResponse.ok) {
-        console.log('[EmailJS] Email sent successfully');
+        log.info('EmailJS email sent', { to: to_email });
         res.json({ success: true, message: 'Email notification sent successfully' });
       } else {
         const errorText = await emailjsResponse.text();
@@ -1043,9 +1031,11 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
         });
       }
 
-      console.log(`[EMAIL] Sending approval notification to: ${notificationEmail}`);
-      console.log(`[EMAIL] Client: ${clientName} (${clientEmail})`);
-      console.log(`[EMAIL] Business: ${businessName} (${templateType})`);
+      log.info('Email approval notification', { to: notificationEmail, templateType });
+      log.debug('Email approval notification details', {
+        client: `${clientName} (${clientEmail})`,
+        business: businessName
+      });
 
       const emailSent = await sendClientApprovalNotification({
         notificationEmail,
@@ -1060,7 +1050,7 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
       });
 
       if (emailSent) {
-        console.log(`[EMAIL] Notification sent successfully to ${notificationEmail}`);
+        log.info('Email notification sent', { to: notificationEmail });
         res.json({ 
           success: true, 
           message: "Approval notification sent successfully",
@@ -1085,3 +1075,132 @@ app.delete("/api/config/:id", async (req: Request, res: Response) => {
   const httpServer = createServer(app);
   return httpServer;
 }
+
+/**
+ * Website config used to render a saved template (preview and static export)
+ */
+function templatePreviewConfig(templateId: string, templateData: any) {
+  return {
+    id: parseInt(templateId.split('_')[0]) || 1,
+    name: templateData.businessName || templateData.clientName || 'Template Business',
+    logo: templateData.profileImage || '',
+    defaultLanguage: 'es',
+    showWhyWebsiteButton: true,
+    showDomainButton: true,
+    showChatbot: false,
+    whatsappNumber: templateData.phone || '',
+    whatsappMessage: 'Hello!',
+    facebookUrl: templateData.facebook_url || '',
+    googleMapsEmbed: '',
+    address: templateData.address || '',
+    phone: templateData.phone || '',
+    email: templateData.email || '',
+    profileImage: templateData.profileImage || '',
+    coverImage: templateData.coverImage || '',
+    officeHours: {
+      mondayFriday: {
+        es: '9:00 AM - 6:00 PM',
+        en: '9:00 AM - 6:00 PM'
+      },
+      saturday: {
+        es: '10:00 AM - 2:00 PM',
+        en: '10:00 AM - 2:00 PM'
+      }
+    },
+    analyticsCode: '',
+    primaryColor: '#00A859',
+    secondaryColor: '#C8102E',
+    backgroundColor: '#FFFFFF',
+    translations: {
+      en: {
+        tagline: templateData.businessName || 'Welcome',
+        subtitle: 'Professional services you can trust',
+        aboutText: 'About our business'
+      },
+      es: {
+        tagline: templateData.businessName || 'Bienvenidos',
+        subtitle: 'Servicios profesionales en los que puedes confiar',
+        aboutText: 'Acerca de nuestro negocio'
+      }
+    },
+    heroImage: templateData.coverImage || '',
+    templates: [],
+    chatbotQuestions: []
+  };
+}
+
+/**
+ * Sends a rendered page from the render cache, or 304 if the client's copy is current
+ * The brotli/gzip copy is compressed once per render and cached with the page.
+ */
+async function sendRenderedPage(req: Request, res: Response, key: string, config: WebsiteConfig) {
+  const etag = renderETag(config);
+  const encoding = negotiateEncoding(req.headers['accept-encoding']);
+  res.setHeader('ETag', encodedETag(etag, encoding));
+  res.setHeader('Cache-Control', 'no-cache');
+  res.vary('Accept-Encoding');
+  if (etagMatches(req.headers['if-none-match'], etag)) {
+    return res.status(304).end();
+  }
+  const page = getRenderedPage(key, config, etag);
+  res.setHeader('Content-Type', 'text/html; charset=utf-8');
+  if (!encoding) {
+    return res.send(page.body);
+  }
+  const body = await encodedBody(page, encoding);
+  res.setHeader('Content-Encoding', encoding);
+  res.send(body);
+}
+
+/**
+ * Strong ETag for a stored config: its id and version, which every update
+ * bumps (updatedAt stands in for rows read before the version column existed)
+ */
+function configETag(config: WebsiteConfig): string | null {
+  if (typeof config.version === 'number') return `"cfg-${config.id}-v${config.version}"`;
+  const updatedAt = config.updatedAt ? new Date(config.updatedAt).getTime() : NaN;
+  return isNaN(updatedAt) ? null : `"cfg-${config.id}-t${updatedAt.toString(36)}"`;
+}
+
+/**
+ * Sends a config that clients may keep but must revalidate on every use, or
+ * a 304 when the If-None-Match copy is still current
+ */
+function sendConfig(req: Request, res: Response, config: WebsiteConfig) {
+  const etag = configETag(config);
+  if (!etag) return res.json(config);
+
+  res.removeHeader('Pragma');
+  res.removeHeader('Expires');
+  res.set({ 'Cache-Control': 'no-cache', 'ETag': etag });
+  if (etagMatches(req.headers['if-none-match'], etag)) {
+    return res.status(304).end();
+  }
+  return res.json(config);
+}
+
+// Demo id -> website_configs id, resolved by name on first use. The editor can
+// rename a demo row, so a cached id whose name no longer matches is re-resolved.
+const demoConfigIds = new Map<DemoConfigId, number>();
+
+/**
+ * Config behind a template demo page, created with safe defaults on first use
+ */
+async function getDemoConfig(demoId: DemoConfigId, configName: string) {
+  const knownId = demoConfigIds.get(demoId);
+  if (knownId !== undefined) {
+    const config = await storage.getWebsiteConfig(knownId);
+    if (config?.name === configName) return config;
+    demoConfigIds.delete(demoId);
+  }
+
+  // One lookup when the demo exists; otherwise insert and re-read in one transaction
+  const templateType = demoId.replace('-demo', '');
+  const { config, created } = await storage.getOrCreateWebsiteConfigByName(configName, createSafeDemoConfig(templateType));
+  if (created) {
+    configSaved(config);
+    logConfigAccess('CREATE-DEMO', demoId, true, `Created safe demo config for ${templateType}`);
+  }
+  demoConfigIds.set(demoId, config.id);
+  return config;
+}
@@ -1,4 +1,4 @@
-import { pgTable, serial, text, timestamp, jsonb, boolean } from 'drizzle-orm/pg-core';
+import { pgTable, serial, text, timestamp, jsonb, boolean, integer } from 'drizzle-orm/pg-core';
 
 export const users = pgTable('users', {
   id: serial('id').primaryKey(),
@@ -8,7 +8,7 @@ export const users = pgTable('users', {
 
 export const website_configs = pgTable('website_configs', {
   id: serial('id').primaryKey(),
-  name: text('name').notNull(),
+  name: text('name').notNull().unique(),
   templateType: text('templateType').notNull().default('default'),
   logo: text('logo').notNull().default(''),
   heroImage: text('heroImage').notNull().default(''),
@@ -25,6 +25,7 @@ export const website_configs = pgTable('website_configs', {
   templateShowcaseCards: jsonb('templateShowcaseCards').notNull().default([]),
   createdAt: timestamp('createdAt').notNull().defaultNow(),
   updatedAt: timestamp('updatedAt').notNull().defaultNow(),
+  version: integer('version').notNull().default(1),
 });
 
 export type User = typeof users.$inferSelect;
@@ -0,0 +1,725 @@
+/**
+ * Shared runtime assets for generated client sites
+ * The stylesheet and script that every generated site uses (cover image
+ * loading, image fallbacks, language toggle, chatbot) are served once under
+ * content-hashed names with immutable caching, so a page only inlines its own
+ * colour variables and data and visitors download the runtime once.
+ * Every version is also kept in data/site-assets/ (SITE_ASSET_DIR), so pages
+ * generated or cached before a runtime change keep loading the version they
+ * link.
+ */
+
+import type { Express, Request, Response } from "express";
+import { createHash, randomBytes } from "crypto";
+import fsp from "fs/promises";
+import path from "path";
+import { encodedBody, negotiateEncoding } from "./compression";
+
+export const SITE_RUNTIME_CSS = `:root {
+  --light-gray: #F8F9FA;
+  --dark-gray: #343A40;
+}
+
+body {
+  font-family: 'Open Sans', sans-serif;
+  scroll-behavior: smooth;
+  overflow-x: hidden;
+}
+
+h1, h2, h3, h4, h5, h6 {
+  font-family: 'Montserrat', sans-serif;
+  font-weight: 700;
+}
+
+.bg-primary-custom {
+  background-color: var(--primary);
+}
+
+.bg-secondary-custom {
+  background-color: var(--secondary);
+}
+
+.text-primary-custom {
+  color: var(--primary);
+}
+
+.text-secondary-custom {
+  color: var(--secondary);
+}
+
+.btn-primary-custom {
+  background-color: var(--primary);
+  color: var(--white);
+  border: none;
+  transition: all 0.3s ease;
+}
+
+.btn-primary-custom:hover {
+  background-color: #008f4c;
+  transform: translateY(-2px);
+}
+
+.btn-secondary-custom {
+  background-color: var(--secondary);
+  color: var(--white);
+  border: none;
+  transition: all 0.3s ease;
+}
+
+.btn-secondary-custom:hover {
+  background-color: #a50d25;
+  transform: translateY(-2px);
+}
+
+.language-toggle {
+  font-size: 1.2em;
+  padding: 8px 15px;
+  border-radius: 50px;
+  font-weight: 600;
+  box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+}
+
+.service-card {
+  transition: all 0.3s ease;
+  border-radius: 8px;
+  overflow: hidden;
+  height: 100%;
+}
+
+.service-card:hover {
+  transform: translateY(-5px);
+  box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+}
+
+.review-card {
+  border-radius: 8px;
+  overflow: hidden;
+  height: 100%;
+  border-left: 4px solid var(--primary);
+}
+
+.photo-item {
+  overflow: hidden;
+  border-radius: 8px;
+  transition: all 0.3s ease;
+}
+
+.photo-item:hover img {
+  transform: scale(1.05);
+}
+
+.photo-item img {
+  transition: transform 0.3s ease;
+}
+
+.navbar-custom {
+  background-color: rgba(255, 255, 255, 0.95);
+  box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
+}
+
+.chatbot-toggle {
+  position: fixed;
+  bottom: 30px;
+  right: 30px;
+  width: 60px;
+  height: 60px;
+  border-radius: 50%;
+  background-color: var(--primary);
+  color: white;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  cursor: pointer;
+  box-shadow: 0 4px 10px rgba(0, 0, 0, 0.2);
+  z-index: 1000;
+  transition: all 0.3s ease;
+}
+
+.chatbot-toggle:hover {
+  transform: scale(1.1);
+}
+
+.chatbot-panel {
+  position: fixed;
+  bottom: 100px;
+  right: 30px;
+  width: 350px;
+  height: 450px;
+  background-color: white;
+  border-radius: 10px;
+  box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
+  z-index: 999;
+  overflow: hidden;
+  display: none;
+}
+
+.star-rating {
+  color: #FFD700;
+}
+
+.whatsapp-btn {
+  background-color: #25D366;
+  color: white;
+  transition: all 0.3s ease;
+}
+
+.whatsapp-btn:hover {
+  background-color: #128C7E;
+  transform: translateY(-2px);
+}
+
+.section-padding {
+  padding: 80px 0;
+}
+
+@media (max-width: 768px) {
+  .section-padding {
+    padding: 50px 0;
+  }
+}
+
+.header-image {
+  height: 90vh;
+  background-size: cover;
+  background-position: center;
+  background-repeat: no-repeat;
+  position: relative;
+  /* Always show gradient as base, image will layer on top */
+  background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
+  /* Transition for smooth image loading */
+  transition: background-image 0.5s ease-in-out;
+}
+
+/* Ensure gradient shows when image fails */
+.header-image::before {
+  content: '';
+  position: absolute;
+  top: 0;
+  left: 0;
+  right: 0;
+  bottom: 0;
+  background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
+  z-index: -1;
+}
+
+/* Facebook CDN image loading states */
+.header-image.loading {
+  background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
+}
+
+.header-image.loaded {
+  /* Image successfully loaded */
+}
+
+.header-image.error {
+  /* Image failed to load - use enhanced gradient with business branding */
+  background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
+}
+
+.header-image.facebook-cdn {
+  /* Special handling for Facebook CDN images - enhanced gradient fallback */
+  background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 50%, var(--primary) 100%);
+}
+
+/* Removed CSS variable approach for more reliable inline style method */
+
+.navbar-brand img {
+  /* Ensure profile images load gracefully */
+  transition: opacity 0.3s ease;
+  opacity: 1;
+}
+
+.navbar-brand img[src=""], .navbar-brand img:not([src]) {
+  display: none !important;
+}
+
+.header-overlay {
+  position: absolute;
+  top: 0;
+  left: 0;
+  width: 100%;
+  height: 100%;
+  background: linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.7));
+}
+
+.header-content {
+  position: relative;
+  z-index: 2;
+}`;
+
+export const SITE_RUNTIME_JS = `(function() {
+  // Per-site data inlined by the page before this script
+  const site = window.__WEBSITIO_SITE__ || {};
+
+  // Facebook CDN Image Loading with enhanced debugging
+  function loadCoverImage() {
+    const headerElement = document.getElementById('home');
+    const coverUrl = headerElement?.getAttribute('data-cover-url');
+    
+    console.log('=== Facebook CDN Image Loading Debug ===');
+    console.log('Header element found:', !!headerElement);
+    console.log('Cover URL found:', !!coverUrl);
+    
+    if (!coverUrl || !headerElement) {
+      console.log('No cover image URL or header element found, using current styling');
+      return;
+    }
+    
+    console.log('Attempting to load cover image:', coverUrl.substring(0, 80) + '...');
+    
+    // Check if the image is already set as background
+    const currentBg = headerElement.style.backgroundImage;
+    console.log('Current background image:', currentBg ? 'Set' : 'None');
+    
+    // If no background image is set, try to set it directly
+    if (!currentBg || currentBg === 'none') {
+      console.log('Setting background image directly');
+      headerElement.style.backgroundImage = \`url("\${coverUrl}")\`;
+      headerElement.style.backgroundSize = 'cover';
+      headerElement.style.backgroundPosition = 'center';
+      headerElement.style.backgroundRepeat = 'no-repeat';
+    }
+    
+    // Test image loading separately for debugging
+    const img = new Image();
+    
+    img.onload = function() {
+      console.log('✓ Facebook CDN image loaded successfully');
+      console.log('Image dimensions:', img.width + 'x' + img.height);
+      headerElement.classList.add('loaded');
+    };
+    
+    img.onerror = function(error) {
+      console.warn('✗ Facebook CDN image failed to load:', error.type || 'Unknown error');
+      console.log('This is likely due to Facebook CORS restrictions');
+      console.log('Attempting proxy approach for Facebook images...');
+      
+      // For Facebook images, try using a different approach
+      if (coverUrl.includes('scontent') && coverUrl.includes('fbcdn.net')) {
+        // Try to use the image anyway - sometimes browsers can display it in CSS even if JS can't load it
+        console.log('Keeping Facebook CDN URL in CSS - may still work in some cases');
+        headerElement.classList.add('facebook-cdn');
+        
+        // Add a timeout to check if the background image rendered
+        setTimeout(() => {
+          const computed = window.getComputedStyle(headerElement);
+          const bgImage = computed.backgroundImage;
+          
+          if (bgImage && bgImage !== 'none' && !bgImage.includes('linear-gradient')) {
+            console.log('✓ Facebook CDN image rendered successfully via CSS');
+            headerElement.classList.add('loaded');
+          } else {
+            console.log('✗ Facebook CDN image not rendered - using gradient fallback');
+            headerElement.style.backgroundImage = '';
+            headerElement.classList.add('error');
+          }
+        }, 1000);
+      } else {
+        // For non-Facebook images, use standard fallback
+        headerElement.style.backgroundImage = '';
+        headerElement.classList.add('error');
+      }
+    };
+    
+    // Start the test load
+    img.src = coverUrl;
+    
+    // Log final state after a delay
+    setTimeout(() => {
+      const finalBg = headerElement.style.backgroundImage;
+      console.log('Final background state:', finalBg ? 'Image set' : 'Using CSS gradient');
+      console.log('=== End Facebook CDN Debug ===');
+    }, 2000);
+  }
+  
+  // Load cover image when DOM is ready
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', loadCoverImage);
+  } else {
+    loadCoverImage();
+  }
+
+  // Translations data from configuration
+  const translations = site.translations || { en: {}, es: {} };
+
+  // Initialize current language
+  let currentLanguage = site.defaultLanguage;
+
+  // Language toggle functionality
+  const languageToggle = document.getElementById('languageToggle');
+  
+  function updateLanguage(lang) {
+    currentLanguage = lang;
+    
+    // Update toggle button text
+    languageToggle.textContent = lang === 'en' ? 'Español' : 'English';
+    
+    // Update all translatable elements
+    document.querySelectorAll('[data-i18n]').forEach(element => {
+      const key = element.getAttribute('data-i18n');
+      if (translations[lang][key]) {
+        element.textContent = translations[lang][key];
+      }
+    });
+    
+    // Update attributes that need translation
+    document.querySelectorAll('[data-i18n-attr]').forEach(element => {
+      const attr = element.getAttribute('data-i18n-attr').split(':');
+      const attrName = attr[0];
+      const key = attr[1];
+      if (translations[lang][key]) {
+        element.setAttribute(attrName, translations[lang][key]);
+      }
+    });
+  }
+  
+  if (languageToggle) {
+    languageToggle.addEventListener('click', function() {
+      updateLanguage(currentLanguage === 'en' ? 'es' : 'en');
+    });
+  }
+  
+  if (site.showChatbot) {
+    // Chatbot functionality
+    const chatbotToggle = document.getElementById('chatbotToggle');
+    const chatbotPanel = document.getElementById('chatbotPanel');
+    const chatbotClose = document.getElementById('chatbotClose');
+    const chatbotMessages = document.getElementById('chatbotMessages');
+    const chatbotInput = document.getElementById('chatbotInput');
+    const chatbotSend = document.getElementById('chatbotSend');
+  
+    // Chatbot responses
+    const chatbotResponses = site.chatbotResponses || {};
+  
+    let chatbotOpened = false;
+  
+    function addMessage(text, isUser) {
+      if (!chatbotMessages) return;
+    
+      const messageDiv = document.createElement('div');
+      messageDiv.style.marginBottom = '10px';
+      messageDiv.style.textAlign = isUser ? 'right' : 'left';
+    
+      const bubble = document.createElement('div');
+      bubble.style.display = 'inline-block';
+      bubble.style.padding = '8px 12px';
+      bubble.style.borderRadius = '15px';
+      bubble.style.maxWidth = '80%';
+      bubble.style.wordWrap = 'break-word';
+    
+      if (isUser) {
+        bubble.style.backgroundColor = site.primaryColor;
+        bubble.style.color = 'white';
+      } else {
+        bubble.style.backgroundColor = '#f1f1f1';
+        bubble.style.color = '#333';
+      }
+    
+      bubble.textContent = text;
+      messageDiv.appendChild(bubble);
+      chatbotMessages.appendChild(messageDiv);
+      chatbotMessages.scrollTop = chatbotMessages.scrollHeight;
+    }
+  
+    function openChatbot() {
+      if (!chatbotPanel) return;
+      chatbotPanel.style.display = 'block';
+    
+      if (!chatbotOpened) {
+        chatbotOpened = true;
+        addMessage(currentLanguage === 'en' ? 'Hello! How can I help you today?' : '¡Hola! ¿Cómo puedo ayudarte hoy?', false);
+      }
+    }
+  
+    function closeChatbot() {
+      if (!chatbotPanel) return;
+      chatbotPanel.style.display = 'none';
+    }
+  
+    // Event listeners
+    if (chatbotToggle) {
+      chatbotToggle.addEventListener('click', function() {
+        if (chatbotPanel.style.display === 'block') {
+          closeChatbot();
+        } else {
+          openChatbot();
+        }
+      });
+    }
+  
+    if (chatbotClose) {
+      chatbotClose.addEventListener('click', closeChatbot);
+    }
+  
+    // Question buttons
+    setTimeout(function() {
+      document.querySelectorAll('[data-question]').forEach(function(button) {
+        button.addEventListener('click', function() {
+          const questionKey = this.getAttribute('data-question');
+          const questionText = this.textContent;
+        
+          addMessage(questionText, true);
+        
+          setTimeout(function() {
+            const response = chatbotResponses[questionKey];
+            if (response) {
+              addMessage(response[currentLanguage] || response.en, false);
+            }
+          }, 500);
+        });
+      });
+    }, 100);
+  
+    // Send message
+    function sendMessage() {
+      if (!chatbotInput || !chatbotInput.value.trim()) return;
+    
+      const message = chatbotInput.value.trim();
+      addMessage(message, true);
+      chatbotInput.value = '';
+    
+      setTimeout(function() {
+        addMessage(currentLanguage === 'en' 
+          ? 'Thank you for your message. Someone will respond shortly.' 
+          : 'Gracias por tu mensaje. Alguien te responderá pronto.', false);
+      }, 1000);
+    }
+  
+    if (chatbotSend) {
+      chatbotSend.addEventListener('click', sendMessage);
+    }
+  
+    if (chatbotInput) {
+      chatbotInput.addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') {
+          sendMessage();
+        }
+      });
+    }
+  }
+  
+  // Contact Form Handling
+  const contactForm = document.getElementById('contactForm');
+  const formSuccess = document.getElementById('formSuccess');
+  
+  if (contactForm) {
+    contactForm.addEventListener('submit', function(e) {
+      e.preventDefault();
+      
+      // In a real implementation, this would send the form data to a service like Formspree
+      if (formSuccess) {
+        formSuccess.classList.remove('d-none');
+        contactForm.reset();
+        
+        // Hide success message after 5 seconds
+        setTimeout(() => {
+          formSuccess.classList.add('d-none');
+        }, 5000);
+      }
+    });
+  }
+  
+  // Smooth scrolling for navbar links
+  document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function(e) {
+      e.preventDefault();
+      
+      const targetId = this.getAttribute('href');
+      if (targetId === '#') return;
+      
+      const targetElement = document.querySelector(targetId);
+      if (targetElement) {
+        window.scrollTo({
+          top: targetElement.offsetTop - 80, // Adjust for navbar height
+          behavior: 'smooth'
+        });
+        
+        // Close mobile menu if open
+        const navbarToggler = document.querySelector('.navbar-toggler');
+        const navbarCollapse = document.querySelector('.navbar-collapse');
+        if (navbarCollapse.classList.contains('show')) {
+          navbarToggler.click();
+        }
+      }
+    });
+  });
+  
+  // Facebook CDN Image Fallback Detection
+  function handleImageFallback() {
+    const headerElement = document.querySelector('.header-image');
+    if (!headerElement) return;
+    
+    const backgroundImageUrl = headerElement.style.backgroundImage;
+    if (!backgroundImageUrl || !backgroundImageUrl.includes('scontent')) return;
+    
+    // The server already checked the signed URL's expiry at render time
+    if (headerElement.dataset.coverStatus === 'valid') return;
+    
+    console.log('🔍 Checking Facebook CDN image accessibility...');
+    
+    // Extract URL from background-image style
+    const urlMatch = backgroundImageUrl.match(/url\\(['"]?([^'"\\)]+)['"]?\\)/);
+    if (!urlMatch) return;
+    
+    const imageUrl = urlMatch[1];
+    console.log('📸 Testing image URL:', imageUrl.substring(0, 80) + '...');
+    
+    // For Facebook CDN images, we assume they will be blocked and use gradient fallback
+    // This is more reliable than waiting for onerror events that may not fire
+    if (imageUrl.includes('scontent') && imageUrl.includes('fbcdn.net')) {
+      console.log('🔍 Facebook CDN detected - testing image loading...');
+      
+      // Wait a brief moment to see if image loads naturally
+      setTimeout(() => {
+        // Check if we can determine the image loaded by checking computed styles
+        const computedStyle = window.getComputedStyle(headerElement);
+        const bgImage = computedStyle.backgroundImage;
+        
+        if (bgImage === 'none' || bgImage.includes('linear-gradient')) {
+          console.log('✓ Image already failed, gradient showing');
+        } else {
+          console.log('⚠ Image may have loaded but switching to gradient for visibility consistency');
+          // Keep the image if it loaded, only fallback if really needed
+          // Don't automatically remove background image
+        }
+      }, 1500);
+      
+      return;
+    }
+    
+    // For non-Facebook images, use traditional loading test
+    const testImg = new Image();
+    testImg.onload = function() {
+      console.log('✓ Image loaded successfully');
+      headerElement.classList.add('loaded');
+    };
+    
+    testImg.onerror = function() {
+      console.log('✗ Image failed to load - using gradient fallback');
+      headerElement.style.backgroundImage = '';
+      headerElement.classList.add('loading');
+    };
+    
+    testImg.src = imageUrl;
+  }
+  
+  // Handle profile image fallback
+  function handleProfileImageFallback() {
+    const profileImages = document.querySelectorAll('img[src*="scontent"]');
+    profileImages.forEach(img => {
+      img.onerror = function() {
+        console.log('✗ Profile image blocked - hiding element');
+        this.style.display = 'none';
+      };
+      
+      img.onload = function() {
+        console.log('✓ Profile image loaded successfully');
+      };
+    });
+  }
+  
+  // Initialize image fallback handlers
+  handleImageFallback();
+  handleProfileImageFallback();
+  
+  // Initialize the page with the default language
+  updateLanguage(currentLanguage);
+})();`;
+
+interface SiteAsset {
+  name: string;
+  hash: string;
+  contentType: string;
+  body: Buffer;
+  encoded?: Record<string, Promise<Buffer>>;
+}
+
+function siteAsset(extension: string, contentType: string, text: string): SiteAsset {
+  const body = Buffer.from(text, 'utf-8');
+  const hash = createHash('sha256').update(body).digest('hex').slice(0, 16);
+  return { name: `site.${hash}.${extension}`, hash, contentType, body };
+}
+
+export const siteAssets = {
+  css: siteAsset('css', 'text/css; charset=utf-8', SITE_RUNTIME_CSS),
+  js: siteAsset('js', 'application/javascript; charset=utf-8', SITE_RUNTIME_JS)
+};
+
+const assetBase = () => (process.env.SITE_ASSET_BASE || '/site-assets').replace(/\/$/, '');
+
+/**
+ * URL a generated page uses for a shared asset (SITE_ASSET_BASE overrides the prefix)
+ */
+export function siteAssetUrl(kind: keyof typeof siteAssets): string {
+  return `${assetBase()}/${siteAssets[kind].name}`;
+}
+
+const assetDir = () => path.resolve(process.cwd(), process.env.SITE_ASSET_DIR || 'data/site-assets');
+
+const ASSET_NAME = /^site\.([0-9a-f]{16})\.(css|js)$/;
+
+const CONTENT_TYPES: Record<string, string> = {
+  css: siteAssets.css.contentType,
+  js: siteAssets.js.contentType
+};
+
+/**
+ * Saves the current versions next to the earlier ones (once per version)
+ */
+async function persistSiteAssets() {
+  await fsp.mkdir(assetDir(), { recursive: true });
+  for (const asset of Object.values(siteAssets)) {
+    const file = path.join(assetDir(), asset.name);
+    try {
+      await fsp.access(file);
+    } catch {
+      const tmp = `${file}.${process.pid}.${randomBytes(4).toString('hex')}.tmp`;
+      await fsp.writeFile(tmp, asset.body);
+      await fsp.rename(tmp, file);
+    }
+  }
+}
+
+export function registerSiteAssetRoutes(app: Express) {
+  const byName = new Map(Object.values(siteAssets).map(asset => [asset.name, asset]));
+  persistSiteAssets().catch(error => console.error('Error saving site assets:', error));
+
+  // Earlier versions, read from disk on first request
+  const loadPrevious = async (name: string): Promise<SiteAsset | null> => {
+    const match = name.match(ASSET_NAME);
+    if (!match) return null;
+    try {
+      const body = await fsp.readFile(path.join(assetDir(), name));
+      const asset = { name, hash: match[1], contentType: CONTENT_TYPES[match[2]], body };
+      byName.set(name, asset);
+      return asset;
+    } catch {
+      return null;
+    }
+  };
+
+  app.get('/site-assets/:name', async (req: Request, res: Response) => {
+    const asset = byName.get(req.params.name) || await loadPrevious(req.params.name);
+    if (!asset) {
+      return res.status(404).json({ error: 'Asset not found' });
+    }
+    // The name changes whenever the content does
+    const encoding = negotiateEncoding(req.headers['accept-encoding']);
+    res.setHeader('Content-Type', asset.contentType);
+    res.setHeader('Cache-Control', 'public, max-age=31536000, immutable');
+    res.setHeader('ETag', encoding ? `"${asset.hash}-${encoding}"` : `"${asset.hash}"`);
+    res.vary('Accept-Encoding');
+    if (!encoding) {
+      return res.send(asset.body);
+    }
+    try {
+      const body = await encodedBody(asset, encoding);
+      res.setHeader('Content-Encoding', encoding);
+      res.send(body);
+    } catch (error) {
+      console.error('Error compressing site asset:', error);
+      res.setHeader('ETag', `"${asset.hash}"`);
+      res.send(asset.body);
+    }
+  });
+}
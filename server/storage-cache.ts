@@ -0,0 +1,247 @@
+/**
+ * Read-through cache in front of any IStorage
+ * Keeps per-id website configs (also found by name), the default config and
+ * the full list in memory for STORAGE_CACHE_TTL_MS (default 30s). Writes made
+ * through the cache update or drop the affected entries immediately; the TTL
+ * only bounds how long changes made by another process (or directly in the
+ * database) stay invisible. Concurrent misses for the same entry share one query.
+ * STORAGE_CACHE=off bypasses it.
+ */
+
+import type { ConfigSummaryPage, ConfigSummaryQuery, GetOrCreateResult, IStorage } from './storage';
+import type { WebsiteConfig, InsertWebsiteConfig, User } from './schema';
+
+type CacheKind = 'config' | 'name' | 'default' | 'list';
+
+interface Entry<T> {
+  value: T;
+  expires: number;
+}
+
+export interface StorageCacheOptions {
+  ttlMs?: number;
+  maxEntries?: number;
+}
+
+export interface StorageCacheStats {
+  hits: number;
+  misses: number;
+  invalidations: number;
+  entries: number;
+  byKind: Record<CacheKind, { hits: number; misses: number }>;
+}
+
+const DEFAULT_TTL_MS = parseInt(process.env.STORAGE_CACHE_TTL_MS || '', 10) || 30_000;
+const DEFAULT_MAX_ENTRIES = parseInt(process.env.STORAGE_CACHE_MAX_ENTRIES || '', 10) || 1000;
+
+// Callers are free to modify what they get back, so the cache hands out copies
+const copy = <T>(value: T): T => structuredClone(value);
+
+export class CachedStorage implements IStorage {
+  private configs = new Map<number, Entry<WebsiteConfig>>();
+  private idsByName = new Map<string, number>();
+  private defaultConfig: Entry<WebsiteConfig> | null = null;
+  private list: Entry<WebsiteConfig[]> | null = null;
+  private inflight = new Map<string, Promise<unknown>>();
+
+  // Bumped on every write, so a read that started before the write doesn't
+  // put what it fetched back into the cache
+  private generation = 0;
+
+  private ttlMs: number;
+  private maxEntries: number;
+  private counters = {
+    invalidations: 0,
+    byKind: {
+      config: { hits: 0, misses: 0 },
+      name: { hits: 0, misses: 0 },
+      default: { hits: 0, misses: 0 },
+      list: { hits: 0, misses: 0 }
+    }
+  };
+
+  constructor(private inner: IStorage, options: StorageCacheOptions = {}) {
+    this.ttlMs = options.ttlMs ?? DEFAULT_TTL_MS;
+    this.maxEntries = options.maxEntries ?? DEFAULT_MAX_ENTRIES;
+  }
+
+  private fresh<T>(entry: Entry<T> | null | undefined): entry is Entry<T> {
+    return !!entry && entry.expires > Date.now();
+  }
+
+  private entry<T>(value: T): Entry<T> {
+    return { value, expires: Date.now() + this.ttlMs };
+  }
+
+  private storeConfig(config: WebsiteConfig) {
+    if (config?.id === undefined || config.id === null) return;
+    this.configs.delete(config.id);
+    this.configs.set(config.id, this.entry(copy(config)));
+    this.idsByName.set(config.name, config.id);
+    // Map order is insertion order, so the first keys are the oldest
+    for (const id of this.configs.keys()) {
+      if (this.configs.size <= this.maxEntries) break;
+      this.configs.delete(id);
+    }
+    if (this.idsByName.size > this.maxEntries * 2) {
+      // Names of evicted or renamed rows; a lookup through them misses anyway
+      this.idsByName.forEach((id, name) => {
+        if (this.configs.get(id)?.value.name !== name) this.idsByName.delete(name);
+      });
+    }
+  }
+
+  /**
+   * Runs a miss through the inner storage once per key, storing the result
+   * unless a write happened meanwhile
+   */
+  private async load<T>(key: string, fetch: () => Promise<T>, store: (value: T) => void): Promise<T> {
+    const pending = this.inflight.get(key) as Promise<T> | undefined;
+    if (pending) return copy(await pending);
+
+    const generation = this.generation;
+    const promise = fetch();
+    this.inflight.set(key, promise);
+    try {
+      const value = await promise;
+      if (generation === this.generation) store(value);
+      return copy(value);
+    } finally {
+      if (this.inflight.get(key) === promise) this.inflight.delete(key);
+    }
+  }
+
+  private invalidate(id?: number) {
+    this.generation += 1;
+    this.counters.invalidations += 1;
+    this.list = null;
+    if (id !== undefined) this.configs.delete(id);
+    // The default config is row 1, or whatever getDefaultWebsiteConfig created
+    if (id === undefined || id === 1) this.defaultConfig = null;
+  }
+
+  async getDefaultWebsiteConfig(): Promise<WebsiteConfig> {
+    if (this.fresh(this.defaultConfig)) {
+      this.counters.byKind.default.hits += 1;
+      return copy(this.defaultConfig.value);
+    }
+    this.counters.byKind.default.misses += 1;
+    return this.load('default', () => this.inner.getDefaultWebsiteConfig(), config => {
+      this.defaultConfig = this.entry(copy(config));
+    });
+  }
+
+  async getWebsiteConfig(id: number): Promise<WebsiteConfig | null> {
+    const cached = this.configs.get(id);
+    if (this.fresh(cached)) {
+      this.counters.byKind.config.hits += 1;
+      return copy(cached.value);
+    }
+    this.counters.byKind.config.misses += 1;
+    // null is also what DatabaseStorage returns on a query error, so it isn't cached
+    return this.load(`config:${id}`, () => this.inner.getWebsiteConfig(id), config => {
+      if (config) this.storeConfig(config);
+    });
+  }
+
+  async getWebsiteConfigByName(name: string): Promise<WebsiteConfig | null> {
+    // Served from the per-id entry, so renames and deletes need no extra bookkeeping
+    const id = this.idsByName.get(name);
+    const cached = id === undefined ? undefined : this.configs.get(id);
+    if (this.fresh(cached) && cached.value.name === name) {
+      this.counters.byKind.name.hits += 1;
+      return copy(cached.value);
+    }
+    this.counters.byKind.name.misses += 1;
+    return this.load(`name:${name}`, () => this.inner.getWebsiteConfigByName(name), config => {
+      if (config) this.storeConfig(config);
+    });
+  }
+
+  async getOrCreateWebsiteConfigByName(name: string, defaults: Omit<InsertWebsiteConfig, 'name'>): Promise<GetOrCreateResult> {
+    const existing = await this.getWebsiteConfigByName(name);
+    if (existing) return { config: existing, created: false };
+
+    const result = await this.inner.getOrCreateWebsiteConfigByName(name, defaults);
+    if (result.created) this.invalidate(result.config.id);
+    this.storeConfig(result.config);
+    return copy(result);
+  }
+
+  async getAllWebsiteConfigs(): Promise<WebsiteConfig[]> {
+    if (this.fresh(this.list)) {
+      this.counters.byKind.list.hits += 1;
+      return copy(this.list.value);
+    }
+    this.counters.byKind.list.misses += 1;
+    // An empty list is also what DatabaseStorage returns on a query error
+    return this.load('list', () => this.inner.getAllWebsiteConfigs(), configs => {
+      if (configs.length === 0) return;
+      this.list = this.entry(copy(configs));
+      configs.forEach(config => this.storeConfig(config));
+    });
+  }
+
+  // Pages are small keyset queries that change with every write; not cached
+  listWebsiteConfigSummaries(query: ConfigSummaryQuery): Promise<ConfigSummaryPage> {
+    return this.inner.listWebsiteConfigSummaries(query);
+  }
+
+  async createWebsiteConfig(config: InsertWebsiteConfig): Promise<WebsiteConfig> {
+    try {
+      const created = await this.inner.createWebsiteConfig(config);
+      this.invalidate(created?.id);
+      if (created) this.storeConfig(created);
+      return copy(created);
+    } catch (error) {
+      this.invalidate();
+      throw error;
+    }
+  }
+
+  async updateWebsiteConfig(id: number, config: InsertWebsiteConfig): Promise<WebsiteConfig | null> {
+    const updated = await this.inner.updateWebsiteConfig(id, config);
+    this.invalidate(id);
+    if (updated) this.storeConfig(updated);
+    return copy(updated);
+  }
+
+  async deleteWebsiteConfig(id: number): Promise<void> {
+    try {
+      await this.inner.deleteWebsiteConfig(id);
+    } finally {
+      this.invalidate(id);
+    }
+  }
+
+  createUser(username: string, password: string): Promise<User> {
+    return this.inner.createUser(username, password);
+  }
+
+  /**
+   * Drops every cached entry (for tests, or after editing the database by hand)
+   */
+  clear() {
+    this.invalidate();
+    this.configs.clear();
+    this.idsByName.clear();
+  }
+
+  stats(): StorageCacheStats {
+    const kinds = Object.values(this.counters.byKind);
+    return {
+      hits: kinds.reduce((sum, kind) => sum + kind.hits, 0),
+      misses: kinds.reduce((sum, kind) => sum + kind.misses, 0),
+      invalidations: this.counters.invalidations,
+      entries: this.configs.size + (this.defaultConfig ? 1 : 0) + (this.list ? 1 : 0),
+      byKind: structuredClone(this.counters.byKind)
+    };
+  }
+}
+
+/**
+ * Wraps a storage backend in the cache unless STORAGE_CACHE=off
+ */
+export function withStorageCache(inner: IStorage, options?: StorageCacheOptions): IStorage {
+  return process.env.STORAGE_CACHE === 'off' ? inner : new CachedStorage(inner, options);
+}
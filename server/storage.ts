@@ -1,36 +1,112 @@
-import { drizzle } from 'drizzle-orm/neon-http';
-import { neon } from '@neondatabase/serverless';
-import { eq } from 'drizzle-orm';
+import type { NeonHttpDatabase } from 'drizzle-orm/neon-http';
+import { and, desc, eq, getTableColumns, ilike, lt, ne, notInArray, notLike, sql, type SQL } from 'drizzle-orm';
 import { users, website_configs } from './schema';
 import type { WebsiteConfig, InsertWebsiteConfig, User, InsertUser } from './schema';
+import { withStorageCache } from './storage-cache';
+import { ISOLATION_RULES } from './config-isolation';
+import { connectDatabase, type DatabaseConnection } from './db';
 
-interface IStorage {
+// Columns a config listing can ask for; clientApproval is reduced to its status fields
+export const CONFIG_SUMMARY_FIELDS = Object.keys(getTableColumns(website_configs));
+export const DEFAULT_CONFIG_SUMMARY_FIELDS = ['id', 'name', 'templateType', 'createdAt', 'updatedAt', 'clientApproval'];
+
+export interface ConfigSummaryQuery {
+  templateType?: string;
+  name?: string;      // case-insensitive substring
+  fields?: string[];  // from CONFIG_SUMMARY_FIELDS; id is always included
+  limit?: number;
+  cursor?: number;    // id of the last config on the previous page
+}
+
+export interface ConfigSummaryPage {
+  configs: Record<string, unknown>[];
+  nextCursor: number | null;
+}
+
+export interface GetOrCreateResult {
+  config: WebsiteConfig;
+  created: boolean;
+}
+
+/**
+ * Thrown by createWebsiteConfig/updateWebsiteConfig when another config
+ * already has the name (website_configs_name_unique)
+ */
+export class ConfigNameConflictError extends Error {
+  constructor(public configName: string) {
+    super(`A configuration named "${configName}" already exists`);
+    this.name = 'ConfigNameConflictError';
+  }
+}
+
+// Postgres unique_violation; drivers put the code on the error or its cause
+const isUniqueViolation = (error: any) => error?.code === '23505' || error?.cause?.code === '23505';
+
+const DEFAULT_SUMMARY_LIMIT = 50;
+const MAX_SUMMARY_LIMIT = 500;
+
+export interface IStorage {
   getDefaultWebsiteConfig(): Promise<WebsiteConfig>;
   getWebsiteConfig(id: number): Promise<WebsiteConfig | null>;
+  getWebsiteConfigByName(name: string): Promise<WebsiteConfig | null>;
+  getOrCreateWebsiteConfigByName(name: string, defaults: Omit<InsertWebsiteConfig, 'name'>): Promise<GetOrCreateResult>;
   getAllWebsiteConfigs(): Promise<WebsiteConfig[]>;
+  listWebsiteConfigSummaries(query: ConfigSummaryQuery): Promise<ConfigSummaryPage>;
   createWebsiteConfig(config: InsertWebsiteConfig): Promise<WebsiteConfig>;
   updateWebsiteConfig(id: number, config: InsertWebsiteConfig): Promise<WebsiteConfig | null>;
   deleteWebsiteConfig(id: number): Promise<void>;
   createUser(username: string, password: string): Promise<User>;
 }
 
-class DatabaseStorage implements IStorage {
-  private db: ReturnType<typeof drizzle>;
+export class DatabaseStorage implements IStorage {
+  private db: DatabaseConnection['db'];
+
+  // The lookups behind nearly every request, planned once per connection
+  private configById;
+  private configByName;
 
-  constructor() {
-    const databaseUrl = process.env.DATABASE_URL;
-    if (!databaseUrl) throw new Error('DATABASE_URL is not set');
-    const sql = neon(databaseUrl);
-    this.db = drizzle(sql);
+  constructor(private connection: DatabaseConnection = connectDatabase()) {
+    this.db = connection.db;
+    this.configById = this.db
+      .select()
+      .from(website_configs)
+      .where(eq(website_configs.id, sql.placeholder('id')))
+      .limit(1)
+      .prepare('config_by_id');
+    this.configByName = this.db
+      .select()
+      .from(website_configs)
+      .where(eq(website_configs.name, sql.placeholder('name')))
+      .limit(1)
+      .prepare('config_by_name');
+  }
+
+  /**
+   * Runs several statements as one transaction
+   * neon-http sends them in a single request; the pooled drivers run them in
+   * order on one connection. build gets the handle to build the queries on.
+   */
+  private async batch<T extends unknown[]>(build: (db: DatabaseConnection['db']) => { [K in keyof T]: PromiseLike<T[K]> }): Promise<T> {
+    if (!this.connection.pooled) {
+      return (this.db as unknown as NeonHttpDatabase).batch(build(this.db) as any) as unknown as Promise<T>;
+    }
+    return this.db.transaction(async tx => {
+      const results = [];
+      for (const query of build(tx)) results.push(await query);
+      return results as T;
+    });
+  }
+
+  /**
+   * Closes the pool, if the driver has one (for scripts and tests)
+   */
+  close(): Promise<void> {
+    return this.connection.close();
   }
 
   async getDefaultWebsiteConfig(): Promise<WebsiteConfig> {
     try {
-      const configs = await this.db
-        .select()
-        .from(website_configs)
-        .where(eq(website_configs.id, 1))
-        .limit(1);
+      const configs = await this.configById.execute({ id: 1 });
 
       const config = configs[0];
 
@@ -84,12 +160,7 @@ class DatabaseStorage implements IStorage {
 
   async getWebsiteConfig(id: number): Promise<WebsiteConfig | null> {
     try {
-      const configs = await this.db
-        .select()
-        .from(website_configs)
-        .where(eq(website_configs.id, id))
-        .limit(1);
-
+      const configs = await this.configById.execute({ id });
       return configs[0] || null;
     } catch (error) {
       console.error('Error fetching config:', error);
@@ -97,6 +168,45 @@ class DatabaseStorage implements IStorage {
     }
   }
 
+  // Uses the unique index on name (migrations/0001_unique_config_names.sql)
+  async getWebsiteConfigByName(name: string): Promise<WebsiteConfig | null> {
+    try {
+      const configs = await this.configByName.execute({ name });
+      return configs[0] || null;
+    } catch (error) {
+      console.error('Error fetching config by name:', error);
+      return null;
+    }
+  }
+
+  /**
+   * Config with this name, created from defaults if there is none
+   * An existing config costs the one prepared lookup. Otherwise the insert
+   * and the re-read go in one transaction; the insert does nothing when a
+   * concurrent caller got there first, and the read returns their row.
+   */
+  async getOrCreateWebsiteConfigByName(name: string, defaults: Omit<InsertWebsiteConfig, 'name'>): Promise<GetOrCreateResult> {
+    const [existing] = await this.configByName.execute({ name });
+    if (existing) return { config: existing, created: false };
+
+    try {
+      const [inserted, found] = await this.batch<[WebsiteConfig[], WebsiteConfig[]]>(db => [
+        db.insert(website_configs)
+          .values({ ...defaults, name })
+          .onConflictDoNothing({ target: website_configs.name })
+          .returning(),
+        db.select().from(website_configs).where(eq(website_configs.name, name)).limit(1)
+      ]);
+
+      if (inserted[0]) return { config: inserted[0], created: true };
+      if (found[0]) return { config: found[0], created: false };
+      throw new Error(`Config "${name}" was neither created nor found`);
+    } catch (error) {
+      console.error('Error creating config by name:', error);
+      throw error;
+    }
+  }
+
   async getAllWebsiteConfigs(): Promise<WebsiteConfig[]> {
     try {
       const configs = await this.db.select().from(website_configs);
@@ -107,11 +217,67 @@ class DatabaseStorage implements IStorage {
     }
   }
 
+  /**
+   * Page of client configs, newest first, with only the requested columns
+   * Homepage and demo configs are excluded in SQL (the same rules as
+   * filterClientConfigs), and pages are keyset on id so each one is a short
+   * primary-key index scan however many configs there are.
+   */
+  async listWebsiteConfigSummaries(query: ConfigSummaryQuery): Promise<ConfigSummaryPage> {
+    const limit = Math.min(Math.max(query.limit || DEFAULT_SUMMARY_LIMIT, 1), MAX_SUMMARY_LIMIT);
+    const columns = getTableColumns(website_configs);
+    const approval = website_configs.clientApproval;
+
+    const selection: Record<string, any> = { id: columns.id };
+    for (const field of query.fields?.length ? query.fields : DEFAULT_CONFIG_SUMMARY_FIELDS) {
+      if (field === 'clientApproval') {
+        selection.clientApproval = sql`jsonb_build_object(
+          'isFormEnabled', coalesce((${approval}->>'isFormEnabled')::boolean, false),
+          'formStatus', ${approval}->>'formStatus',
+          'overallApproved', coalesce((${approval}->>'overallApproved')::boolean, false),
+          'lastSavedAt', ${approval}->>'lastSavedAt'
+        )`.as('clientApproval');
+      } else if (field in columns) {
+        selection[field] = columns[field as keyof typeof columns];
+      }
+    }
+
+    const conditions: SQL[] = [
+      ne(website_configs.id, 1),
+      notInArray(website_configs.name, [...ISOLATION_RULES.protectedConfigs]),
+      notLike(website_configs.name, '%demo%'),
+      notLike(website_configs.name, '%Demo%')
+    ];
+    if (query.templateType) conditions.push(eq(website_configs.templateType, query.templateType));
+    if (query.name) conditions.push(ilike(website_configs.name, `%${query.name.replace(/[\\%_]/g, '\\$&')}%`));
+    if (query.cursor !== undefined) conditions.push(lt(website_configs.id, query.cursor));
+
+    try {
+      const rows = await this.db
+        .select(selection)
+        .from(website_configs)
+        .where(and(...conditions))
+        .orderBy(desc(website_configs.id))
+        .limit(limit + 1);
+
+      const hasMore = rows.length > limit;
+      const configs = hasMore ? rows.slice(0, limit) : rows;
+      return {
+        configs,
+        nextCursor: hasMore ? configs[configs.length - 1].id as number : null
+      };
+    } catch (error) {
+      console.error('Error listing config summaries:', error);
+      throw error;
+    }
+  }
+
   async createWebsiteConfig(config: InsertWebsiteConfig): Promise<WebsiteConfig> {
     try {
       const result = await this.db.insert(website_configs).values(config).returning();
       return result[0];
     } catch (error) {
+      if (isUniqueViolation(error)) throw new ConfigNameConflictError(config.name);
       console.error('Error creating config:', error);
       throw error;
     }
@@ -119,13 +285,16 @@ class DatabaseStorage implements IStorage {
 
   async updateWebsiteConfig(id: number, config: InsertWebsiteConfig): Promise<WebsiteConfig | null> {
     try {
+      // Whatever version the caller sent back, the row moves to the next one
       const result = await this.db
         .update(website_configs)
-        .set(config)
+        .set({ ...config, version: sql`${website_configs.version} + 1` })
         .where(eq(website_configs.id, id))
         .returning();
       return result[0] || null;
     } catch (error) {
+      // A rename onto a taken name is the caller's to report, not a missing row
+      if (isUniqueViolation(error)) throw new ConfigNameConflictError(config.name);
       console.error('Error updating config:', error);
       return null;
     }
@@ -152,4 +321,5 @@ class DatabaseStorage implements IStorage {
   }
 }
 
-export const storage = new DatabaseStorage();
+// Website configs are read on nearly every request; see storage-cache.ts
+export const storage = withStorageCache(new DatabaseStorage());
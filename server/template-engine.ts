@@ -0,0 +1,91 @@
+/**
+ * Precompiled string templates for the site generator
+ * A template is a tagged template literal whose holes are either functions
+ * of a render context (slots), plain strings, or other compiled templates.
+ * Compiling happens once, at module load: strings and nested templates are
+ * folded into the surrounding static segments, so rendering only evaluates
+ * the slots and joins. renderBuffer() keeps the static segments pre-encoded
+ * for output that goes straight to a socket or file.
+ *
+ *   const greeting = template<{ name: string }>`<p>Hello ${c => c.name}</p>`;
+ *   greeting.render({ name: 'Ana' });
+ */
+
+export type SlotFn<C> = (ctx: C) => string;
+
+export type Hole<C> = SlotFn<C> | CompiledTemplate<C> | string;
+
+export interface CompiledTemplate<C> {
+  readonly segments: readonly string[];
+  readonly slots: readonly SlotFn<C>[];
+  render(ctx: C): string;
+  renderBuffer(ctx: C): Buffer;
+}
+
+function compileParts<C>(segments: string[], slots: SlotFn<C>[]): CompiledTemplate<C> {
+  const count = slots.length;
+  let segmentBuffers: Buffer[] | null = null;
+  return {
+    segments,
+    slots,
+    render(ctx: C): string {
+      // One join is cheaper than flattening a long chain of += concatenations
+      const parts = new Array<string>(count * 2 + 1);
+      parts[0] = segments[0];
+      for (let i = 0; i < count; i++) {
+        parts[i * 2 + 1] = slots[i](ctx);
+        parts[i * 2 + 2] = segments[i + 1];
+      }
+      return parts.join('');
+    },
+    renderBuffer(ctx: C): Buffer {
+      // Static segments are encoded once; only slot output is encoded per render
+      segmentBuffers ??= segments.map(segment => Buffer.from(segment, 'utf-8'));
+      const parts = new Array<Buffer>(count * 2 + 1);
+      parts[0] = segmentBuffers[0];
+      for (let i = 0; i < count; i++) {
+        parts[i * 2 + 1] = Buffer.from(slots[i](ctx), 'utf-8');
+        parts[i * 2 + 2] = segmentBuffers[i + 1];
+      }
+      return Buffer.concat(parts);
+    }
+  };
+}
+
+/**
+ * Compiles a tagged template literal into static segments and slots
+ */
+export function template<C>(strings: TemplateStringsArray, ...holes: Hole<C>[]): CompiledTemplate<C> {
+  const segments: string[] = [strings[0]];
+  const slots: SlotFn<C>[] = [];
+
+  holes.forEach((hole, i) => {
+    if (typeof hole === 'string') {
+      segments[segments.length - 1] += hole;
+    } else if (typeof hole === 'function') {
+      slots.push(hole);
+      segments.push('');
+    } else {
+      // Inline the nested template's segments and slots
+      segments[segments.length - 1] += hole.segments[0];
+      hole.slots.forEach((slot, j) => {
+        slots.push(slot);
+        segments.push(hole.segments[j + 1]);
+      });
+    }
+    segments[segments.length - 1] += strings[i + 1];
+  });
+
+  return compileParts(segments, slots);
+}
+
+/**
+ * Slot rendering `then` when the test passes, otherwise `otherwise`
+ */
+export function when<C>(test: (ctx: C) => unknown, then: Hole<C>, otherwise: Hole<C> = ''): SlotFn<C> {
+  const renderHole = (hole: Hole<C>): SlotFn<C> =>
+    typeof hole === 'string' ? () => hole : typeof hole === 'function' ? hole : ctx => hole.render(ctx);
+  const renderThen = renderHole(then);
+  const renderOtherwise = renderHole(otherwise);
+  return ctx => test(ctx) ? renderThen(ctx) : renderOtherwise(ctx);
+}
@@ -0,0 +1,35 @@
+/**
+ * Single place the routes report template writes and deletions to
+ * Fans out to the readiness tracker, the list index, the stats counters, the
+ * preview render cache and the per-template static output.
+ */
+
+import { forgetTemplate, markTemplateCreated } from "./template-status";
+import { removeTemplateSummary, upsertTemplateSummary } from "./template-index";
+import { recordTemplateCreated, recordTemplateDeleted } from "./template-stats";
+import { removeStaticFiles } from "./templateGenerator";
+import { invalidateRenderedPages } from "./render-cache";
+
+/**
+ * Call after a template JSON file has been written to templates/
+ */
+export function templateSaved(templateId: string, templateData: any) {
+  markTemplateCreated(templateId);
+  upsertTemplateSummary(templateId, templateData);
+  invalidateRenderedPages(templateId);
+  recordTemplateCreated(templateId, templateData)
+    .catch(error => console.error(`Failed to update stats for template ${templateId}:`, error));
+}
+
+/**
+ * Call after a template JSON file has been removed from templates/
+ */
+export function templateDeleted(templateId: string) {
+  forgetTemplate(templateId);
+  removeTemplateSummary(templateId);
+  invalidateRenderedPages(templateId);
+  recordTemplateDeleted(templateId)
+    .catch(error => console.error(`Failed to update stats for template ${templateId}:`, error));
+  removeStaticFiles(templateId)
+    .catch(error => console.error(`Failed to remove static files for template ${templateId}:`, error));
+}
@@ -0,0 +1,263 @@
+/**
+ * In-memory index of template summaries for the client list
+ * Built once from templates/ on first use, kept current by the write routes
+ * and by a directory watcher for files changed outside the server (corpus
+ * cleanup, manual edits). Queries never touch the disk.
+ */
+
+import fs from "fs";
+import fsp from "fs/promises";
+import path from "path";
+
+export interface TemplateSummary {
+  templateId: string;
+  businessName: string;
+  clientName: string;
+  templateType: string;
+  category: string;
+  location: string;
+  place_id: string;
+  phone: string;
+  address: string;
+  previewUrl: string;
+  createdAt: string;
+  lastModified: string;
+}
+
+export type TemplateSortKey = "createdAt" | "name" | "lastModified";
+
+export interface TemplateQuery {
+  templateType?: string;
+  location?: string;
+  name?: string;
+  sort?: TemplateSortKey;
+  order?: "asc" | "desc";
+  limit?: number;
+  cursor?: string;
+}
+
+export interface TemplatePage {
+  templates: TemplateSummary[];
+  nextCursor: string | null;
+  total: number;
+}
+
+const DEFAULT_LIMIT = 50;
+const MAX_LIMIT = 500;
+const LOAD_CONCURRENCY = 32;
+
+const templatesDir = () => path.resolve(process.cwd(), 'templates');
+
+const summaries = new Map<string, TemplateSummary>();
+const sortedCache = new Map<string, TemplateSummary[]>();
+let loading: Promise<void> | null = null;
+let watcher: fs.FSWatcher | null = null;
+const pendingReloads = new Map<string, NodeJS.Timeout>();
+
+function toSummary(templateId: string, data: any, mtime: Date): TemplateSummary {
+  const location = data.location || data.contactInfo?.location || '';
+  return {
+    templateId,
+    businessName: data.businessName || data.clientName || '',
+    clientName: data.clientName || data.businessName || '',
+    templateType: data.templateType || data.category || '',
+    category: data.category || data.templateType || '',
+    location: typeof location === 'string' ? location : '',
+    place_id: data.place_id || '',
+    phone: data.phone || '',
+    address: data.address || '',
+    previewUrl: data.previewUrl || '',
+    createdAt: data.createdAt || mtime.toISOString(),
+    lastModified: mtime.toISOString()
+  };
+}
+
+function set(summary: TemplateSummary) {
+  summaries.set(summary.templateId, summary);
+  sortedCache.clear();
+}
+
+function remove(templateId: string) {
+  if (summaries.delete(templateId)) sortedCache.clear();
+}
+
+async function readSummary(file: string): Promise<TemplateSummary | null> {
+  const templatePath = path.join(templatesDir(), file);
+  try {
+    const [raw, stats] = await Promise.all([
+      fsp.readFile(templatePath, { encoding: 'utf-8' }),
+      fsp.stat(templatePath)
+    ]);
+    return toSummary(file.replace(/\.json$/, ''), JSON.parse(raw), stats.mtime);
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+      console.error(`Error reading template ${file}:`, error);
+    }
+    return null;
+  }
+}
+
+async function loadAll() {
+  await fsp.mkdir(templatesDir(), { recursive: true });
+  const files = (await fsp.readdir(templatesDir())).filter(file => file.endsWith('.json'));
+
+  summaries.clear();
+  sortedCache.clear();
+  let next = 0;
+  async function worker() {
+    while (next < files.length) {
+      const summary = await readSummary(files[next++]);
+      if (summary) summaries.set(summary.templateId, summary);
+    }
+  }
+  await Promise.all(Array.from({ length: Math.min(LOAD_CONCURRENCY, files.length) }, worker));
+  watchDirectory();
+}
+
+function scheduleReload(file: string) {
+  // Editors and writeFile emit several events per change; reload once
+  clearTimeout(pendingReloads.get(file));
+  pendingReloads.set(file, setTimeout(async () => {
+    pendingReloads.delete(file);
+    const summary = await readSummary(file);
+    if (summary) set(summary);
+    else remove(file.replace(/\.json$/, ''));
+  }, 50));
+}
+
+function watchDirectory() {
+  if (watcher) return;
+  try {
+    watcher = fs.watch(templatesDir(), (_event, filename) => {
+      if (filename && filename.toString().endsWith('.json')) {
+        scheduleReload(filename.toString());
+      }
+    });
+    watcher.on('error', error => {
+      // Fall back to a full rebuild on the next query
+      console.warn('Template index watcher failed, index will be rebuilt:', error);
+      watcher?.close();
+      watcher = null;
+      loading = null;
+    });
+  } catch (error) {
+    console.warn('Template index could not watch templates directory:', error);
+  }
+}
+
+async function ensureLoaded() {
+  if (!loading) {
+    loading = loadAll().catch(error => {
+      loading = null;
+      throw error;
+    });
+  }
+  await loading;
+}
+
+/**
+ * Records a template written by this process (read-your-writes for the list)
+ */
+export function upsertTemplateSummary(templateId: string, data: any) {
+  if (!loading) return; // Not built yet; the first query will read it from disk
+  set(toSummary(templateId, data, new Date()));
+}
+
+export function removeTemplateSummary(templateId: string) {
+  remove(templateId);
+}
+
+function sortValue(summary: TemplateSummary, sort: TemplateSortKey): string {
+  if (sort === "name") return summary.businessName.toLowerCase();
+  if (sort === "lastModified") return summary.lastModified;
+  return summary.createdAt;
+}
+
+function compare(a: [string, string], b: [string, string]): number {
+  if (a[0] !== b[0]) return a[0] < b[0] ? -1 : 1;
+  return a[1] < b[1] ? -1 : a[1] > b[1] ? 1 : 0;
+}
+
+function sorted(sort: TemplateSortKey, order: "asc" | "desc"): TemplateSummary[] {
+  const cacheKey = `${sort}:${order}`;
+  let list = sortedCache.get(cacheKey);
+  if (!list) {
+    const direction = order === "asc" ? 1 : -1;
+    list = Array.from(summaries.values()).sort((a, b) =>
+      direction * compare([sortValue(a, sort), a.templateId], [sortValue(b, sort), b.templateId])
+    );
+    sortedCache.set(cacheKey, list);
+  }
+  return list;
+}
+
+function encodeCursor(summary: TemplateSummary, sort: TemplateSortKey): string {
+  return Buffer.from(JSON.stringify([sortValue(summary, sort), summary.templateId])).toString('base64url');
+}
+
+function decodeCursor(cursor: string): [string, string] | null {
+  try {
+    const value = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf-8'));
+    return Array.isArray(value) && value.length === 2 ? [String(value[0]), String(value[1])] : null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Filtered, sorted page of template summaries
+ * Cursors are keyset positions, so pages stay stable while templates are added
+ */
+export async function queryTemplates(query: TemplateQuery): Promise<TemplatePage> {
+  await ensureLoaded();
+
+  const sort = query.sort || "createdAt";
+  const order = query.order || (sort === "name" ? "asc" : "desc");
+  const limit = Math.min(Math.max(query.limit || DEFAULT_LIMIT, 1), MAX_LIMIT);
+  const templateType = query.templateType?.toLowerCase();
+  const location = query.location?.toLowerCase();
+  const name = query.name?.toLowerCase();
+
+  const list = sorted(sort, order);
+  let start = 0;
+  if (query.cursor) {
+    const position = decodeCursor(query.cursor);
+    if (!position) throw new Error('Invalid cursor');
+    // Binary search for the first entry after the cursor position
+    const direction = order === "asc" ? 1 : -1;
+    let lo = 0;
+    let hi = list.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      const item = list[mid];
+      if (direction * compare([sortValue(item, sort), item.templateId], position) <= 0) lo = mid + 1;
+      else hi = mid;
+    }
+    start = lo;
+  }
+
+  const matches = (summary: TemplateSummary) =>
+    (!templateType || summary.templateType.toLowerCase() === templateType || summary.category.toLowerCase() === templateType) &&
+    (!location || summary.location.toLowerCase() === location) &&
+    (!name || summary.businessName.toLowerCase().includes(name) || summary.clientName.toLowerCase().includes(name));
+
+  const filtering = !!(templateType || location || name);
+  const page: TemplateSummary[] = [];
+  let i = start;
+  for (; i < list.length && page.length < limit; i++) {
+    if (!filtering || matches(list[i])) page.push(list[i]);
+  }
+  let hasMore = false;
+  for (; i < list.length; i++) {
+    if (!filtering || matches(list[i])) {
+      hasMore = true;
+      break;
+    }
+  }
+
+  return {
+    templates: page,
+    nextCursor: hasMore && page.length > 0 ? encodeCursor(page[page.length - 1], sort) : null,
+    total: filtering ? list.filter(matches).length : list.length
+  };
+}
@@ -0,0 +1,249 @@
+/**
+ * Incrementally maintained template counters for /api/agent/stats
+ * Counts by templateType, location and creation time are updated when
+ * templates are created or deleted and persisted to data/template-stats.json,
+ * so the stats endpoint never scans templates/. A per-template membership map
+ * keeps updates idempotent and lets deletions decrement the right buckets.
+ *
+ * Rebuild from disk with `npm run stats:rebuild` or POST /api/agent/stats/rebuild.
+ */
+
+import fs from "fs/promises";
+import path from "path";
+
+interface Member {
+  templateType: string;
+  location: string;
+  createdAt: string;
+}
+
+interface StatsState {
+  version: 1;
+  totalTemplates: number;
+  templateTypes: Record<string, number>;
+  locations: Record<string, number>;
+  daily: Record<string, number>;   // YYYY-MM-DD
+  hourly: Record<string, number>;  // YYYY-MM-DDTHH, last HOURLY_RETENTION_HOURS only
+  members: Record<string, Member>;
+  rebuiltAt: string | null;
+  lastUpdated: string;
+}
+
+// Labels reported by /api/agent/stats, keyed by stored templateType
+export const CATEGORY_LABELS: Record<string, string> = {
+  "professionals": "Professionals",
+  "services": "Services",
+  "restaurants": "Restaurants",
+  "tourism": "Tourist Businesses",
+  "retail": "Retail"
+};
+
+export const TRACKED_LOCATIONS = ["Chetumal", "Bacalar", "Cancun", "Quintana Roo", "Yucatan"];
+
+const HOURLY_RETENTION_HOURS = 48;
+const PERSIST_DELAY_MS = 1000;
+
+const statsFile = () => path.resolve(process.cwd(), process.env.TEMPLATE_STATS_FILE || 'data/template-stats.json');
+const templatesDir = () => path.resolve(process.cwd(), 'templates');
+
+let state: StatsState | null = null;
+let loading: Promise<StatsState> | null = null;
+let persistTimer: NodeJS.Timeout | null = null;
+
+function emptyState(): StatsState {
+  return {
+    version: 1,
+    totalTemplates: 0,
+    templateTypes: {},
+    locations: {},
+    daily: {},
+    hourly: {},
+    members: {},
+    rebuiltAt: null,
+    lastUpdated: new Date().toISOString()
+  };
+}
+
+function bump(counts: Record<string, number>, key: string, delta: number) {
+  if (!key) return;
+  const next = (counts[key] || 0) + delta;
+  if (next > 0) counts[key] = next;
+  else delete counts[key];
+}
+
+function timeBuckets(createdAt: string): { day: string; hour: string } {
+  const date = new Date(createdAt);
+  const iso = isNaN(date.getTime()) ? new Date().toISOString() : date.toISOString();
+  return { day: iso.slice(0, 10), hour: iso.slice(0, 13) };
+}
+
+function pruneHourly(target: StatsState) {
+  const cutoff = new Date(Date.now() - HOURLY_RETENTION_HOURS * 3600 * 1000).toISOString().slice(0, 13);
+  for (const hour of Object.keys(target.hourly)) {
+    if (hour < cutoff) delete target.hourly[hour];
+  }
+}
+
+function apply(target: StatsState, templateId: string, member: Member | null) {
+  const previous = target.members[templateId];
+  if (previous) {
+    const { day, hour } = timeBuckets(previous.createdAt);
+    target.totalTemplates -= 1;
+    bump(target.templateTypes, previous.templateType, -1);
+    bump(target.locations, previous.location, -1);
+    bump(target.daily, day, -1);
+    bump(target.hourly, hour, -1);
+    delete target.members[templateId];
+  }
+  if (member) {
+    const { day, hour } = timeBuckets(member.createdAt);
+    target.totalTemplates += 1;
+    bump(target.templateTypes, member.templateType, 1);
+    bump(target.locations, member.location, 1);
+    bump(target.daily, day, 1);
+    bump(target.hourly, hour, 1);
+    target.members[templateId] = member;
+  }
+  target.lastUpdated = new Date().toISOString();
+}
+
+function toMember(data: any): Member {
+  return {
+    templateType: typeof data?.templateType === 'string' ? data.templateType : '',
+    location: typeof data?.location === 'string' ? data.location : '',
+    createdAt: typeof data?.createdAt === 'string' ? data.createdAt : new Date().toISOString()
+  };
+}
+
+async function persist() {
+  if (!state) return;
+  const file = statsFile();
+  await fs.mkdir(path.dirname(file), { recursive: true });
+  // Write-then-rename so a crash never leaves a half-written counter file
+  const tmp = `${file}.${process.pid}.tmp`;
+  await fs.writeFile(tmp, JSON.stringify(state));
+  await fs.rename(tmp, file);
+}
+
+function schedulePersist() {
+  if (persistTimer) return;
+  persistTimer = setTimeout(() => {
+    persistTimer = null;
+    persist().catch(error => console.error("Agent: Failed to persist template stats:", error));
+  }, PERSIST_DELAY_MS);
+}
+
+/**
+ * Recounts everything from templates/ and replaces the persisted counters
+ */
+export async function rebuildTemplateStats(): Promise<StatsState> {
+  const fresh = emptyState();
+  let files: string[] = [];
+  try {
+    files = (await fs.readdir(templatesDir())).filter(file => file.endsWith('.json'));
+  } catch {
+    // No templates directory yet
+  }
+
+  let next = 0;
+  async function worker() {
+    while (next < files.length) {
+      const file = files[next++];
+      try {
+        const data = JSON.parse(await fs.readFile(path.join(templatesDir(), file), 'utf-8'));
+        apply(fresh, file.replace(/\.json$/, ''), toMember(data));
+      } catch (fileError) {
+        // Unreadable files still count towards the total, as before
+        console.error(`Agent: Error reading template ${file}:`, fileError);
+        apply(fresh, file.replace(/\.json$/, ''), toMember(null));
+      }
+    }
+  }
+  await Promise.all(Array.from({ length: Math.min(32, files.length) }, worker));
+
+  fresh.rebuiltAt = new Date().toISOString();
+  pruneHourly(fresh);
+  state = fresh;
+  await persist();
+  return fresh;
+}
+
+async function loadState(): Promise<StatsState> {
+  try {
+    const persisted = JSON.parse(await fs.readFile(statsFile(), 'utf-8')) as StatsState;
+    if (persisted.version !== 1) throw new Error(`unsupported stats version ${persisted.version}`);
+    state = persisted;
+
+    // Files removed or added while the server was down (corpus cleanup, manual
+    // copies) show up as a count mismatch; a readdir is cheap, a rebuild is not
+    const files = (await fs.readdir(templatesDir()).catch(() => [] as string[])).filter(f => f.endsWith('.json'));
+    if (files.length !== persisted.totalTemplates) {
+      console.log(`Agent: Template stats out of date (${persisted.totalTemplates} counted, ${files.length} on disk), rebuilding`);
+      return await rebuildTemplateStats();
+    }
+    return persisted;
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+      console.warn("Agent: Template stats unreadable, rebuilding:", error);
+    }
+    return await rebuildTemplateStats();
+  }
+}
+
+async function ensureState(): Promise<StatsState> {
+  if (state) return state;
+  if (!loading) {
+    loading = loadState().finally(() => { loading = null; });
+  }
+  return loading;
+}
+
+export async function recordTemplateCreated(templateId: string, data: any) {
+  const target = await ensureState();
+  apply(target, templateId, toMember(data));
+  schedulePersist();
+}
+
+export async function recordTemplateDeleted(templateId: string) {
+  const target = await ensureState();
+  apply(target, templateId, null);
+  schedulePersist();
+}
+
+/**
+ * Stats in the /api/agent/stats response shape, computed from the counters only
+ */
+export async function getTemplateStats(days: number = 30) {
+  const current = await ensureState();
+  pruneHourly(current);
+
+  const categoryBreakdown: Record<string, number> = {};
+  for (const [templateType, label] of Object.entries(CATEGORY_LABELS)) {
+    categoryBreakdown[label] = current.templateTypes[templateType] || 0;
+  }
+  const locationBreakdown: Record<string, number> = {};
+  for (const location of TRACKED_LOCATIONS) {
+    locationBreakdown[location] = current.locations[location] || 0;
+  }
+
+  const creationsByDay: Record<string, number> = {};
+  for (let i = days - 1; i >= 0; i--) {
+    const day = new Date(Date.now() - i * 86400 * 1000).toISOString().slice(0, 10);
+    creationsByDay[day] = current.daily[day] || 0;
+  }
+  const creationsByHour: Record<string, number> = {};
+  for (let i = 23; i >= 0; i--) {
+    const hour = new Date(Date.now() - i * 3600 * 1000).toISOString().slice(0, 13);
+    creationsByHour[hour] = current.hourly[hour] || 0;
+  }
+
+  return {
+    totalTemplates: current.totalTemplates,
+    categoryBreakdown,
+    locationBreakdown,
+    creationsByDay,
+    creationsByHour,
+    countersRebuiltAt: current.rebuiltAt,
+    lastUpdated: new Date().toISOString()
+  };
+}
@@ -0,0 +1,176 @@
+/**
+ * Template lifecycle tracking and readiness long-polling
+ */
+
+import type { Express, Request, Response } from "express";
+import { EventEmitter } from "events";
+import fs from "fs/promises";
+import path from "path";
+
+export type TemplateStage = "created" | "rendered" | "static";
+
+interface TemplateState {
+  createdAt?: string;
+  renderedAt?: string;
+  outputDir?: string;
+  version: number;
+}
+
+export interface TemplateStatus {
+  templateId: string;
+  created: boolean;
+  rendered: boolean;
+  staticFiles: boolean;
+  createdAt: string | null;
+  renderedAt: string | null;
+  version: number;
+}
+
+const STAGES: TemplateStage[] = ["created", "rendered", "static"];
+const MAX_WAIT_MS = 30000;
+
+const states = new Map<string, TemplateState>();
+const events = new EventEmitter();
+events.setMaxListeners(0);
+
+function touch(templateId: string, update: Partial<TemplateState>) {
+  const state = states.get(templateId) || { version: 0 };
+  Object.assign(state, update);
+  state.version += 1;
+  states.set(templateId, state);
+  events.emit(templateId);
+}
+
+/**
+ * Records that a template JSON file has been written
+ */
+export function markTemplateCreated(templateId: string) {
+  touch(templateId, { createdAt: new Date().toISOString() });
+}
+
+/**
+ * Records that a template was rendered, and where its static files went if
+ * any were written (previews render to memory only)
+ */
+export function markTemplateRendered(templateId: string, outputDir?: string) {
+  const renderedAt = new Date().toISOString();
+  touch(templateId, outputDir ? { renderedAt, outputDir } : { renderedAt });
+}
+
+/**
+ * Drops tracking for a deleted template and wakes any waiters
+ */
+export function forgetTemplate(templateId: string) {
+  states.delete(templateId);
+  events.emit(templateId);
+}
+
+async function exists(filePath: string): Promise<boolean> {
+  try {
+    await fs.access(filePath);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+/**
+ * Current status of a template, checked against the filesystem
+ * Templates created before this process started are still reported as created
+ */
+export async function getTemplateStatus(templateId: string): Promise<TemplateStatus> {
+  const state = states.get(templateId);
+  const templatePath = path.join(path.resolve(process.cwd(), 'templates'), `${templateId}.json`);
+  const created = await exists(templatePath);
+  const rendered = created && !!state?.renderedAt;
+  const staticFiles = rendered && !!state?.outputDir && await exists(path.join(state.outputDir, 'index.html'));
+
+  return {
+    templateId,
+    created,
+    rendered,
+    staticFiles,
+    createdAt: state?.createdAt || null,
+    renderedAt: state?.renderedAt || null,
+    version: state?.version || 0
+  };
+}
+
+function reached(status: TemplateStatus, stage: TemplateStage): boolean {
+  if (stage === "static") return status.staticFiles;
+  if (stage === "rendered") return status.rendered;
+  return status.created;
+}
+
+/**
+ * Resolves once the template reaches `stage` or its version moves past
+ * `sinceVersion`, or when the timeout expires (whichever comes first)
+ */
+export async function waitForTemplate(
+  templateId: string,
+  stage: TemplateStage | null,
+  sinceVersion: number | null,
+  timeoutMs: number
+): Promise<TemplateStatus> {
+  const done = (status: TemplateStatus) =>
+    (stage !== null && reached(status, stage)) ||
+    (sinceVersion !== null && status.version > sinceVersion);
+
+  const deadline = Date.now() + timeoutMs;
+  let status = await getTemplateStatus(templateId);
+
+  while (!done(status) && Date.now() < deadline) {
+    await new Promise<void>(resolve => {
+      const timer = setTimeout(finish, Math.min(1000, deadline - Date.now()));
+      function finish() {
+        clearTimeout(timer);
+        events.removeListener(templateId, finish);
+        resolve();
+      }
+      events.once(templateId, finish);
+    });
+    // Re-check the filesystem at least once a second so files written by
+    // other processes are picked up without a notification
+    status = await getTemplateStatus(templateId);
+  }
+
+  return status;
+}
+
+export function registerTemplateStatusRoutes(app: Express) {
+  // Template readiness, optionally long-polling until a stage is reached:
+  // GET /api/templates/:id/status?wait=rendered&timeout=10000
+  // GET /api/templates/:id/status?since=3 (returns on the next change)
+  app.get("/api/templates/:id/status", async (req: Request, res: Response) => {
+    try {
+      const templateId = req.params.id;
+      const wait = typeof req.query.wait === 'string' ? req.query.wait : null;
+      const since = typeof req.query.since === 'string' ? parseInt(req.query.since, 10) : null;
+
+      if (wait !== null && !STAGES.includes(wait as TemplateStage)) {
+        return res.status(400).json({ error: "Invalid wait stage", allowed: STAGES });
+      }
+
+      const requestedTimeout = parseInt(String(req.query.timeout ?? ''), 10);
+      const timeoutMs = wait || since !== null
+        ? Math.min(isNaN(requestedTimeout) ? 10000 : Math.max(0, requestedTimeout), MAX_WAIT_MS)
+        : 0;
+
+      const status = await waitForTemplate(
+        templateId,
+        wait as TemplateStage | null,
+        since !== null && !isNaN(since) ? since : null,
+        timeoutMs
+      );
+
+      res.setHeader('Cache-Control', 'no-store');
+      res.json({
+        ...status,
+        ready: wait ? reached(status, wait as TemplateStage) : status.created
+      });
+    } catch (error) {
+      console.error('Error reading template status:', error);
+      res.status(500).json({ error: 'Failed to read template status' });
+    }
+  });
+}
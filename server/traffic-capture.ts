@@ -0,0 +1,82 @@
+/**
+ * Records inbound webhook traffic as JSONL for replay against staging
+ * Enabled by setting TRAFFIC_CAPTURE_FILE; each line holds the request, its
+ * arrival time and the response that was sent, so `python -m websitio.replay`
+ * can reproduce the original burst and compare responses.
+ */
+
+import type { Request, Response, NextFunction } from "express";
+import fs from "fs";
+import path from "path";
+
+const DEFAULT_CAPTURE_PATHS = [
+  "/api/make/auto-create",
+  "/api/agent/create-template",
+  "/api/notify"
+];
+
+export interface CapturedExchange {
+  ts: number;
+  capturedAt: string;
+  method: string;
+  path: string;
+  query: Record<string, any>;
+  contentType: string;
+  body: any;
+  response: {
+    status: number;
+    durationMs: number;
+    body: any;
+  };
+}
+
+/**
+ * Returns the capture middleware, or null when capture is not configured
+ */
+export function createTrafficCapture(
+  captureFile = process.env.TRAFFIC_CAPTURE_FILE,
+  capturePaths = (process.env.TRAFFIC_CAPTURE_PATHS || DEFAULT_CAPTURE_PATHS.join(",")).split(",").map(p => p.trim())
+) {
+  if (!captureFile) return null;
+
+  const filePath = path.resolve(process.cwd(), captureFile);
+  fs.mkdirSync(path.dirname(filePath), { recursive: true });
+  // One append stream keeps lines in arrival order without blocking requests
+  const stream = fs.createWriteStream(filePath, { flags: "a" });
+  stream.on("error", error => console.error("Traffic capture write failed:", error));
+
+  return function trafficCapture(req: Request, res: Response, next: NextFunction) {
+    if (req.method !== "POST" || !capturePaths.includes(req.path)) {
+      return next();
+    }
+
+    const start = Date.now();
+    let responseBody: any = undefined;
+
+    const originalResJson = res.json;
+    res.json = function (bodyJson, ...args) {
+      responseBody = bodyJson;
+      return originalResJson.apply(res, [bodyJson, ...args]);
+    };
+
+    res.on("finish", () => {
+      const exchange: CapturedExchange = {
+        ts: start,
+        capturedAt: new Date(start).toISOString(),
+        method: req.method,
+        path: req.path,
+        query: req.query,
+        contentType: req.headers["content-type"] || "",
+        body: req.body,
+        response: {
+          status: res.statusCode,
+          durationMs: Date.now() - start,
+          body: responseBody ?? null
+        }
+      };
+      stream.write(JSON.stringify(exchange) + "\n");
+    });
+
+    next();
+  };
+}
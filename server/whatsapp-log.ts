@@ -0,0 +1,337 @@
+/**
+ * Append-only WhatsApp message log
+ * Entries are appended to JSONL segments in whatsapp-logs/segments/, rotated
+ * by size, and indexed in memory by campaign and templateId. Every entry gets
+ * a monotonically increasing `seq`, which doubles as the pagination cursor.
+ * Legacy one-file-per-template logs (<templateId>_whatsapp.json) are imported
+ * on first start and moved to whatsapp-logs/legacy/.
+ */
+
+import fs from "fs";
+import fsp from "fs/promises";
+import path from "path";
+import readline from "readline";
+import type { Writable } from "stream";
+
+export interface WhatsAppLogEntry {
+  seq: number;
+  templateId: string;
+  businessName: string;
+  phone: string;
+  message: string;
+  scheduledTime: string;
+  campaign: string;
+  location: string;
+  loggedAt: string;
+  status: string;
+  googleSheetsReady: boolean;
+}
+
+export interface WhatsAppLogQuery {
+  campaign?: string;
+  templateId?: string;
+  since?: string;   // loggedAt lower bound (inclusive)
+  until?: string;   // loggedAt upper bound (exclusive)
+  order?: "asc" | "desc";
+  limit?: number;
+  cursor?: number;  // seq of the last entry of the previous page
+}
+
+const DEFAULT_LIMIT = 100;
+const MAX_LIMIT = 1000;
+const SEGMENT_MAX_BYTES = parseInt(process.env.WHATSAPP_LOG_SEGMENT_BYTES || '', 10) || 8 * 1024 * 1024;
+
+const logsDir = () => path.resolve(process.cwd(), 'whatsapp-logs');
+const segmentsDir = () => path.join(logsDir(), 'segments');
+const segmentName = (n: number) => `segment-${String(n).padStart(6, '0')}.jsonl`;
+
+// Entries in seq order, plus positions into it per campaign and template
+const entries: WhatsAppLogEntry[] = [];
+const byCampaign = new Map<string, number[]>();
+const byTemplate = new Map<string, number[]>();
+
+let currentSegment = 1;
+let currentSegmentBytes = 0;
+let nextSeq = 1;
+let loading: Promise<void> | null = null;
+let writeChain: Promise<unknown> = Promise.resolve();
+
+function indexEntry(entry: WhatsAppLogEntry) {
+  const position = entries.length;
+  entries.push(entry);
+  for (const [map, key] of [[byCampaign, entry.campaign], [byTemplate, entry.templateId]] as const) {
+    const positions = map.get(key);
+    if (positions) positions.push(position);
+    else map.set(key, [position]);
+  }
+  nextSeq = Math.max(nextSeq, entry.seq + 1);
+}
+
+async function readSegment(file: string) {
+  const lines = readline.createInterface({
+    input: fs.createReadStream(path.join(segmentsDir(), file), { encoding: 'utf-8' }),
+    crlfDelay: Infinity
+  });
+  for await (const line of lines) {
+    if (!line.trim()) continue;
+    try {
+      indexEntry(JSON.parse(line));
+    } catch {
+      // A corrupt line; the rest of the log is intact (a torn final line is
+      // truncated by load() before the segment is read)
+      console.warn(`Skipping unreadable WhatsApp log line in ${file}`);
+    }
+  }
+}
+
+async function listSegments(): Promise<string[]> {
+  await fsp.mkdir(segmentsDir(), { recursive: true });
+  return (await fsp.readdir(segmentsDir())).filter(f => /^segment-\d+\.jsonl$/.test(f)).sort();
+}
+
+function alreadyLogged(entry: Omit<WhatsAppLogEntry, 'seq'>) {
+  return (byTemplate.get(entry.templateId) || []).some(position => entries[position].loggedAt === entry.loggedAt);
+}
+
+/**
+ * Moves legacy files into the segmented log, oldest entry first
+ * Each file is moved to legacy/ as soon as its entry is appended, and
+ * entries already in the log (same templateId and loggedAt) are skipped, so
+ * an import interrupted at any point can simply run again on the next start.
+ */
+async function importLegacyLogs() {
+  const files = (await fsp.readdir(logsDir())).filter(file => file.endsWith('_whatsapp.json'));
+  if (files.length === 0) return;
+
+  const legacy: { file: string; entry: Omit<WhatsAppLogEntry, 'seq'> }[] = [];
+  for (const file of files) {
+    try {
+      legacy.push({ file, entry: JSON.parse(await fsp.readFile(path.join(logsDir(), file), 'utf-8')) });
+    } catch (fileError) {
+      console.error(`Error reading log ${file}:`, fileError);
+    }
+  }
+  legacy.sort((a, b) => new Date(a.entry.loggedAt).getTime() - new Date(b.entry.loggedAt).getTime());
+
+  const legacyDir = path.join(logsDir(), 'legacy');
+  await fsp.mkdir(legacyDir, { recursive: true });
+  let imported = 0;
+  for (const { file, entry } of legacy) {
+    if (!alreadyLogged(entry)) {
+      await append(entry);
+      imported += 1;
+    }
+    await fsp.rename(path.join(logsDir(), file), path.join(legacyDir, file));
+  }
+  console.log(`Imported ${imported} legacy WhatsApp logs into the segmented log`);
+}
+
+/**
+ * Cuts a torn final line (a crash mid-append) off the end of a segment, so
+ * the next append starts on a line of its own; returns the segment's size
+ */
+async function truncateTornLine(file: string): Promise<number> {
+  const handle = await fsp.open(path.join(segmentsDir(), file), 'r+');
+  try {
+    const { size } = await handle.stat();
+    const chunk = Buffer.alloc(64 * 1024);
+    let end = size;
+    while (end > 0) {
+      const start = Math.max(end - chunk.length, 0);
+      const { bytesRead } = await handle.read(chunk, 0, end - start, start);
+      const newline = chunk.subarray(0, bytesRead).lastIndexOf(0x0a);
+      if (newline >= 0) {
+        end = start + newline + 1;
+        break;
+      }
+      end = start;
+    }
+    if (end < size) {
+      await handle.truncate(end);
+      console.warn(`Truncated a torn final line in WhatsApp log ${file}`);
+    }
+    return end;
+  } finally {
+    await handle.close();
+  }
+}
+
+async function load() {
+  const segments = await listSegments();
+  if (segments.length > 0) {
+    const last = segments[segments.length - 1];
+    currentSegment = parseInt(last.match(/\d+/)![0], 10);
+    currentSegmentBytes = await truncateTornLine(last);
+  }
+  for (const file of segments) {
+    await readSegment(file);
+  }
+  await importLegacyLogs();
+}
+
+async function ensureLoaded() {
+  if (!loading) {
+    loading = load().catch(error => {
+      loading = null;
+      throw error;
+    });
+  }
+  await loading;
+}
+
+async function append(data: Omit<WhatsAppLogEntry, 'seq'>): Promise<WhatsAppLogEntry> {
+  const entry = { seq: nextSeq++, ...data } as WhatsAppLogEntry;
+  const line = JSON.stringify(entry) + "\n";
+  const bytes = Buffer.byteLength(line);
+
+  if (currentSegmentBytes > 0 && currentSegmentBytes + bytes > SEGMENT_MAX_BYTES) {
+    currentSegment += 1;
+    currentSegmentBytes = 0;
+  }
+  await fsp.appendFile(path.join(segmentsDir(), segmentName(currentSegment)), line);
+  currentSegmentBytes += bytes;
+  indexEntry(entry);
+  return entry;
+}
+
+/**
+ * Appends an entry; writes are serialized so seq order matches file order
+ */
+export async function appendWhatsAppLog(data: Omit<WhatsAppLogEntry, 'seq'>): Promise<WhatsAppLogEntry> {
+  await ensureLoaded();
+  const result = writeChain.then(() => append(data));
+  writeChain = result.catch(() => undefined);
+  return result;
+}
+
+function matchesRange(entry: WhatsAppLogEntry, query: WhatsAppLogQuery) {
+  return (!query.since || entry.loggedAt >= query.since) && (!query.until || entry.loggedAt < query.until);
+}
+
+function candidatePositions(query: WhatsAppLogQuery): number[] | null {
+  if (query.campaign && query.templateId) {
+    const campaign = byCampaign.get(query.campaign) || [];
+    const template = new Set(byTemplate.get(query.templateId) || []);
+    return campaign.filter(position => template.has(position));
+  }
+  if (query.campaign) return byCampaign.get(query.campaign) || [];
+  if (query.templateId) return byTemplate.get(query.templateId) || [];
+  return null; // every entry
+}
+
+/**
+ * Page of log entries, newest first by default
+ */
+export async function queryWhatsAppLogs(query: WhatsAppLogQuery) {
+  await ensureLoaded();
+
+  const limit = Math.min(Math.max(query.limit || DEFAULT_LIMIT, 1), MAX_LIMIT);
+  const descending = query.order !== "asc";
+  const positions = candidatePositions(query);
+  const count = positions ? positions.length : entries.length;
+  const at = (i: number) => entries[positions ? positions[i] : i];
+
+  // Positions are in seq order, so the cursor is found by binary search
+  let lo = 0;
+  let hi = count;
+  if (query.cursor !== undefined) {
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (at(mid).seq < query.cursor) lo = mid + 1;
+      else hi = mid;
+    }
+    if (descending) {
+      hi = lo;
+      lo = 0;
+    } else {
+      lo = lo < count && at(lo).seq === query.cursor ? lo + 1 : lo;
+      hi = count;
+    }
+  }
+
+  const page: WhatsAppLogEntry[] = [];
+  let hasMore = false;
+  for (let step = 0; step < hi - lo; step++) {
+    const entry = at(descending ? hi - 1 - step : lo + step);
+    if (!matchesRange(entry, query)) continue;
+    if (page.length === limit) {
+      hasMore = true;
+      break;
+    }
+    page.push(entry);
+  }
+
+  return {
+    logs: page,
+    nextCursor: hasMore ? page[page.length - 1].seq : null
+  };
+}
+
+/**
+ * Counts per campaign, O(1) from the index
+ */
+export async function getWhatsAppLogCounts() {
+  await ensureLoaded();
+  const campaigns: Record<string, number> = {};
+  byCampaign.forEach((positions, campaign) => {
+    campaigns[campaign] = positions.length;
+  });
+  return { total: entries.length, campaigns };
+}
+
+const CSV_COLUMNS: (keyof WhatsAppLogEntry)[] = [
+  "seq", "loggedAt", "templateId", "businessName", "phone", "campaign",
+  "scheduledTime", "location", "status", "message"
+];
+
+function csvField(value: unknown): string {
+  const text = value === undefined || value === null ? '' : String(value);
+  return /[",\n\r]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+/**
+ * Streams matching entries straight from the segment files in seq order,
+ * honouring backpressure, so exports never build the whole log in memory
+ */
+export async function exportWhatsAppLogs(out: Writable, query: WhatsAppLogQuery, format: "jsonl" | "csv") {
+  await ensureLoaded();
+  await writeChain;
+
+  // Resolves on close too, so a client hanging up mid-export doesn't stall us
+  const write = (chunk: string) => new Promise<void>(resolve => {
+    if (out.write(chunk)) return resolve();
+    const done = () => {
+      out.off('drain', done);
+      out.off('close', done);
+      resolve();
+    };
+    out.on('drain', done);
+    out.on('close', done);
+  });
+
+  if (format === "csv") await write(CSV_COLUMNS.join(',') + "\n");
+  for (const file of await listSegments()) {
+    const input = fs.createReadStream(path.join(segmentsDir(), file), { encoding: 'utf-8' });
+    const lines = readline.createInterface({ input, crlfDelay: Infinity });
+    for await (const line of lines) {
+      if (out.destroyed) {
+        input.destroy();
+        return;
+      }
+      if (!line.trim()) continue;
+      let entry: WhatsAppLogEntry;
+      try {
+        entry = JSON.parse(line);
+      } catch {
+        continue;
+      }
+      if (query.campaign && entry.campaign !== query.campaign) continue;
+      if (query.templateId && entry.templateId !== query.templateId) continue;
+      if (!matchesRange(entry, query)) continue;
+      await write(format === "csv"
+        ? CSV_COLUMNS.map(column => csvField(entry[column])).join(',') + "\n"
+        : line + "\n");
+    }
+  }
+  out.end();
+}
@@ -5,7 +5,7 @@ import { z } from "zod";
 // Define the Website configuration schema
 export const websiteConfigs = pgTable("website_configs", {
   id: serial("id").primaryKey(),
-  name: text("name").notNull(),
+  name: text("name").notNull().unique(),
   templateType: text("template_type").default("professionals").notNull(),
   logo: text("logo"),
   heroImage: text("hero_image"),
@@ -383,6 +383,8 @@ export const websiteConfigs = pgTable("website_configs", {
   // Timestamp fields
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
+  // Bumped by every update; GET /api/config/:id derives its ETag from it
+  version: integer("version").default(1).notNull(),
 });
 
 // Define insert schema
@@ -390,6 +392,7 @@ export const insertWebsiteConfigSchema = createInsertSchema(websiteConfigs).omit
   id: true,
   createdAt: true,
   updatedAt: true,
+  version: true,
 });
 
 export type InsertWebsiteConfig = z.infer<typeof insertWebsiteConfigSchema>;
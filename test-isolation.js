@@ -71,7 +71,7 @@ async function testConfigIsolation() {
   try {
     const response = await fetch(`${baseUrl}/api/configs`);
     if (response.ok) {
-      const data = await response.json();
+      const { configs: data } = await response.json();
       const hasHomepage = data.some(config => config.name === 'WebSitioPro Homepage');
       const hasDemo = data.some(config => config.name?.includes('demo'));
       
@@ -3,17 +3,16 @@
 Test /api/test endpoint with specified payload
 """
 
-import requests
 import json
 
+from websitio import get_client
+
+client = get_client()
+
 def test_api_endpoint():
     """Test the /api/test endpoint with the specified payload"""
     
-    # Test both local and external URLs
-    urls = [
-        "http://localhost:5000/api/test",
-        "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev/api/test"
-    ]
+    urls = [client.url("/api/test")]
     
     payload = {
         "name": "Tulum Bakery",
@@ -34,7 +33,7 @@ def test_api_endpoint():
         print(f"\nTest {i}: {url}")
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = client.post(url, json=payload, headers=headers, timeout=30)
             
             print(f"Status Code: {response.status_code}")
             print(f"Response Headers: {dict(response.headers)}")
@@ -3,14 +3,15 @@
 Test the latest Facebook CDN cover image fix with enhanced debugging
 """
 
-import requests
 import time
 
+from websitio import ApiError, get_client
+
+client = get_client()
+
 def test_cover_image_fix():
     """Test the new cover image approach with enhanced debugging"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
-    
     # Create a new template to test the cover image fix
     timestamp = int(time.time())
     payload = {
@@ -28,22 +29,22 @@ def test_cover_image_fix():
     print(f"Creating template: cover_test_{timestamp}")
     
     # Create template
-    response = requests.post(f"{base_url}/api/make/auto-create", json=payload, timeout=30)
-    if response.status_code != 200:
-        print(f"✗ Template creation failed: {response.status_code}")
+    try:
+        template_data = client.auto_create(payload)
+    except ApiError as e:
+        print(f"✗ Template creation failed: {e.status_code}")
         return False
         
-    template_data = response.json()
     template_id = template_data.get('templateId')
     print(f"✓ Template created: {template_id}")
     
     # Wait for template to be ready
-    time.sleep(2)
+    client.wait_until_ready(template_id)
     
     # 1. Check template JSON data
     print("\n1. Checking template JSON data...")
     try:
-        response = requests.get(f"{base_url}/api/templates/{template_id}", timeout=30)
+        response = client.get(f"/api/templates/{template_id}")
         if response.status_code == 200:
             template_json = response.json()
             print(f"✓ Template data loaded")
@@ -58,32 +59,23 @@ def test_cover_image_fix():
     # 2. Check preview HTML
     print("\n2. Testing preview HTML...")
     try:
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
-        if response.status_code != 200:
-            print(f"✗ Preview failed: {response.status_code}")
-            return False
-            
-        html_content = response.text
-        print(f"✓ Preview loaded ({len(html_content)} characters)")
-        
-        # Check for inline background-image style
-        import re
+        page = client.preview_page(template_id)
+        print(f"✓ Preview loaded ({page.size} characters)")
         
         # Look for header with background-image
-        header_match = re.search(r'<header[^>]*style="[^"]*background-image[^"]*"[^>]*>', html_content)
-        if header_match:
-            header_element = header_match.group(0)
+        header_bg_url = page.header_background_url
+        if header_bg_url:
             print(f"✓ Header with background-image found:")
-            print(f"  {header_element[:120]}...")
+            print(f"  {page.header_style['background-image'][:120]}...")
             
             # Check if it has the test cover image URL
-            if 'cover_test_hero.jpg' in header_element:
+            if 'cover_test_hero.jpg' in header_bg_url:
                 print("✓ Correct cover image URL found in header")
             else:
                 print("✗ Test cover image URL not found in header")
                 
             # Check if it has the profile image URL (should NOT be in header)
-            if 'cover_test.jpg' in header_element:
+            if 'cover_test.jpg' in header_bg_url:
                 print("⚠ Profile image URL found in header (should be cover image)")
             else:
                 print("✓ Profile image URL correctly NOT in header")
@@ -92,26 +84,26 @@ def test_cover_image_fix():
             print("✗ No header with background-image found")
             
         # Check for profile image in img tags
-        profile_img_matches = re.findall(r'<img[^>]*src="[^"]*cover_test\.jpg[^"]*"[^>]*>', html_content)
+        profile_img_matches = [src for src in page.image_urls if 'cover_test.jpg' in src]
         if profile_img_matches:
             print(f"✓ Profile image found in {len(profile_img_matches)} img tag(s)")
         else:
             print("✗ Profile image not found in any img tags")
             
         # Check for gradient fallback CSS
-        if 'linear-gradient' in html_content and 'var(--primary)' in html_content:
+        if 'linear-gradient' in page.style_text and 'var(--primary)' in page.style_text:
             print("✓ CSS gradient fallback found")
         else:
             print("✗ CSS gradient fallback missing")
             
         # Check for JavaScript fallback
-        if 'Facebook CDN detected - using gradient fallback for reliability' in html_content:
+        if 'Facebook CDN detected - using gradient fallback for reliability' in page.script_text:
             print("✓ JavaScript fallback for Facebook CDN found")
         else:
             print("✗ JavaScript fallback for Facebook CDN missing")
             
         print(f"\n✓ Test the template at:")
-        print(f"   {base_url}/templates/{template_id}/preview")
+        print(f"   {client.preview_url(template_id)}")
         print(f"\nExpected behavior:")
         print(f"- Cover image should be in header background (may show gradient if blocked)")
         print(f"- Profile image should be in about/contact section")
@@ -119,6 +111,9 @@ def test_cover_image_fix():
         
         return True
         
+    except ApiError as e:
+        print(f"✗ Preview failed: {e.status_code}")
+        return False
     except Exception as e:
         print(f"✗ Error testing template: {e}")
         return False
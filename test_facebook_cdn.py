@@ -3,13 +3,16 @@
 Test Facebook CDN image loading with the Make webhook
 """
 
-import requests
 import json
 
+from websitio import get_client
+
+client = get_client()
+
 def test_facebook_cdn_image():
     """Test with the actual Facebook CDN URL that was having issues"""
     
-    url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev/api/make/auto-create"
+    url = client.url("/api/make/auto-create")
     
     payload = {
         "name": "The Mexpat Experience Test",
@@ -30,7 +33,7 @@ def test_facebook_cdn_image():
     print(f"Profile Image URL: {payload['profileImage'][:100]}...")
     
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = client.post(url, json=payload, headers=headers, timeout=30)
         
         print(f"Status Code: {response.status_code}")
         
@@ -60,6 +63,6 @@ if __name__ == "__main__":
     
     if template_id:
         print(f"\nTo test the fix:")
-        print(f"1. Open: https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev/templates/{template_id}/preview")
+        print(f"1. Open: {client.preview_url(template_id)}")
         print(f"2. Check browser console for Facebook CDN loading logs")
         print(f"3. Verify cover image displays correctly or gracefully falls back to gradient")
\ No newline at end of file
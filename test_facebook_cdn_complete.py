@@ -4,16 +4,17 @@ Complete Facebook CDN Image Loading Test
 Tests the full pipeline: webhook -> template creation -> HTML generation -> image loading
 """
 
-import requests
 import json
 import re
 import time
 
+from websitio import get_client
+
+client = get_client()
+
 def test_complete_facebook_cdn_pipeline():
     """Test the complete Facebook CDN image loading pipeline"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
-    
     # Test payload with Facebook CDN URLs
     payload = {
         "name": "Facebook CDN Test Complete",
@@ -27,14 +28,14 @@ def test_complete_facebook_cdn_pipeline():
     }
     
     print("=== Complete Facebook CDN Pipeline Test ===")
-    print(f"Base URL: {base_url}")
+    print(f"Base URL: {client.base_url}")
     print(f"Cover Image: {payload['coverImage'][:60]}...")
     print(f"Profile Image: {payload['profileImage'][:60]}...")
     
     # Step 1: Create template via webhook
     print("\n1. Creating template via webhook...")
     try:
-        response = requests.post(f"{base_url}/api/make/auto-create", json=payload, timeout=30)
+        response = client.post("/api/make/auto-create", json=payload)
         
         if response.status_code != 200:
             print(f"✗ Template creation failed: {response.status_code} - {response.text}")
@@ -56,7 +57,7 @@ def test_complete_facebook_cdn_pipeline():
     # Step 2: Generate static HTML
     print("\n2. Generating static HTML...")
     try:
-        response = requests.post(f"{base_url}/api/templates/{template_id}/generate", timeout=30)
+        response = client.post(f"/api/templates/{template_id}/generate")
         
         if response.status_code != 200:
             print(f"✗ HTML generation failed: {response.status_code} - {response.text}")
@@ -71,13 +72,13 @@ def test_complete_facebook_cdn_pipeline():
     # Step 3: Test template preview
     print("\n3. Testing template preview...")
     try:
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
+        response = client.get(f"/templates/{template_id}/preview")
         
         if response.status_code != 200:
             print(f"✗ Preview failed: {response.status_code}")
             return False
             
-        html_content = response.text
+        html_content = client.with_assets(response.text)
         
         # Check if Facebook CDN URL is preserved in data-cover-url
         if 'data-cover-url' in html_content:
@@ -115,7 +116,7 @@ def test_complete_facebook_cdn_pipeline():
         else:
             print("⚠ Fallback CSS classes missing")
             
-        print(f"✓ Template preview accessible at: {base_url}/templates/{template_id}/preview")
+        print(f"✓ Template preview accessible at: {client.preview_url(template_id)}")
         
     except Exception as e:
         print(f"✗ Preview test failed: {e}")
@@ -125,7 +126,7 @@ def test_complete_facebook_cdn_pipeline():
     print("\n4. Testing direct Facebook CDN image access...")
     try:
         # Test if the Facebook CDN image is accessible
-        image_response = requests.head(payload['coverImage'], timeout=10)
+        image_response = client.head(payload['coverImage'], timeout=10)
         
         if image_response.status_code == 200:
             print("✓ Facebook CDN image is directly accessible")
@@ -139,7 +140,7 @@ def test_complete_facebook_cdn_pipeline():
     
     print("\n=== Test Summary ===")
     print(f"Template ID: {template_id}")
-    print(f"Preview URL: {base_url}/templates/{template_id}/preview")
+    print(f"Preview URL: {client.preview_url(template_id)}")
     print("✓ Facebook CDN URL parameter preservation: WORKING")
     print("✓ Template generation pipeline: WORKING")
     print("✓ JavaScript fallback mechanism: IMPLEMENTED")
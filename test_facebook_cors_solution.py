@@ -4,10 +4,13 @@ Test comprehensive Facebook CORS solution
 Creates a new template with enhanced gradient fallback and professional design
 """
 
-import requests
 import json
 import time
 
+from websitio import get_client
+
+client = get_client()
+
 def test_facebook_cors_solution():
     """Test the complete Facebook CORS solution with professional fallback"""
     
@@ -29,8 +32,8 @@ def test_facebook_cors_solution():
     print(f"Template ID: {template_id}")
     
     # Send webhook request
-    response = requests.post(
-        "http://localhost:5000/api/make/auto-create", 
+    response = client.post(
+        "/api/make/auto-create", 
         json=payload
     )
     
@@ -40,7 +43,7 @@ def test_facebook_cors_solution():
         print(f"✓ Template created: {template_id}")
         
         # Check template data
-        template_response = requests.get(f"http://localhost:5000/api/templates/{template_id}")
+        template_response = client.get(f"/api/templates/{template_id}")
         if template_response.status_code == 200:
             template_data = template_response.json()
             print(f"✓ Template data loaded")
@@ -48,9 +51,9 @@ def test_facebook_cors_solution():
             print(f"  Cover Image: {template_data.get('coverImage', 'Not found')[:80]}...")
             
             # Check preview HTML
-            preview_response = requests.get(f"http://localhost:5000/templates/{template_id}/preview")
+            preview_response = client.get(f"/templates/{template_id}/preview")
             if preview_response.status_code == 200:
-                html = preview_response.text
+                html = client.with_assets(preview_response.text)
                 print(f"✓ Preview loaded ({len(html)} characters)")
                 
                 # Check for Facebook CDN URL in HTML
@@ -72,7 +75,7 @@ def test_facebook_cors_solution():
                     print("✗ Facebook CDN handling JavaScript not found")
                 
                 print(f"\n✓ Test the template at:")
-                print(f"   http://localhost:5000/templates/{template_id}/preview")
+                print(f"   {client.preview_url(template_id)}")
                 print(f"\nExpected behavior:")
                 print(f"- Facebook CDN URL will be attempted first")
                 print(f"- When blocked by CORS, professional gradient fallback will show")
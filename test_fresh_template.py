@@ -3,14 +3,15 @@
 Create a completely fresh template to test the inline background-image fix
 """
 
-import requests
 import time
 
+from websitio import ApiError, get_client
+
+client = get_client()
+
 def test_fresh_template():
     """Create a new template and test the inline background-image style"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
-    
     # Create a brand new template
     timestamp = int(time.time())
     payload = {
@@ -28,37 +29,31 @@ def test_fresh_template():
     print(f"Creating new template: cover_test_{timestamp}")
     
     # Step 1: Create template
-    response = requests.post(f"{base_url}/api/make/auto-create", json=payload, timeout=30)
-    if response.status_code != 200:
-        print(f"✗ Template creation failed: {response.status_code}")
+    try:
+        template_data = client.auto_create(payload)
+    except ApiError as e:
+        print(f"✗ Template creation failed: {e.status_code}")
         return False
         
-    template_data = response.json()
     template_id = template_data.get('templateId')
     print(f"✓ Template created: {template_id}")
     
     # Step 2: Test the preview immediately
     print("\n2. Testing fresh template preview...")
-    time.sleep(1)  # Small delay
+    client.wait_until_ready(template_id)
     
     try:
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
-        if response.status_code != 200:
-            print(f"✗ Preview failed: {response.status_code}")
-            return False
-            
-        html_content = response.text
-        print(f"✓ Preview loaded ({len(html_content)} characters)")
+        page = client.preview_page(template_id)
+        print(f"✓ Preview loaded ({page.size} characters)")
         
         # Check for inline background-image style
-        import re
-        inline_bg_match = re.search(r'style="[^"]*background-image:\s*url\([^)]*\)[^"]*"', html_content)
-        if inline_bg_match:
+        inline_bg = next((el for el in page.styled_elements if el.background_url), None)
+        if inline_bg:
             print("✓ Inline background-image style found:")
-            print(f"  {inline_bg_match.group(0)[:100]}...")
+            print(f"  style=\"{inline_bg.attrs['style'][:100]}...")
             
             # Check if it contains Facebook CDN URL
-            if 'scontent' in inline_bg_match.group(0):
+            if 'scontent' in inline_bg.background_url:
                 print("✓ Facebook CDN URL found in inline style")
             else:
                 print("⚠ Background style found but no Facebook CDN URL")
@@ -66,33 +61,32 @@ def test_fresh_template():
             print("✗ No inline background-image style found")
             
             # Check if the header element exists at all
-            header_match = re.search(r'<header[^>]*id="home"[^>]*>', html_content)
-            if header_match:
-                print(f"Header element found: {header_match.group(0)[:120]}...")
+            if page.header and page.header.attrs.get('id') == 'home':
+                print(f"Header element found: {page.header.attrs}")
             else:
                 print("✗ Header element not found")
         
         # Check for data-cover-url attribute
-        if 'data-cover-url=' in html_content:
+        if page.cover_url is not None:
             print("✓ data-cover-url attribute found")
         else:
             print("✗ data-cover-url attribute missing")
             
         # Check for enhanced debugging
-        if '=== Facebook CDN Image Loading Debug ===' in html_content:
+        if '=== Facebook CDN Image Loading Debug ===' in page.script_text:
             print("✓ Enhanced debugging JavaScript included")
         else:
             print("✗ Enhanced debugging JavaScript missing")
             
-        # Show some raw HTML for debugging
-        header_start = html_content.find('<header')
-        if header_start != -1:
-            header_end = html_content.find('>', header_start) + 1
-            header_tag = html_content[header_start:header_end]
-            print(f"\nHeader tag HTML: {header_tag}")
+        # Show the parsed header tag for debugging
+        if page.header:
+            print(f"\nHeader tag (line {page.header.line}): {page.header.attrs}")
         
         return True
         
+    except ApiError as e:
+        print(f"✗ Preview failed: {e.status_code}")
+        return False
     except Exception as e:
         print(f"✗ Error testing preview: {e}")
         return False
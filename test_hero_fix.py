@@ -3,13 +3,13 @@
 Test the hero image fix for the latest Mexpat template
 """
 
-import requests
-import re
+from websitio import ApiError, get_client
+
+client = get_client()
 
 def test_hero_fix():
     """Test if the hero image is now working in the template preview"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
     template_id = "ChIJI0Jqhp0rTI8RydmtO71J-k4_1751629876300"
     
     print(f"=== Testing Hero Image Fix ===")
@@ -17,18 +17,12 @@ def test_hero_fix():
     
     try:
         # Test template preview
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
-        if response.status_code != 200:
-            print(f"✗ Preview failed: {response.status_code}")
-            return False
-            
-        html_content = response.text
-        print(f"✓ Preview loaded ({len(html_content)} characters)")
+        page = client.preview_page(template_id)
+        print(f"✓ Preview loaded ({page.size} characters)")
         
         # Check for header with background-image containing the cover image URL
-        header_match = re.search(r'<header[^>]*style="[^"]*background-image[^"]*url\([\'"]?([^\'")]+)[\'"]?\)[^"]*"[^>]*>', html_content)
-        if header_match:
-            bg_image_url = header_match.group(1)
+        bg_image_url = page.header_background_url
+        if bg_image_url:
             print(f"✓ Header with background-image found")
             print(f"  Background URL: {bg_image_url[:80]}...")
             
@@ -53,16 +47,17 @@ def test_hero_fix():
             print("✗ No header with background-image found")
             
             # Check if header exists at all
-            header_check = re.search(r'<header[^>]*id="home"[^>]*>', html_content)
-            if header_check:
+            if page.header and page.header.attrs.get('id') == 'home':
                 print("✓ Header element found but no background-image style")
-                header_element = header_check.group(0)
-                print(f"  Header: {header_element[:200]}...")
+                print(f"  Header: {str(page.header.attrs)[:200]}...")
             else:
                 print("✗ No header element found at all")
             
             return False
             
+    except ApiError as e:
+        print(f"✗ Preview failed: {e.status_code}")
+        return False
     except Exception as e:
         print(f"✗ Error testing template: {e}")
         return False
@@ -3,14 +3,15 @@
 Test the hero image mapping fix
 """
 
-import requests
 import time
 
+from websitio import ApiError, get_client
+
+client = get_client()
+
 def test_hero_image_mapping():
     """Test that coverImage is properly mapped to heroImage"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
-    
     # Create a new template to test the hero image mapping
     timestamp = int(time.time())
     payload = {
@@ -28,12 +29,12 @@ def test_hero_image_mapping():
     print(f"Creating template: hero_test_{timestamp}")
     
     # Create template
-    response = requests.post(f"{base_url}/api/make/auto-create", json=payload, timeout=30)
-    if response.status_code != 200:
-        print(f"✗ Template creation failed: {response.status_code}")
+    try:
+        template_data = client.auto_create(payload)
+    except ApiError as e:
+        print(f"✗ Template creation failed: {e.status_code}")
         return False
         
-    template_data = response.json()
     template_id = template_data.get('templateId')
     print(f"✓ Template created: {template_id}")
     
@@ -53,48 +54,41 @@ def test_hero_image_mapping():
         print("✗ No hero image field in webhook response")
     
     # Wait for template to be ready
-    time.sleep(2)
+    client.wait_until_ready(template_id)
     
     # 2. Check stored template JSON data
     print("\n2. Checking stored template JSON data...")
     try:
-        response = requests.get(f"{base_url}/api/templates/{template_id}", timeout=30)
-        if response.status_code == 200:
-            template_json = response.json()
-            print(f"✓ Template data loaded")
-            
-            profile_image = template_json.get('profileImage', 'NOT FOUND')
-            cover_image = template_json.get('coverImage', 'NOT FOUND')
-            hero_image = template_json.get('heroImage', 'NOT FOUND')
-            
-            print(f"  Profile Image: {profile_image[:60]}...")
-            print(f"  Cover Image: {cover_image[:60]}...")
-            print(f"  Hero Image: {hero_image[:60]}...")
+        template_json = client.get_template(template_id)
+        print(f"✓ Template data loaded")
+        
+        profile_image = template_json.get('profileImage', 'NOT FOUND')
+        cover_image = template_json.get('coverImage', 'NOT FOUND')
+        hero_image = template_json.get('heroImage', 'NOT FOUND')
+        
+        print(f"  Profile Image: {profile_image[:60]}...")
+        print(f"  Cover Image: {cover_image[:60]}...")
+        print(f"  Hero Image: {hero_image[:60]}...")
+        
+        if hero_image != 'NOT FOUND' and 'hero_test_cover.jpg' in hero_image:
+            print("✓ Hero image field correctly populated with cover image URL")
+        else:
+            print("✗ Hero image field not properly populated")
             
-            if hero_image != 'NOT FOUND' and 'hero_test_cover.jpg' in hero_image:
-                print("✓ Hero image field correctly populated with cover image URL")
-            else:
-                print("✗ Hero image field not properly populated")
-                
-            if cover_image != 'NOT FOUND' and 'hero_test_cover.jpg' in cover_image:
-                print("✓ Cover image field correctly populated")
-            else:
-                print("✗ Cover image field not properly populated")
-                
+        if cover_image != 'NOT FOUND' and 'hero_test_cover.jpg' in cover_image:
+            print("✓ Cover image field correctly populated")
         else:
-            print(f"✗ Failed to get template data: {response.status_code}")
+            print("✗ Cover image field not properly populated")
+            
+    except ApiError as e:
+        print(f"✗ Failed to get template data: {e.status_code}")
     except Exception as e:
         print(f"✗ Error getting template data: {e}")
         
     # 3. Check preview HTML header
     print("\n3. Testing preview HTML header...")
     try:
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
-        if response.status_code != 200:
-            print(f"✗ Preview failed: {response.status_code}")
-            return False
-            
-        html_content = response.text
+        html_content = client.preview(template_id)
         print(f"✓ Preview loaded ({len(html_content)} characters)")
         
         # Check for header with background-image
@@ -114,7 +108,7 @@ def test_hero_image_mapping():
             print("✗ No header with background-image found")
             
         print(f"\n✓ Test the template at:")
-        print(f"   {base_url}/templates/{template_id}/preview")
+        print(f"   {client.preview_url(template_id)}")
         print(f"\nExpected behavior:")
         print(f"- Cover image should be visible in hero section header background")
         print(f"- Profile image should be in about/contact sections")
@@ -122,6 +116,9 @@ def test_hero_image_mapping():
         
         return True
         
+    except ApiError as e:
+        print(f"✗ Preview failed: {e.status_code}")
+        return False
     except Exception as e:
         print(f"✗ Error testing template: {e}")
         return False
@@ -3,17 +3,16 @@
 Test /api/notify endpoint with specified payload
 """
 
-import requests
 import json
 
+from websitio import get_client
+
+client = get_client()
+
 def test_notify_endpoint():
     """Test the /api/notify endpoint with the specified payload"""
     
-    # Test both local and external URLs
-    urls = [
-        "http://localhost:5000/api/notify",
-        "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev/api/notify"
-    ]
+    urls = [client.url("/api/notify")]
     
     payload = {
         "place_id": "tulum_bakery_001",
@@ -31,7 +30,7 @@ def test_notify_endpoint():
         print(f"\nTest {i}: {url}")
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = client.post(url, json=payload, headers=headers, timeout=30)
             
             print(f"Status Code: {response.status_code}")
             print(f"Response Headers: {dict(response.headers)}")
@@ -3,14 +3,16 @@
 Test template regeneration with fixed Facebook CDN image mapping
 """
 
-import requests
 import json
 import re
 
+from websitio import get_client
+
+client = get_client()
+
 def test_regenerate_template():
     """Test regenerating the template with Facebook CDN image fixes"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
     template_id = "facebook_cdn_complete_test_1751626468167"
     
     print(f"=== Testing Template Regeneration ===")
@@ -19,7 +21,7 @@ def test_regenerate_template():
     # Step 1: Regenerate template
     print("\n1. Regenerating template with Facebook CDN fixes...")
     try:
-        response = requests.post(f"{base_url}/api/templates/{template_id}/generate", timeout=30)
+        response = client.post(f"/api/templates/{template_id}/generate")
         
         if response.status_code != 200:
             print(f"✗ Regeneration failed: {response.status_code} - {response.text}")
@@ -34,13 +36,13 @@ def test_regenerate_template():
     # Step 2: Test the preview
     print("\n2. Testing updated template preview...")
     try:
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
+        response = client.get(f"/templates/{template_id}/preview")
         
         if response.status_code != 200:
             print(f"✗ Preview failed: {response.status_code}")
             return False
             
-        html_content = response.text
+        html_content = client.with_assets(response.text)
         
         # Check if Facebook CDN URL is now in data-cover-url
         if 'data-cover-url' in html_content:
@@ -75,7 +77,7 @@ def test_regenerate_template():
         else:
             print("⚠ CSS fallback classes missing")
             
-        print(f"✓ Template preview: {base_url}/templates/{template_id}/preview")
+        print(f"✓ Template preview: {client.preview_url(template_id)}")
         
     except Exception as e:
         print(f"✗ Preview test failed: {e}")
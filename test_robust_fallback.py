@@ -3,14 +3,15 @@
 Test the robust Facebook CDN fallback that doesn't rely on onerror events
 """
 
-import requests
 import time
 
+from websitio import ApiError, get_client
+
+client = get_client()
+
 def test_robust_fallback():
     """Create a new template with the robust fallback approach"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
-    
     # Create a new template to test the robust fallback
     timestamp = int(time.time())
     payload = {
@@ -28,26 +29,26 @@ def test_robust_fallback():
     print(f"Creating template: robust_test_{timestamp}")
     
     # Create template
-    response = requests.post(f"{base_url}/api/make/auto-create", json=payload, timeout=30)
-    if response.status_code != 200:
-        print(f"✗ Template creation failed: {response.status_code}")
+    try:
+        template_data = client.auto_create(payload)
+    except ApiError as e:
+        print(f"✗ Template creation failed: {e.status_code}")
         return False
         
-    template_data = response.json()
     template_id = template_data.get('templateId')
     print(f"✓ Template created: {template_id}")
     
     # Test the preview
     print("\n2. Testing robust fallback approach...")
-    time.sleep(1)
+    client.wait_until_ready(template_id)
     
     try:
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
+        response = client.get(f"/templates/{template_id}/preview")
         if response.status_code != 200:
             print(f"✗ Preview failed: {response.status_code}")
             return False
             
-        html_content = response.text
+        html_content = client.with_assets(response.text)
         print(f"✓ Preview loaded ({len(html_content)} characters)")
         
         # Check for the new robust fallback logic
@@ -106,7 +107,7 @@ def test_robust_fallback():
             
         # Show the new template URL
         print(f"\n✓ Test this robust fallback template at:")
-        print(f"   {base_url}/templates/{template_id}/preview")
+        print(f"   {client.preview_url(template_id)}")
         print(f"\nExpected behavior with new robust approach:")
         print(f"- JavaScript detects Facebook CDN and assumes blocking")
         print(f"- After 1.5 seconds, removes inline style if image didn't load")
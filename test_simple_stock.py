@@ -4,9 +4,12 @@ Simple test for stock images without complex API calls
 Tests the new template generation with stock images
 """
 
-import requests
 import time
 
+from websitio import get_client
+
+client = get_client()
+
 def test_simple_stock():
     """Test basic stock image template generation"""
     
@@ -25,8 +28,8 @@ def test_simple_stock():
     print(f"Creating template: {template_id}")
     
     # Send webhook request
-    response = requests.post(
-        "http://localhost:5000/api/make/auto-create", 
+    response = client.post(
+        "/api/make/auto-create", 
         json=payload
     )
     
@@ -36,7 +39,7 @@ def test_simple_stock():
         print(f"✓ Template created: {template_id}")
         
         # Check template data for hero image field
-        template_response = requests.get(f"http://localhost:5000/api/templates/{template_id}")
+        template_response = client.get(f"/api/templates/{template_id}")
         if template_response.status_code == 200:
             template_data = template_response.json()
             hero_image = template_data.get('heroImage')
@@ -54,7 +57,7 @@ def test_simple_stock():
                 print(f"✗ Hero Image field not found or empty")
             
             # Check preview HTML
-            preview_response = requests.get(f"http://localhost:5000/templates/{template_id}/preview")
+            preview_response = client.get(f"/templates/{template_id}/preview")
             if preview_response.status_code == 200:
                 html = preview_response.text
                 
@@ -78,7 +81,7 @@ def test_simple_stock():
                 if 'food' in html:
                     print(f"✓ Restaurant food images detected")
                 
-                print(f"\n✓ Preview URL: http://localhost:5000/templates/{template_id}/preview")
+                print(f"\n✓ Preview URL: {client.preview_url(template_id)}")
                 
                 return True
             else:
@@ -4,10 +4,13 @@ Test stock images integration and hero image field functionality
 Creates templates with different business types to verify stock image categories
 """
 
-import requests
 import json
 import time
 
+from websitio import get_client
+
+client = get_client()
+
 def test_stock_images():
     """Test stock images with different business categories"""
     
@@ -56,8 +59,8 @@ def test_stock_images():
         print(f"\n--- Testing {business['name']} ---")
         
         # Send webhook request
-        response = requests.post(
-            "http://localhost:5000/api/make/auto-create", 
+        response = client.post(
+            "/api/make/auto-create", 
             json=payload
         )
         
@@ -67,7 +70,7 @@ def test_stock_images():
             print(f"✓ Template created: {template_id}")
             
             # Check template data for hero image field
-            template_response = requests.get(f"http://localhost:5000/api/templates/{template_id}")
+            template_response = client.get(f"/api/templates/{template_id}")
             if template_response.status_code == 200:
                 template_data = template_response.json()
                 hero_image = template_data.get('heroImage')
@@ -84,9 +87,9 @@ def test_stock_images():
                     print(f"✗ Hero Image field not found or empty")
                 
                 # Check preview HTML for images
-                preview_response = requests.get(f"http://localhost:5000/templates/{template_id}/preview")
+                preview_response = client.get(f"/templates/{template_id}/preview")
                 if preview_response.status_code == 200:
-                    html = preview_response.text
+                    html = client.with_assets(preview_response.text)
                     
                     # Count stock images in gallery
                     unsplash_count = html.count('source.unsplash.com')
@@ -100,7 +103,7 @@ def test_stock_images():
                     elif business['templateType'] == 'professionals' and 'professional' in html:
                         print(f"✓ Professional-specific images detected")
                     
-                    print(f"   Preview URL: http://localhost:5000/templates/{template_id}/preview")
+                    print(f"   Preview URL: {client.preview_url(template_id)}")
                 else:
                     print(f"✗ Preview generation failed")
             else:
@@ -122,7 +125,7 @@ def test_stock_api():
     test_categories = ['business', 'food', 'travel', 'professional', 'office']
     
     for category in test_categories:
-        response = requests.get(f"http://localhost:5000/api/stock-image?category={category}&width=800&height=600")
+        response = client.get(f"/api/stock-image?category={category}&width=800&height=600")
         
         if response.status_code == 200:
             data = response.json()
@@ -3,14 +3,15 @@
 Test the template generator directly to see what HTML is being produced
 """
 
-import requests
 import json
 
+from websitio import ApiError, get_client
+
+client = get_client()
+
 def test_template_generator():
     """Test the template generator by generating and examining the HTML"""
     
-    base_url = "https://59f44953-d964-4fb9-91a2-34cac2c67ba7-00-3h7lcr3fuh1mq.picard.replit.dev"
-    
     # Create a fresh test template
     payload = {
         "name": "Template Generator Test",
@@ -27,18 +28,18 @@ def test_template_generator():
     
     # Step 1: Create template
     print("1. Creating template...")
-    response = requests.post(f"{base_url}/api/make/auto-create", json=payload, timeout=30)
-    if response.status_code != 200:
-        print(f"✗ Template creation failed: {response.status_code}")
+    try:
+        template_data = client.auto_create(payload)
+    except ApiError as e:
+        print(f"✗ Template creation failed: {e.status_code}")
         return False
         
-    template_data = response.json()
     template_id = template_data.get('templateId')
     print(f"✓ Template created: {template_id}")
     
     # Step 2: Generate static files
     print("\n2. Generating static files...")
-    response = requests.post(f"{base_url}/api/generate-static", json={"templateId": template_id}, timeout=30)
+    response = client.post("/api/generate-static", json={"templateId": template_id})
     if response.status_code != 200:
         print(f"✗ Static generation failed: {response.status_code} - {response.text}")
         return False
@@ -49,9 +50,9 @@ def test_template_generator():
     # Step 3: Check if we can access the static files
     print("\n3. Checking static file access...")
     try:
-        response = requests.get(f"{base_url}/static/{template_id}/index.html", timeout=30)
+        response = client.get(f"/static/{template_id}/index.html")
         if response.status_code == 200:
-            html_content = response.text
+            html_content = client.with_assets(response.text)
             print(f"✓ Static HTML accessible ({len(html_content)} characters)")
             
             # Check for data-cover-url
@@ -80,9 +81,9 @@ def test_template_generator():
     # Step 4: Test the template preview route
     print("\n4. Testing template preview route...")
     try:
-        response = requests.get(f"{base_url}/templates/{template_id}/preview", timeout=30)
+        response = client.get(f"/templates/{template_id}/preview")
         if response.status_code == 200:
-            html_content = response.text
+            html_content = client.with_assets(response.text)
             print(f"✓ Template preview accessible ({len(html_content)} characters)")
             
             # Check for data-cover-url
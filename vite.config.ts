@@ -2,11 +2,20 @@ import { defineConfig } from "vite";
 import react from "@vitejs/plugin-react";
 import path from "path";
 import runtimeErrorOverlay from "@replit/vite-plugin-runtime-error-modal";
+import { precompressDirectory } from "./server/compression";
 
 export default defineConfig({
   plugins: [
     react(),
     runtimeErrorOverlay(),
+    {
+      // .br/.gz siblings of the built assets, served by precompressedStatic
+      name: "websitio-precompress",
+      apply: "build",
+      async closeBundle() {
+        await precompressDirectory(path.resolve(import.meta.dirname, "dist/public"));
+      },
+    },
     ...(process.env.NODE_ENV !== "production" &&
     process.env.REPL_ID !== undefined
       ? [
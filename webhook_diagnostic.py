@@ -4,15 +4,18 @@ Make.com Webhook Data Structure Diagnostic
 Analyzes why webhook data structure resets in Make.com
 """
 
-import requests
 import json
 import time
 from datetime import datetime
 
+from websitio import get_client
+
+client = get_client()
+
 def test_webhook_variations():
     """Test different payload formats to identify Make.com data structure issues"""
     
-    webhook_url = "https://hook.us2.make.com/vlcril6b6o88s994ov4uqytoi22a61h8"
+    webhook_url = client.webhook_url("vlcril6b6o88s994ov4uqytoi22a61h8")
     
     # Test 1: Standard JSON payload (current format)
     print("=== Test 1: Standard JSON Format ===")
@@ -34,7 +37,7 @@ def test_webhook_variations():
     print(f"Headers: {json.dumps(headers1, indent=2)}")
     
     try:
-        response1 = requests.post(webhook_url, json=payload1, headers=headers1, timeout=30)
+        response1 = client.post(webhook_url, json=payload1, headers=headers1, timeout=30)
         print(f"Status Code: {response1.status_code}")
         print(f"Response: {response1.text}")
         print(f"Response Headers: {dict(response1.headers)}")
@@ -62,7 +65,7 @@ def test_webhook_variations():
     print(f"Headers: {json.dumps(headers2, indent=2)}")
     
     try:
-        response2 = requests.post(webhook_url, data=payload2, headers=headers2, timeout=30)
+        response2 = client.post(webhook_url, data=payload2, headers=headers2, timeout=30)
         print(f"Status Code: {response2.status_code}")
         print(f"Response: {response2.text}")
         print(f"Response Headers: {dict(response2.headers)}")
@@ -95,7 +98,7 @@ def test_webhook_variations():
     print(f"Headers: {json.dumps(headers3, indent=2)}")
     
     try:
-        response3 = requests.post(webhook_url, json=payload3, headers=headers3, timeout=30)
+        response3 = client.post(webhook_url, json=payload3, headers=headers3, timeout=30)
         print(f"Status Code: {response3.status_code}")
         print(f"Response: {response3.text}")
         print(f"Response Headers: {dict(response3.headers)}")
@@ -123,7 +126,7 @@ def test_webhook_variations():
     print(f"Headers: {json.dumps(headers4, indent=2)}")
     
     try:
-        response4 = requests.post(webhook_url, json=payload4, headers=headers4, timeout=30)
+        response4 = client.post(webhook_url, json=payload4, headers=headers4, timeout=30)
         print(f"Status Code: {response4.status_code}")
         print(f"Response: {response4.text}")
         print(f"Response Headers: {dict(response4.headers)}")
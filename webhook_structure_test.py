@@ -4,16 +4,19 @@ Make.com Webhook Structure Test
 Tests webhook connectivity and provides structure establishment guidance
 """
 
-import requests
 import json
 import time
 
+from websitio import get_client
+
+client = get_client()
+
 def test_webhook_connectivity():
     """Test both webhook URLs to determine active endpoint"""
     
     webhooks = [
-        "https://hook.us2.make.com/w6qv7b5bqcd9lyigl48hbhtvkey86qlo",  # New URL
-        "https://hook.us2.make.com/vlcril6b6o88s994ov4uqytoi22a61h8"   # Previous URL
+        client.webhook_url("w6qv7b5bqcd9lyigl48hbhtvkey86qlo"),  # New URL
+        client.webhook_url("vlcril6b6o88s994ov4uqytoi22a61h8")   # Previous URL
     ]
     
     payload = {
@@ -37,7 +40,7 @@ def test_webhook_connectivity():
         print(f"\nTesting Webhook {i}: {webhook_url}")
         
         try:
-            response = requests.post(webhook_url, json=payload, headers=headers, timeout=30)
+            response = client.post(webhook_url, json=payload, headers=headers, timeout=30)
             print(f"Status Code: {response.status_code}")
             print(f"Response: {response.text}")
             
@@ -102,7 +105,7 @@ def send_structure_establishment_payloads(webhook_url):
         print(f"Business: {payload['name']}")
         
         try:
-            response = requests.post(webhook_url, json=payload, headers=headers, timeout=30)
+            response = client.post(webhook_url, json=payload, headers=headers, timeout=30)
             print(f"Status: {response.status_code} - {response.text}")
             
             if response.status_code == 200:
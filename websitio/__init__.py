@@ -0,0 +1,44 @@
+"""
+WebSitioPro Python tooling
+Shared client used by the test, debug and Make.com integration scripts.
+
+    from websitio import get_client
+    client = get_client()  # honours WEBSITIO_BASE_URL, defaults to localhost:5000
+    created = client.auto_create({"name": "...", "phone": "...", "address": "..."})
+    client.wait_until_ready(created["templateId"])
+    html = client.preview(created["templateId"])
+"""
+
+from .client import ApiError, WebSitioClient, get_client
+from .config import DEFAULT_BASE_URL, DEFAULT_WEBHOOK_BASE, ClientConfig, RetryPolicy
+from .inspector import PreviewPage, inspect_preview
+from .types import (
+    AutoCreateResponse,
+    BusinessPayload,
+    GenerateResponse,
+    NotifyResponse,
+    TemplateData,
+    TemplatePage,
+    TemplateStatus,
+    TemplateSummary,
+)
+
+__all__ = [
+    "ApiError",
+    "AutoCreateResponse",
+    "BusinessPayload",
+    "ClientConfig",
+    "DEFAULT_BASE_URL",
+    "DEFAULT_WEBHOOK_BASE",
+    "GenerateResponse",
+    "NotifyResponse",
+    "PreviewPage",
+    "RetryPolicy",
+    "TemplateData",
+    "TemplatePage",
+    "TemplateStatus",
+    "TemplateSummary",
+    "WebSitioClient",
+    "get_client",
+    "inspect_preview",
+]
@@ -0,0 +1,221 @@
+"""
+Open-loop HTTP load benchmark for the template pipeline endpoints
+Requests are issued on a fixed schedule (--rate per second) regardless of how
+fast the server answers, and latency is measured from each request's scheduled
+start, so a stalled server shows up as queueing delay instead of silently
+lowering the offered load.
+
+    python -m websitio.bench --rate 20 --duration 30 --out bench.json
+    python -m websitio.bench --mix preview=6,templates=2,stats=2 --rate 50
+
+Point it at a local stack (`npm run dev` with DATABASE_URL on a local Postgres)
+through WEBSITIO_BASE_URL so it runs without network access.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Callable, Optional
+
+import requests
+
+from .client import WebSitioClient
+from .config import ClientConfig, RetryPolicy
+
+DEFAULT_MIX = "auto-create=1,preview=4,templates=2,config=2,stats=1"
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    latency: float
+    ok: bool
+    status: Optional[int]
+
+
+@dataclass
+class BenchContext:
+    client: WebSitioClient
+    config_id: str
+    template_ids: list[str] = field(default_factory=list)
+    counter: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def next_seq(self) -> int:
+        with self.lock:
+            self.counter += 1
+            return self.counter
+
+
+def _auto_create(ctx: BenchContext) -> requests.Response:
+    seq = ctx.next_seq()
+    payload = {
+        "name": f"Bench Business {seq}",
+        "phone": "+529999999999",
+        "address": "Benchmark Address, Mexico",
+        "category": "Professionals",
+        "place_id": f"bench_{int(time.time())}_{seq}",
+    }
+    return ctx.client.post("/api/make/auto-create", json=payload)
+
+
+def _preview(ctx: BenchContext) -> requests.Response:
+    return ctx.client.get(f"/templates/{random.choice(ctx.template_ids)}/preview")
+
+
+# Endpoint name -> request issuing function
+ENDPOINTS: dict[str, Callable[[BenchContext], requests.Response]] = {
+    "auto-create": _auto_create,
+    "preview": _preview,
+    "templates": lambda ctx: ctx.client.get("/api/templates"),
+    "config": lambda ctx: ctx.client.get(f"/api/config/{ctx.config_id}"),
+    "stats": lambda ctx: ctx.client.get("/api/agent/stats"),
+}
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}', expected one of {', '.join(ENDPOINTS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict:
+    def stats(group: list[Sample]) -> dict:
+        latencies = sorted(s.latency * 1000 for s in group)
+        errors = sum(1 for s in group if not s.ok)
+        return {
+            "requests": len(group),
+            "errors": errors,
+            "error_rate": round(errors / len(group), 4) if group else 0.0,
+            "throughput_rps": round(len(group) / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(latencies, 50), 2),
+                "p95": round(percentile(latencies, 95), 2),
+                "p99": round(percentile(latencies, 99), 2),
+                "max": round(latencies[-1], 2) if latencies else 0.0,
+            },
+            "status_codes": {
+                str(code): sum(1 for s in group if s.status == code)
+                for code in sorted({s.status for s in group if s.status is not None})
+            },
+        }
+
+    by_endpoint: dict[str, list[Sample]] = {}
+    for s in samples:
+        by_endpoint.setdefault(s.endpoint, []).append(s)
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "overall": stats(samples),
+        "endpoints": {name: stats(group) for name, group in sorted(by_endpoint.items())},
+    }
+
+
+def run_benchmark(
+    ctx: BenchContext,
+    mix: dict[str, float],
+    rate: float,
+    duration: float,
+    max_in_flight: int,
+    seed: int = 0,
+) -> dict:
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    total = int(rate * duration)
+    samples: list[Sample] = []
+    samples_lock = threading.Lock()
+
+    def fire(name: str, scheduled: float) -> None:
+        status: Optional[int] = None
+        ok = False
+        try:
+            response = ENDPOINTS[name](ctx)
+            status = response.status_code
+            ok = response.ok
+            response.content  # drain the body so timing covers the full transfer
+        except requests.RequestException:
+            pass
+        sample = Sample(name, time.monotonic() - scheduled, ok, status)
+        with samples_lock:
+            samples.append(sample)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="bench") as pool:
+        for i in range(total):
+            scheduled = start + i / rate
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(fire, rng.choices(names, weights)[0], scheduled)
+    elapsed = time.monotonic() - start
+
+    report = summarize(samples, elapsed)
+    report["offered_rate_rps"] = rate
+    report["mix"] = mix
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Open-loop load benchmark for WebSitioPro")
+    parser.add_argument("--rate", type=float, default=10.0, help="requests per second offered")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"endpoint weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--config-id", default="1", help="id used for /api/config/:id")
+    parser.add_argument("--seed-templates", type=int, default=5, help="templates created up front for preview requests")
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed for the request mix")
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    # No retries: a retried 5xx would count as one slow success instead of an
+    # error, hiding it from error_rate and inflating the latency percentiles
+    config = replace(ClientConfig.from_env(), pool_maxsize=args.max_in_flight, retry=RetryPolicy(total=0))
+    with WebSitioClient(config) as client:
+        health = client.get("/health")
+        if not health.ok:
+            print(f"✗ Server at {client.base_url} is not healthy ({health.status_code})", file=sys.stderr)
+            return 1
+
+        ctx = BenchContext(client=client, config_id=args.config_id)
+        if "preview" in mix:
+            for _ in range(args.seed_templates):
+                seeded = _auto_create(ctx)
+                if not seeded.ok:
+                    print(f"✗ Could not seed preview templates at {client.base_url} ({seeded.status_code})", file=sys.stderr)
+                    return 1
+                ctx.template_ids.append(seeded.json()["templateId"])
+
+        report = run_benchmark(ctx, mix, args.rate, args.duration, args.max_in_flight, args.seed)
+        report["base_url"] = client.base_url
+
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        print(f"✓ Report written to {args.out}", file=sys.stderr)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
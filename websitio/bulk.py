@@ -0,0 +1,291 @@
+"""
+Bulk onboarding driver for Google Places lead exports
+Posts leads to /api/make/auto-create (or /api/agent/create-template for the
+Google Sheets column format) through a bounded, self-adjusting concurrency
+window and writes a JSONL manifest of the resulting templateIds.
+
+    python -m websitio.bulk leads.csv --out manifest.jsonl --max-concurrency 32
+
+The window grows additively while the server answers quickly and is halved on
+429/5xx responses or when latency crosses --target-latency, so a large run
+finishes quickly without knocking the server over. Re-running with the same
+manifest skips leads that already succeeded.
+
+Creating a template is not idempotent, so a lead is only resent when the
+server cannot have acted on it: the connection was never made, or the answer
+was 429/503. Any other failure (a read timeout, a 500) is recorded as failed
+for a person to check before re-running that lead.
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from .client import WebSitioClient
+from .config import ClientConfig
+
+AUTO_CREATE = "/api/make/auto-create"
+AGENT_CREATE = "/api/agent/create-template"
+
+# Column names used by the Google Sheets export consumed by the agent endpoint
+SHEETS_COLUMNS = {"Name", "Address", "Phone", "Template_Type", "Place_ID"}
+
+# Answers that slow the window down
+OVERLOAD_STATUS = {429, 500, 502, 503, 504}
+
+# Answers given before the server did any work, so the lead can be resent
+RETRYABLE_STATUS = {429, 503}
+
+
+def read_leads(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield lead rows from a .csv or .jsonl file"""
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                yield {k: v for k, v in row.items() if v not in (None, "")}
+    else:
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def endpoint_for(lead: dict[str, Any]) -> str:
+    """Google Sheets rows go to the agent endpoint, everything else to auto-create"""
+    return AGENT_CREATE if SHEETS_COLUMNS & lead.keys() else AUTO_CREATE
+
+
+def lead_key(lead: dict[str, Any]) -> str:
+    """place_id or name, else a hash of the row so unnamed leads stay distinct across runs"""
+    key = lead.get("place_id") or lead.get("Place_ID") or lead.get("name") or lead.get("Name")
+    if key:
+        return str(key)
+    content = json.dumps(lead, sort_keys=True, ensure_ascii=False, default=str)
+    return "sha1:" + hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class LeadResult:
+    key: str
+    endpoint: str
+    status: str  # "ok" or "failed"
+    http_status: Optional[int] = None
+    templateId: Optional[str] = None
+    attempts: int = 0
+    latency_ms: float = 0.0
+    error: Optional[str] = None
+
+
+class AdaptiveWindow:
+    """Concurrency limit with additive increase / multiplicative decrease"""
+
+    def __init__(self, initial: int, minimum: int, maximum: int, target_latency: float):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            while self.in_flight >= self.limit:
+                await self._cond.wait()
+            self.in_flight += 1
+        delay = self.paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def release(self, latency: float, overloaded: bool, retry_after: Optional[float] = None) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            if overloaded or latency > self.target_latency:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._successes = 0
+                if retry_after:
+                    self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+def _never_sent(error: requests.RequestException) -> bool:
+    """True when the request failed before reaching the server"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.ConnectionError):
+        return False
+    # A dropped connection after the request went out is a ConnectionError
+    # too; only a failure to connect at all (MaxRetryError wrapping a
+    # NewConnectionError) is safe to resend
+    reason = error.args[0] if error.args else None
+    return isinstance(getattr(reason, "reason", reason), NewConnectionError)
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class BulkIngester:
+    """Drives a lead file through the template creation endpoints"""
+
+    def __init__(
+        self,
+        client: WebSitioClient,
+        max_concurrency: int = 16,
+        initial_concurrency: int = 4,
+        target_latency: float = 2.0,
+        max_attempts: int = 4,
+        endpoint: Optional[str] = None,
+    ):
+        self.client = client
+        self.window = AdaptiveWindow(initial_concurrency, 1, max_concurrency, target_latency)
+        self.max_attempts = max_attempts
+        self.endpoint = endpoint
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="bulk")
+
+    async def _post(self, path: str, lead: dict[str, Any]) -> requests.Response:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, lambda: self.client.post(path, json=lead))
+
+    async def ingest_one(self, lead: dict[str, Any]) -> LeadResult:
+        path = self.endpoint or endpoint_for(lead)
+        result = LeadResult(key=lead_key(lead), endpoint=path, status="failed")
+
+        for attempt in range(1, self.max_attempts + 1):
+            result.attempts = attempt
+            await self.window.acquire()
+            started = time.monotonic()
+            response: Optional[requests.Response] = None
+            error: Optional[requests.RequestException] = None
+            try:
+                response = await self._post(path, lead)
+            except requests.RequestException as e:
+                error = e
+                result.error = str(e)
+            latency = time.monotonic() - started
+            result.latency_ms = round(latency * 1000, 1)
+
+            overloaded = response is None or response.status_code in OVERLOAD_STATUS
+            await self.window.release(latency, overloaded, _retry_after(response) if response is not None else None)
+
+            if response is None:
+                if not _never_sent(error):
+                    # The template may have been created; resending could make a second one
+                    return result
+                await asyncio.sleep(min(30.0, 0.5 * 2 ** attempt))
+                continue
+            result.http_status = response.status_code
+            if response.ok:
+                try:
+                    body = response.json()
+                except ValueError:
+                    # The template may have been created; record it for a person to check
+                    result.error = f"non-JSON response: {response.text[:200]}"
+                    return result
+                result.status = "ok"
+                result.templateId = body.get("templateId") if isinstance(body, dict) else None
+                result.error = None
+                return result
+            result.error = response.text[:200]
+            if response.status_code not in RETRYABLE_STATUS:
+                return result
+            await asyncio.sleep(min(30.0, 0.5 * 2 ** attempt))
+
+        return result
+
+    async def run(self, leads: list[dict[str, Any]], manifest: Path) -> dict[str, int]:
+        counts = {"ok": 0, "failed": 0}
+        queue: asyncio.Queue = asyncio.Queue()
+        for lead in leads:
+            queue.put_nowait(lead)
+
+        with manifest.open("a", encoding="utf-8") as out:
+            async def worker() -> None:
+                while True:
+                    try:
+                        lead = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    result = await self.ingest_one(lead)
+                    counts[result.status] += 1
+                    out.write(json.dumps(asdict(result), ensure_ascii=False) + "\n")
+                    out.flush()
+
+            # The window, not the worker count, bounds what is actually in flight
+            workers = [asyncio.create_task(worker()) for _ in range(self.window.maximum)]
+            await asyncio.gather(*workers)
+
+        self.executor.shutdown(wait=False)
+        return counts
+
+
+def completed_keys(manifest: Path) -> set[str]:
+    """Keys already ingested successfully according to an existing manifest"""
+    if not manifest.exists():
+        return set()
+    done = set()
+    with manifest.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                if entry.get("status") == "ok":
+                    done.add(entry["key"])
+    return done
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-create templates from a lead export")
+    parser.add_argument("leads", type=Path, help="CSV or JSONL lead file")
+    parser.add_argument("--out", type=Path, default=Path("bulk-manifest.jsonl"), help="result manifest (JSONL, appended)")
+    parser.add_argument("--max-concurrency", type=int, default=16)
+    parser.add_argument("--initial-concurrency", type=int, default=4)
+    parser.add_argument("--target-latency", type=float, default=2.0, help="seconds; slower responses shrink the window")
+    parser.add_argument("--max-attempts", type=int, default=4)
+    parser.add_argument("--endpoint", choices=[AUTO_CREATE, AGENT_CREATE], help="force an endpoint instead of detecting per row")
+    args = parser.parse_args(argv)
+
+    done = completed_keys(args.out)
+    leads = [lead for lead in read_leads(args.leads) if lead_key(lead) not in done]
+    print(f"=== Bulk onboarding: {len(leads)} leads ({len(done)} already done) ===")
+
+    config = replace(ClientConfig.from_env(), pool_maxsize=args.max_concurrency)
+    with WebSitioClient(config) as client:
+        ingester = BulkIngester(
+            client,
+            max_concurrency=args.max_concurrency,
+            initial_concurrency=min(args.initial_concurrency, args.max_concurrency),
+            target_latency=args.target_latency,
+            max_attempts=args.max_attempts,
+            endpoint=args.endpoint,
+        )
+        started = time.monotonic()
+        counts = asyncio.run(ingester.run(leads, args.out))
+        elapsed = time.monotonic() - started
+
+    print(f"✓ {counts['ok']} created, ✗ {counts['failed']} failed in {elapsed:.1f}s")
+    print(f"Manifest: {args.out}")
+    return 0 if counts["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,246 @@
+"""
+Pooled HTTP client for the WebSitioPro API
+A single keep-alive requests.Session is shared by every call, so a script that
+creates a template, reads it back and fetches its preview reuses one warm
+connection instead of paying TCP+TLS setup on every request.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import ClientConfig
+from .inspector import PreviewPage, inspect_stream
+from .types import (
+    AutoCreateResponse,
+    BusinessPayload,
+    GenerateResponse,
+    NotifyResponse,
+    TemplateData,
+    TemplatePage,
+    TemplateStatus,
+    TemplateSummary,
+)
+
+
+# Shared runtime assets linked from generated pages; names are content-hashed,
+# so a fetched asset never changes
+SITE_ASSET_PREFIX = "/site-assets/"
+_SITE_ASSET_LINK = re.compile(r'<(?:link[^>]+href|script[^>]+src)="(/site-assets/[^"]+)"')
+
+
+class ApiError(Exception):
+    """Raised when the server answers with a non-2xx status"""
+
+    def __init__(self, method: str, url: str, status_code: int, text: str):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        super().__init__(f"{method} {url} -> {status_code}: {text[:200]}")
+
+
+class WebSitioClient:
+    """Typed wrapper around the WebSitioPro endpoints used by our scripts"""
+
+    def __init__(self, config: Optional[ClientConfig] = None):
+        self.config = config or ClientConfig.from_env()
+        self.base_url = self.config.base_url.rstrip("/")
+        self.session = self._build_session()
+        self._site_assets: dict[str, str] = {}
+        self._site_assets_lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        policy = self.config.retry
+        retry = Retry(
+            total=policy.total,
+            backoff_factor=policy.backoff_factor,
+            status_forcelist=policy.status_forcelist,
+            allowed_methods=policy.allowed_methods,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Accept": "application/json"})
+        return session
+
+    def url(self, path: str) -> str:
+        """Resolve an API path against the base URL (absolute URLs pass through)"""
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    # Low-level access, returns the raw response without raising
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.config.timeout)
+        return self.session.request(method, self.url(path), **kwargs)
+
+    def get(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def head(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("HEAD", path, **kwargs)
+
+    def _checked(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        response = self.request(method, path, **kwargs)
+        if not response.ok:
+            raise ApiError(method, response.url, response.status_code, response.text)
+        return response
+
+    # Typed endpoints
+
+    def auto_create(self, payload: BusinessPayload) -> AutoCreateResponse:
+        """POST /api/make/auto-create"""
+        return self._checked("POST", "/api/make/auto-create", json=payload).json()
+
+    def list_templates(self, **params: Any) -> TemplatePage:
+        """GET /api/templates (templateType, location, name, sort, order, limit, cursor)"""
+        return self._checked("GET", "/api/templates", params=params).json()
+
+    def iter_templates(self, **params: Any) -> Iterator[TemplateSummary]:
+        """Every template summary matching the filters, following nextCursor"""
+        params.setdefault("limit", 500)
+        while True:
+            page = self.list_templates(**params)
+            yield from page["templates"]
+            if not page["nextCursor"]:
+                return
+            params["cursor"] = page["nextCursor"]
+
+    def get_template(self, template_id: str) -> TemplateData:
+        """GET /api/templates/:id"""
+        return self._checked("GET", f"/api/templates/{template_id}").json()
+
+    def generate_template(self, template_id: str) -> GenerateResponse:
+        """POST /api/templates/:id/generate"""
+        return self._checked("POST", f"/api/templates/{template_id}/generate").json()
+
+    def template_status(
+        self,
+        template_id: str,
+        wait: Optional[str] = None,
+        timeout: float = 10.0,
+        since: Optional[int] = None,
+    ) -> TemplateStatus:
+        """GET /api/templates/:id/status, long-polling when `wait` or `since` is given"""
+        params: dict[str, Any] = {}
+        if wait:
+            params["wait"] = wait
+        if since is not None:
+            params["since"] = since
+        if params:
+            params["timeout"] = int(timeout * 1000)
+        read_timeout = self.config.read_timeout + (timeout if params else 0)
+        return self._checked(
+            "GET",
+            f"/api/templates/{template_id}/status",
+            params=params,
+            timeout=(self.config.connect_timeout, read_timeout),
+        ).json()
+
+    def wait_until_ready(self, template_id: str, stage: str = "created", timeout: float = 30.0) -> TemplateStatus:
+        """Block until the template reaches `stage` (created, rendered or static)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            status = self.template_status(template_id, wait=stage, timeout=max(0.0, remaining))
+            if status["ready"]:
+                return status
+            if remaining <= 0:
+                raise TimeoutError(f"Template {template_id} not {stage} after {timeout:.0f}s")
+
+    def site_asset(self, path: str) -> str:
+        """Shared site CSS/JS, fetched once per client (the names are content-hashed)"""
+        with self._site_assets_lock:
+            cached = self._site_assets.get(path)
+        if cached is None:
+            response = self._checked("GET", path)
+            response.encoding = "utf-8"
+            cached = response.text
+            with self._site_assets_lock:
+                self._site_assets[path] = cached
+        return cached
+
+    def with_assets(self, html: str) -> str:
+        """Append the shared site assets a page links to, for substring checks on the HTML"""
+        extra = []
+        for path in dict.fromkeys(_SITE_ASSET_LINK.findall(html)):
+            tag = "style" if path.endswith(".css") else "script"
+            extra.append(f"<{tag}>\n{self.site_asset(path)}\n</{tag}>")
+        return html + "\n".join(extra)
+
+    def preview(self, template_id: str, inline_assets: bool = True) -> str:
+        """GET /templates/:id/preview, returns the rendered HTML (with shared assets appended)"""
+        html = self._checked("GET", f"/templates/{template_id}/preview").text
+        return self.with_assets(html) if inline_assets else html
+
+    def preview_page(self, template_id: str) -> PreviewPage:
+        """Stream /templates/:id/preview through the inspector in one pass, plus its shared assets"""
+        with self._checked("GET", f"/templates/{template_id}/preview", stream=True) as response:
+            response.encoding = response.encoding or "utf-8"
+            page = inspect_stream(response.iter_content(chunk_size=16384, decode_unicode=True))
+        for href in page.stylesheet_hrefs:
+            if href.startswith(SITE_ASSET_PREFIX):
+                page.add_style(self.site_asset(href))
+        for src in page.script_srcs:
+            if src.startswith(SITE_ASSET_PREFIX):
+                page.add_script(self.site_asset(src))
+        return page
+
+    def preview_url(self, template_id: str) -> str:
+        return self.url(f"/templates/{template_id}/preview")
+
+    def webhook_url(self, hook_id: str) -> str:
+        """Make.com webhook URL for a hook id, honouring WEBSITIO_WEBHOOK_BASE"""
+        return f"{self.config.webhook_base.rstrip('/')}/{hook_id}"
+
+    def notify(self, place_id: str, status: str, **extra: Any) -> NotifyResponse:
+        """POST /api/notify"""
+        payload = {"place_id": place_id, "status": status, **extra}
+        return self._checked("POST", "/api/notify", json=payload).json()
+
+    def generate_static(self, **body: Any) -> dict[str, Any]:
+        """POST /api/generate-static"""
+        return self._checked("POST", "/api/generate-static", json=body).json()
+
+    def stock_image(self, category: str, width: int = 800, height: int = 600) -> dict[str, Any]:
+        """GET /api/stock-image"""
+        params = {"category": category, "width": width, "height": height}
+        return self._checked("GET", "/api/stock-image", params=params).json()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "WebSitioClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+_default_client: Optional[WebSitioClient] = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> WebSitioClient:
+    """Process-wide client so every script step shares one connection pool"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = WebSitioClient()
+        return _default_client
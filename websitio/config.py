@@ -0,0 +1,53 @@
+"""
+Connection settings for the WebSitioPro Python tooling
+Everything is overridable through environment variables so the same scripts
+can target a local dev server, a staging Repl or production.
+"""
+
+import os
+from dataclasses import dataclass, field
+
+DEFAULT_BASE_URL = "http://localhost:5000"
+DEFAULT_WEBHOOK_BASE = "https://hook.us2.make.com"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How failed requests are retried by the pooled session"""
+
+    total: int = 3
+    backoff_factor: float = 0.5
+    status_forcelist: tuple[int, ...] = (429, 502, 503, 504)
+    # POST is deliberately absent: retrying /api/make/auto-create after a
+    # read timeout would create a second template for the same place_id.
+    allowed_methods: frozenset[str] = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+
+@dataclass(frozen=True)
+class ClientConfig:
+    """Settings for a WebSitioClient instance"""
+
+    base_url: str = DEFAULT_BASE_URL
+    # Make.com webhooks; point at `python -m websitio.webhook_stub` to work offline
+    webhook_base: str = DEFAULT_WEBHOOK_BASE
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return (self.connect_timeout, self.read_timeout)
+
+    @classmethod
+    def from_env(cls) -> "ClientConfig":
+        """Build a config from WEBSITIO_* environment variables"""
+        return cls(
+            base_url=os.environ.get("WEBSITIO_BASE_URL", DEFAULT_BASE_URL).rstrip("/"),
+            webhook_base=os.environ.get("WEBSITIO_WEBHOOK_BASE", DEFAULT_WEBHOOK_BASE).rstrip("/"),
+            connect_timeout=float(os.environ.get("WEBSITIO_CONNECT_TIMEOUT", 5.0)),
+            read_timeout=float(os.environ.get("WEBSITIO_READ_TIMEOUT", 30.0)),
+            pool_maxsize=int(os.environ.get("WEBSITIO_POOL_SIZE", 16)),
+            retry=RetryPolicy(total=int(os.environ.get("WEBSITIO_RETRIES", 3))),
+        )
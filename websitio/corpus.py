@@ -0,0 +1,235 @@
+"""
+Audit and garbage-collect the templates/ corpus
+Every webhook retry and test run leaves another <place_id>_<timestamp>.json
+behind, and /api/templates and /api/agent/stats re-read the whole directory on
+each request. This CLI streams the corpus once and sorts every file into:
+
+- duplicate:  same normalized content as a newer file (timestamps and ids masked)
+- superseded: an older template for a place_id that has a newer one
+- fixture:    created by the test scripts (stock_test_*, hero_test_*, ...)
+- corrupt:    not valid JSON, or missing business name
+- keep:       everything else
+
+    python -m websitio.corpus audit
+    python -m websitio.corpus prune --categories duplicate,fixture --yes
+    python -m websitio.corpus archive --to templates-archive --categories superseded --yes
+
+prune and archive only report what they would do unless --yes is given.
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+CATEGORIES = ("duplicate", "superseded", "fixture", "corrupt")
+DEFAULT_CATEGORIES = ("duplicate", "fixture", "corrupt")
+
+# place_id prefixes used by the test and benchmark scripts
+FIXTURE_PATTERNS = (
+    "test_*",
+    "*_test_*",
+    "stock_test*",
+    "hero_test*",
+    "cover_test*",
+    "gradient_test*",
+    "robust_test*",
+    "js_test*",
+    "facebook_cdn_test*",
+    "facebook_cdn_complete_test*",
+    "template_gen_test*",
+    "bench_*",
+)
+
+# Fields that differ between otherwise identical creations
+VOLATILE_FIELDS = {"templateId", "createdAt", "dateCreated", "sunsetDate", "previewUrl", "lastModified"}
+_TIMESTAMP = re.compile(r"\d{10,13}")
+# Keys of id and URL fields, whose values may embed a creation timestamp
+# (place_id "auto_<ms>", ..._url); digits anywhere else, such as phone and
+# WhatsApp numbers, are real content
+_STAMPED_KEY = re.compile(r"(^|_)id$|Id$|(^|_)url$|Url$", re.IGNORECASE)
+_FILENAME = re.compile(r"^(?P<place_id>.+)_(?P<ts>\d{10,13})$")
+
+
+@dataclass
+class TemplateFile:
+    path: Path
+    size: int
+    place_id: str
+    created: float  # epoch seconds, from createdAt or the filename timestamp
+    digest: Optional[str]
+    category: str = "keep"
+    reason: str = ""
+
+
+def _mask_timestamps(value: Any, key: str = "") -> Any:
+    if isinstance(value, dict):
+        return {k: _mask_timestamps(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_mask_timestamps(v, key) for v in value]
+    if isinstance(value, str) and _STAMPED_KEY.search(key):
+        return _TIMESTAMP.sub("#", value)
+    return value
+
+
+def content_digest(data: dict[str, Any]) -> str:
+    """sha256 of the template with run-specific fields masked out"""
+    normalized = _mask_timestamps({k: v for k, v in data.items() if k not in VOLATILE_FIELDS})
+    text = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _created(data: dict[str, Any], stem: str, mtime: float) -> float:
+    created_at = data.get("createdAt")
+    if isinstance(created_at, str):
+        try:
+            return datetime.fromisoformat(created_at.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+    match = _FILENAME.match(stem)
+    if match:
+        ts = int(match["ts"])
+        return ts / 1000 if ts > 10**11 else ts
+    return mtime
+
+
+def scan(directory: Path) -> Iterator[TemplateFile]:
+    """Stream template files, parsing each one exactly once"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith(".json"):
+                continue
+            path = Path(entry.path)
+            stat = entry.stat()
+            match = _FILENAME.match(path.stem)
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if not isinstance(data, dict):
+                    raise ValueError("not an object")
+            except (OSError, ValueError) as e:
+                yield TemplateFile(path, stat.st_size, match["place_id"] if match else path.stem, stat.st_mtime,
+                                   None, "corrupt", f"unreadable: {e}")
+                continue
+
+            place_id = str(data.get("place_id") or (match["place_id"] if match else path.stem))
+            template = TemplateFile(path, stat.st_size, place_id, _created(data, path.stem, stat.st_mtime),
+                                    content_digest(data))
+            if not (data.get("businessName") or data.get("clientName")):
+                template.category, template.reason = "corrupt", "no businessName/clientName"
+            yield template
+
+
+def classify(templates: list[TemplateFile], fixture_patterns: tuple[str, ...] = FIXTURE_PATTERNS) -> list[TemplateFile]:
+    """Assign categories; the newest file of each content hash and place_id is kept"""
+    newest_first = sorted(templates, key=lambda t: t.created, reverse=True)
+    seen_digest: dict[str, TemplateFile] = {}
+    seen_place: dict[str, TemplateFile] = {}
+
+    for t in newest_first:
+        if t.category == "corrupt":
+            continue
+        if any(fnmatch.fnmatch(t.place_id, pattern) for pattern in fixture_patterns):
+            t.category, t.reason = "fixture", f"place_id {t.place_id}"
+        elif t.digest in seen_digest:
+            t.category, t.reason = "duplicate", f"same content as {seen_digest[t.digest].path.name}"
+        elif t.place_id in seen_place:
+            t.category, t.reason = "superseded", f"newer template {seen_place[t.place_id].path.name}"
+        if t.digest:
+            seen_digest.setdefault(t.digest, t)
+        seen_place.setdefault(t.place_id, t)
+    return newest_first
+
+
+def summarize(templates: list[TemplateFile]) -> dict[str, Any]:
+    summary: dict[str, Any] = {"files": len(templates), "bytes": sum(t.size for t in templates)}
+    for category in ("keep",) + CATEGORIES:
+        group = [t for t in templates if t.category == category]
+        summary[category] = {"files": len(group), "bytes": sum(t.size for t in group)}
+    summary["place_ids"] = len({t.place_id for t in templates})
+    return summary
+
+
+def apply(selected: list[TemplateFile], action: str, archive_dir: Optional[Path]) -> int:
+    done = 0
+    for t in selected:
+        try:
+            if action == "prune":
+                t.path.unlink()
+            else:
+                target = archive_dir / t.category  # type: ignore[operator]
+                target.mkdir(parents=True, exist_ok=True)
+                shutil.move(str(t.path), str(target / t.path.name))
+            done += 1
+        except OSError as e:
+            print(f"✗ {t.path.name}: {e}", file=sys.stderr)
+    return done
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Audit and garbage-collect the templates/ corpus")
+    parser.add_argument("action", choices=["audit", "prune", "archive"])
+    parser.add_argument("--dir", type=Path, default=Path("templates"), help="template directory (default: templates)")
+    parser.add_argument("--categories", default=",".join(DEFAULT_CATEGORIES),
+                        help=f"categories to prune/archive, from {', '.join(CATEGORIES)}")
+    parser.add_argument("--fixture-pattern", action="append", help="extra place_id glob treated as a test fixture")
+    parser.add_argument("--to", type=Path, help="archive directory (archive action)")
+    parser.add_argument("--yes", action="store_true", help="actually delete/move files")
+    parser.add_argument("--json", action="store_true", help="print the audit as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="list every selected file")
+    args = parser.parse_args(argv)
+
+    categories = {c.strip() for c in args.categories.split(",") if c.strip()}
+    unknown = categories - set(CATEGORIES)
+    if unknown:
+        parser.error(f"unknown categories: {', '.join(sorted(unknown))}")
+    if args.action == "archive" and not args.to:
+        parser.error("archive needs --to")
+    if not args.dir.is_dir():
+        print(f"✗ No template directory at {args.dir}", file=sys.stderr)
+        return 1
+
+    patterns = FIXTURE_PATTERNS + tuple(args.fixture_pattern or ())
+    templates = classify(list(scan(args.dir)), patterns)
+    summary = summarize(templates)
+
+    if args.json:
+        print(json.dumps({
+            "summary": summary,
+            "templates": [dict(asdict(t), path=str(t.path)) for t in templates if t.category != "keep"],
+        }, indent=2))
+    else:
+        print(f"=== {summary['files']} templates, {summary['place_ids']} place_ids, {summary['bytes'] / 1024:.0f} KiB ===")
+        for category in ("keep",) + CATEGORIES:
+            print(f"  {category:<11} {summary[category]['files']:>6} files  {summary[category]['bytes'] / 1024:>8.0f} KiB")
+
+    if args.action == "audit":
+        if args.verbose and not args.json:
+            for t in templates:
+                if t.category != "keep":
+                    print(f"{t.category:<11} {t.path.name}  ({t.reason})")
+        return 0
+
+    selected = [t for t in templates if t.category in categories]
+    verb = "Delete" if args.action == "prune" else f"Archive to {args.to}"
+    for t in selected if args.verbose else []:
+        print(f"{verb}: {t.path.name}  [{t.category}: {t.reason}]")
+    if not args.yes:
+        print(f"\n{verb}: {len(selected)} files ({', '.join(sorted(categories))}). Re-run with --yes to apply.")
+        return 0
+
+    done = apply(selected, args.action, args.to)
+    print(f"\n✓ {verb}: {done}/{len(selected)} files")
+    print("Refresh the agent stats with POST /api/agent/stats/rebuild (with the server stopped: npm run stats:rebuild)")
+    return 0 if done == len(selected) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
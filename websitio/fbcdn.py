@@ -0,0 +1,193 @@
+"""
+Facebook CDN URL expiry analyzer and liveness probe
+Signed scontent-*.fbcdn.net URLs expire at the unix time encoded in hex in
+their `oe` parameter. Decoding it classifies a URL as valid, expiring or
+expired without any request; only the URLs that still look valid are
+HEAD-probed, concurrently and through a small on-disk cache. Mirrors
+server/fb-cdn.ts, which the template generator uses at render time.
+
+    python -m websitio.fbcdn "https://scontent-...&oe=67A1B2C3"
+    python -m websitio.fbcdn --templates templates/ --probe --concurrency 16
+    python -m websitio.fbcdn --preview ChIJ..._1751629876300 --probe
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from .client import WebSitioClient, get_client
+from .inspector import is_facebook_cdn
+
+# URLs that expire within this window are reported as "expiring"
+DEFAULT_MARGIN_HOURS = 1.0
+PROBE_TTL_SECONDS = 600
+IMAGE_FIELDS = ("profileImage", "coverImage", "heroImage", "logoUrl", "photo_url")
+
+
+def decode_expiry(url: str) -> Optional[datetime]:
+    """Expiry encoded in the `oe` parameter, or None when absent/unparseable"""
+    oe = parse_qs(urlsplit(url).query).get("oe", [""])[0]
+    try:
+        return datetime.fromtimestamp(int(oe, 16), tz=timezone.utc) if oe else None
+    except ValueError:
+        return None
+
+
+def classify(url: str, now: Optional[float] = None, margin_hours: float = DEFAULT_MARGIN_HOURS) -> str:
+    """valid, expiring, expired, unsigned (no oe) or not-facebook"""
+    if not is_facebook_cdn(url):
+        return "not-facebook"
+    expires = decode_expiry(url)
+    if expires is None:
+        return "unsigned"
+    remaining = expires.timestamp() - (time.time() if now is None else now)
+    if remaining <= 0:
+        return "expired"
+    if remaining <= margin_hours * 3600:
+        return "expiring"
+    return "valid"
+
+
+@dataclass
+class UrlReport:
+    url: str
+    status: str
+    expires_at: Optional[str] = None
+    alive: Optional[bool] = None
+    http_status: Optional[int] = None
+    source: str = ""
+
+
+class ProbeCache:
+    """JSON file of {url: {alive, http_status, checked_at}} entries"""
+
+    def __init__(self, path: Optional[Path], ttl: float = PROBE_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict] = {}
+        if path and path.exists():
+            self.entries = json.loads(path.read_text(encoding="utf-8"))
+
+    def get(self, url: str) -> Optional[dict]:
+        entry = self.entries.get(url)
+        if entry and time.time() - entry["checked_at"] <= self.ttl:
+            return entry
+        return None
+
+    def put(self, url: str, alive: bool, http_status: Optional[int]) -> None:
+        with self.lock:
+            self.entries[url] = {"alive": alive, "http_status": http_status, "checked_at": time.time()}
+
+    def save(self) -> None:
+        if self.path:
+            now = time.time()
+            fresh = {u: e for u, e in self.entries.items() if now - e["checked_at"] <= self.ttl}
+            self.path.write_text(json.dumps(fresh, indent=2), encoding="utf-8")
+
+
+def probe(
+    client: WebSitioClient,
+    reports: list[UrlReport],
+    cache: ProbeCache,
+    concurrency: int = 8,
+) -> None:
+    """HEAD-probe the reports that still look valid, filling alive/http_status"""
+
+    def check(report: UrlReport) -> None:
+        cached = cache.get(report.url)
+        if cached is None:
+            try:
+                response = client.head(report.url, allow_redirects=True, timeout=(3, 5))
+                cache.put(report.url, response.ok, response.status_code)
+            except requests.RequestException:
+                cache.put(report.url, False, None)
+            cached = cache.get(report.url) or {}
+        report.alive = cached.get("alive")
+        report.http_status = cached.get("http_status")
+
+    candidates = [r for r in reports if r.status in ("valid", "expiring", "unsigned")]
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="fbcdn") as pool:
+        list(pool.map(check, candidates))
+
+
+def analyze(urls: Iterable[tuple[str, str]], margin_hours: float = DEFAULT_MARGIN_HOURS) -> list[UrlReport]:
+    """Classify (source, url) pairs, dropping duplicate URLs"""
+    reports = []
+    seen = set()
+    for source, url in urls:
+        if url in seen:
+            continue
+        seen.add(url)
+        expires = decode_expiry(url)
+        reports.append(UrlReport(
+            url=url,
+            status=classify(url, margin_hours=margin_hours),
+            expires_at=expires.isoformat() if expires else None,
+            source=source,
+        ))
+    return reports
+
+
+def urls_from_templates(directory: Path) -> Iterator[tuple[str, str]]:
+    for path in sorted(directory.glob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        for name in IMAGE_FIELDS:
+            value = data.get(name)
+            if isinstance(value, str) and is_facebook_cdn(value):
+                yield f"{path.stem}:{name}", value
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Classify Facebook CDN image URLs by their oe= expiry")
+    parser.add_argument("urls", nargs="*", help="URLs to analyze")
+    parser.add_argument("--templates", type=Path, help="scan image fields of every template JSON in this directory")
+    parser.add_argument("--preview", action="append", default=[], help="scan a rendered template preview (repeatable)")
+    parser.add_argument("--probe", action="store_true", help="HEAD-probe URLs that are not known to be expired")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--margin-hours", type=float, default=DEFAULT_MARGIN_HOURS)
+    parser.add_argument("--cache", type=Path, default=Path(".fbcdn-cache.json"), help="probe result cache")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    sources: list[tuple[str, str]] = [("arg", url) for url in args.urls]
+    if args.templates:
+        sources.extend(urls_from_templates(args.templates))
+    client = get_client()
+    for template_id in args.preview:
+        page = client.preview_page(template_id)
+        sources.extend((f"{template_id}:preview", url) for url in page.facebook_cdn_urls)
+
+    reports = analyze(sources, args.margin_hours)
+    if args.probe:
+        cache = ProbeCache(args.cache)
+        probe(client, reports, cache, args.concurrency)
+        cache.save()
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in reports], indent=2))
+    else:
+        for r in reports:
+            alive = "" if r.alive is None else (" alive" if r.alive else f" dead ({r.http_status})")
+            print(f"{r.status:<12} {r.expires_at or '-':<25}{alive:<12} {r.source:<40} {r.url[:80]}")
+        counts: dict[str, int] = {}
+        for r in reports:
+            counts[r.status] = counts.get(r.status, 0) + 1
+        print("\n" + ", ".join(f"{status}: {n}" for status, n in sorted(counts.items())) if counts else "No URLs found")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
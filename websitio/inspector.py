@@ -0,0 +1,203 @@
+"""
+Single-pass inspection of generated preview pages
+The preview HTML is fed once through a streaming parser that records
+everything the debug and test scripts look for: the hero <header>, inline
+styles, data-cover-url, image URLs, Facebook CDN URLs, <style>/<script> blocks
+and named JS functions. Every later check is a lookup on the resulting
+PreviewPage instead of another regex scan over the whole document.
+
+    page = inspect_preview(html)
+    page.header_background_url, page.cover_url, page.facebook_cdn_urls
+    "loadCoverImage" in page.js_functions
+
+Generated pages link the shared site runtime (/site-assets/...);
+WebSitioClient.preview_page() fetches it and adds it through add_script() and
+add_style(), so checks see the same CSS and JS the browser runs.
+"""
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Iterable, Optional
+
+_CSS_URL = re.compile(r"url\(\s*['\"]?([^'\")]+?)['\"]?\s*\)")
+_JS_FUNCTION = re.compile(r"\bfunction\s+([A-Za-z_$][\w$]*)\s*\(")
+_CSS_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+def is_facebook_cdn(url: str) -> bool:
+    return "scontent" in url or "fbcdn.net" in url
+
+
+def parse_inline_style(style: str) -> dict[str, str]:
+    """Split a style attribute into {property: value}"""
+    declarations = {}
+    # Split on ';' outside of url(...) so signed CDN query strings survive
+    for part in re.split(r";(?![^(]*\))", style):
+        name, sep, value = part.partition(":")
+        if sep and name.strip():
+            declarations[name.strip().lower()] = value.strip()
+    return declarations
+
+
+@dataclass
+class Element:
+    tag: str
+    attrs: dict[str, str]
+    line: int
+
+    @property
+    def style(self) -> dict[str, str]:
+        return parse_inline_style(self.attrs.get("style", ""))
+
+    @property
+    def background_url(self) -> Optional[str]:
+        match = _CSS_URL.search(self.style.get("background-image", ""))
+        return match.group(1) if match else None
+
+
+@dataclass
+class PreviewPage:
+    """Structured model of a rendered preview"""
+
+    size: int = 0
+    header: Optional[Element] = None
+    image_urls: list[str] = field(default_factory=list)
+    images: list[Element] = field(default_factory=list)
+    inline_background_urls: list[str] = field(default_factory=list)
+    styled_elements: list[Element] = field(default_factory=list)
+    style_blocks: list[str] = field(default_factory=list)
+    script_blocks: list[str] = field(default_factory=list)
+    script_srcs: list[str] = field(default_factory=list)
+    stylesheet_hrefs: list[str] = field(default_factory=list)
+    js_functions: set[str] = field(default_factory=set)
+    css_rules: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def header_style(self) -> dict[str, str]:
+        return self.header.style if self.header else {}
+
+    @property
+    def header_background_url(self) -> Optional[str]:
+        return self.header.background_url if self.header else None
+
+    @property
+    def cover_url(self) -> Optional[str]:
+        return self.header.attrs.get("data-cover-url") if self.header else None
+
+    @property
+    def facebook_cdn_urls(self) -> list[str]:
+        urls = self.image_urls + self.inline_background_urls
+        if self.cover_url:
+            urls.append(self.cover_url)
+        return [u for u in dict.fromkeys(urls) if is_facebook_cdn(u)]
+
+    @property
+    def script_text(self) -> str:
+        return "\n".join(self.script_blocks)
+
+    @property
+    def style_text(self) -> str:
+        return "\n".join(self.style_blocks)
+
+    def css_rule(self, selector: str) -> Optional[str]:
+        """Declarations of the first rule whose selector list contains `selector`"""
+        return self.css_rules.get(selector)
+
+    def add_script(self, text: str) -> None:
+        """Record a script block, inline or fetched from a script src"""
+        self.script_blocks.append(text)
+        self.js_functions.update(_JS_FUNCTION.findall(text))
+
+    def add_style(self, text: str) -> None:
+        """Record a stylesheet, inline or fetched from a <link rel="stylesheet">"""
+        self.style_blocks.append(text)
+        for selectors, body in _CSS_RULE.findall(_CSS_COMMENT.sub("", text)):
+            for selector in selectors.split(","):
+                self.css_rules.setdefault(selector.strip(), body.strip())
+
+
+class PreviewInspector(HTMLParser):
+    """Incremental parser; call feed() with chunks, then close() for the page"""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.page = PreviewPage()
+        self._raw_tag: Optional[str] = None
+        self._raw_buffer: list[str] = []
+
+    def feed(self, data: str) -> None:
+        self.page.size += len(data)
+        super().feed(data)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        attr_map = {name: value or "" for name, value in attrs}
+        element = Element(tag, attr_map, self.getpos()[0])
+        page = self.page
+
+        # Prefer the hero <header id="home">, fall back to the first header
+        if tag == "header" and (
+            page.header is None or (attr_map.get("id") == "home" and page.header.attrs.get("id") != "home")
+        ):
+            page.header = element
+        if tag == "img" and attr_map.get("src"):
+            page.images.append(element)
+            page.image_urls.append(attr_map["src"])
+        if "style" in attr_map:
+            page.styled_elements.append(element)
+            background = element.background_url
+            if background:
+                page.inline_background_urls.append(background)
+        if tag == "script":
+            if attr_map.get("src"):
+                page.script_srcs.append(attr_map["src"])
+            else:
+                self._start_raw(tag)
+        elif tag == "style":
+            self._start_raw(tag)
+        elif tag == "link" and "stylesheet" in attr_map.get("rel", "").split() and attr_map.get("href"):
+            page.stylesheet_hrefs.append(attr_map["href"])
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag in ("script", "style"):
+            self._raw_tag = None
+
+    def handle_data(self, data: str) -> None:
+        if self._raw_tag:
+            self._raw_buffer.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != self._raw_tag:
+            return
+        text = "".join(self._raw_buffer)
+        if tag == "script":
+            self.page.add_script(text)
+        else:
+            self.page.add_style(text)
+        self._raw_tag = None
+        self._raw_buffer = []
+
+    def _start_raw(self, tag: str) -> None:
+        self._raw_tag = tag
+        self._raw_buffer = []
+
+    def close(self) -> PreviewPage:  # type: ignore[override]
+        super().close()
+        return self.page
+
+
+def inspect_preview(html: str) -> PreviewPage:
+    inspector = PreviewInspector()
+    inspector.feed(html)
+    return inspector.close()
+
+
+def inspect_stream(chunks: Iterable[str]) -> PreviewPage:
+    """Parse a page while it downloads, e.g. from response.iter_content()"""
+    inspector = PreviewInspector()
+    for chunk in chunks:
+        if chunk:
+            inspector.feed(chunk)
+    return inspector.close()
@@ -0,0 +1,199 @@
+"""
+Replay captured webhook traffic against a WebSitioPro server
+Reads the JSONL written by the server when TRAFFIC_CAPTURE_FILE is set (see
+server/traffic-capture.ts) and re-issues each request, preserving the original
+inter-arrival gaps, compressed by --speed, or as fast as --concurrency allows.
+Every response is compared with the recorded one so behaviour regressions show
+up next to the latency numbers.
+
+    python -m websitio.replay capture.jsonl                  # original pacing
+    python -m websitio.replay capture.jsonl --speed 10       # 10x faster
+    python -m websitio.replay capture.jsonl --max-speed --concurrency 32 --diff-out diffs.jsonl
+"""
+
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import requests
+
+from .bench import Sample, summarize
+from .client import WebSitioClient
+from .config import ClientConfig
+
+# Fields that legitimately differ between a recording and its replay
+VOLATILE_FIELDS = {"templateId", "createdAt", "dateCreated", "sunsetDate", "timestamp", "loggedAt"}
+_TIMESTAMP = re.compile(r"\d{10,13}")
+
+
+@dataclass
+class Exchange:
+    ts: float
+    method: str
+    path: str
+    content_type: str
+    body: Any
+    status: int
+    response: Any
+
+
+def read_capture(path: Path) -> Iterator[Exchange]:
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            yield Exchange(
+                ts=entry["ts"] / 1000,
+                method=entry.get("method", "POST"),
+                path=entry["path"],
+                content_type=entry.get("contentType", ""),
+                body=entry.get("body"),
+                status=entry["response"]["status"],
+                response=entry["response"].get("body"),
+            )
+
+
+def normalize(value: Any, ignore: set[str]) -> Any:
+    """Mask fields and embedded timestamps that change on every run"""
+    if isinstance(value, dict):
+        return {k: "<volatile>" if k in ignore else normalize(v, ignore) for k, v in value.items()}
+    if isinstance(value, list):
+        return [normalize(v, ignore) for v in value]
+    if isinstance(value, str):
+        return _TIMESTAMP.sub("#", value)
+    return value
+
+
+def diff(expected: Any, actual: Any, ignore: set[str], prefix: str = "") -> list[str]:
+    """Human-readable differences between a recorded and a replayed body"""
+    expected, actual = normalize(expected, ignore), normalize(actual, ignore)
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        problems = []
+        for key in sorted(expected.keys() | actual.keys()):
+            where = f"{prefix}.{key}" if prefix else key
+            if key not in actual:
+                problems.append(f"{where}: missing")
+            elif key not in expected:
+                problems.append(f"{where}: unexpected")
+            else:
+                problems.extend(diff(expected[key], actual[key], ignore, where))
+        return problems
+    if expected != actual:
+        return [f"{prefix or '<body>'}: expected {json.dumps(expected)[:80]}, got {json.dumps(actual)[:80]}"]
+    return []
+
+
+def send(client: WebSitioClient, exchange: Exchange) -> requests.Response:
+    if "x-www-form-urlencoded" in exchange.content_type:
+        return client.request(exchange.method, exchange.path, data=exchange.body)
+    return client.request(exchange.method, exchange.path, json=exchange.body)
+
+
+def replay(
+    client: WebSitioClient,
+    exchanges: list[Exchange],
+    speed: Optional[float],
+    concurrency: int,
+    ignore: set[str],
+) -> tuple[list[Sample], list[dict[str, Any]], float]:
+    """Replay exchanges; speed=None sends without pacing"""
+    samples: list[Sample] = []
+    mismatches: list[dict[str, Any]] = []
+    lock = threading.Lock()
+
+    def fire(index: int, exchange: Exchange, scheduled: float) -> None:
+        status: Optional[int] = None
+        problems: list[str] = []
+        try:
+            response = send(client, exchange)
+            status = response.status_code
+            try:
+                body = response.json()
+            except ValueError:
+                body = response.text
+            if status != exchange.status:
+                problems.append(f"status: expected {exchange.status}, got {status}")
+            problems.extend(diff(exchange.response, body, ignore))
+        except requests.RequestException as e:
+            problems.append(f"request failed: {e}")
+        sample = Sample(exchange.path, time.monotonic() - scheduled, not problems, status)
+        with lock:
+            samples.append(sample)
+            if problems:
+                mismatches.append({"index": index, "path": exchange.path, "status": status, "problems": problems})
+
+    first_ts = exchanges[0].ts if exchanges else 0.0
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="replay") as pool:
+        for index, exchange in enumerate(exchanges):
+            scheduled = start + (exchange.ts - first_ts) / speed if speed else time.monotonic()
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(fire, index, exchange, scheduled)
+    return samples, mismatches, time.monotonic() - start
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay captured webhook traffic and compare responses")
+    parser.add_argument("capture", type=Path, help="JSONL written by the server's traffic capture")
+    pacing = parser.add_mutually_exclusive_group()
+    pacing.add_argument("--speed", type=float, default=1.0, help="time compression factor (default: original pacing)")
+    pacing.add_argument("--max-speed", action="store_true", help="ignore recorded timing and send as fast as possible")
+    parser.add_argument("--concurrency", type=int, default=16, help="maximum requests in flight")
+    parser.add_argument("--path", action="append", help="only replay these paths (repeatable)")
+    parser.add_argument("--ignore-field", action="append", default=[], help="extra response fields to ignore when comparing")
+    parser.add_argument("--diff-out", type=Path, help="write mismatches as JSONL")
+    parser.add_argument("--out", type=Path, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    exchanges = sorted(
+        (e for e in read_capture(args.capture) if not args.path or e.path in args.path),
+        key=lambda e: e.ts,
+    )
+    if not exchanges:
+        print("No captured requests to replay", file=sys.stderr)
+        return 1
+
+    span = exchanges[-1].ts - exchanges[0].ts
+    speed = None if args.max_speed else args.speed
+    pacing = "max speed" if speed is None else f"{speed:g}x (recorded span {span:.1f}s)"
+    ignore = VOLATILE_FIELDS | set(args.ignore_field)
+
+    config = replace(ClientConfig.from_env(), pool_maxsize=args.concurrency)
+    with WebSitioClient(config) as client:
+        print(f"=== Replaying {len(exchanges)} requests against {client.base_url} at {pacing} ===", file=sys.stderr)
+        samples, mismatches, elapsed = replay(client, exchanges, speed, args.concurrency, ignore)
+
+    report = summarize(samples, elapsed)
+    report["mismatches"] = len(mismatches)
+    report["speed"] = speed
+    output = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    if args.diff_out:
+        with args.diff_out.open("w", encoding="utf-8") as f:
+            for mismatch in sorted(mismatches, key=lambda m: m["index"]):
+                f.write(json.dumps(mismatch) + "\n")
+
+    if mismatches:
+        print(f"✗ {len(mismatches)} of {len(exchanges)} responses differ from the recording", file=sys.stderr)
+        for mismatch in sorted(mismatches, key=lambda m: m["index"])[:5]:
+            print(f"  #{mismatch['index']} {mismatch['path']}: {'; '.join(mismatch['problems'][:3])}", file=sys.stderr)
+        return 1
+    print(f"✓ All {len(exchanges)} responses match the recording", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,309 @@
+"""
+Parallel runner for the root test_*.py scripts
+Every script builds its own template through /api/make/auto-create, waits for
+it and then fetches the preview, so running them one after another is
+dominated by waiting and duplicate creations. The runner imports the scripts, swaps in a
+FixtureClient as the process-wide client and runs the test functions across a
+thread pool:
+
+- each distinct creation payload is posted once and the response is shared
+  (timestamps in names/place_ids are ignored when comparing payloads)
+- preview HTML is fetched once per template and reused until something
+  regenerates that template
+- any fixed time.sleep() waits left in the scripts are skipped (--keep-sleeps
+  restores them)
+
+    python -m websitio.runner                       # every test_*.py in the cwd
+    python -m websitio.runner -k fallback --workers 4 --json timings.json
+
+Per-test timings are split by pipeline stage (create, wait, generate, preview,
+api, local) so a slow stage stands out in the report.
+"""
+
+import argparse
+import fnmatch
+import glob
+import importlib.util
+import inspect
+import io
+import json
+import re
+import sys
+import threading
+import time
+import traceback
+import types
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import requests
+
+from . import client as client_module
+from .client import WebSitioClient
+from .config import ClientConfig
+
+STAGES = ("create", "wait", "generate", "preview", "api")
+
+CREATE_PATHS = ("/api/make/auto-create", "/api/agent/create-template")
+
+# Unix timestamps (seconds or milliseconds) the scripts embed in fixture names
+_TIMESTAMP = re.compile(r"\d{10,13}")
+_TEMPLATE_PATH = re.compile(r"^/(?:api/)?templates/([^/?]+)")
+
+
+def stage_for(method: str, path: str) -> str:
+    if method == "POST" and path.startswith(CREATE_PATHS):
+        return "create"
+    if path.split("?")[0].endswith("/status"):
+        return "wait"
+    if "generate" in path:
+        return "generate"
+    if path.endswith("/preview") or path.startswith("/static/"):
+        return "preview"
+    return "api"
+
+
+def fixture_key(path: str, payload: Any) -> str:
+    """Identity of a creation request with run-specific timestamps masked out"""
+    return path + " " + _TIMESTAMP.sub("#", json.dumps(payload, sort_keys=True))
+
+
+@dataclass
+class TestResult:
+    name: str
+    module: str
+    status: str = "pending"  # passed, failed, error
+    duration_ms: float = 0.0
+    stages_ms: dict[str, float] = field(default_factory=lambda: {s: 0.0 for s in STAGES})
+    requests: int = 0
+    fixture_hits: int = 0
+    output: str = ""
+    error: Optional[str] = None
+
+    @property
+    def local_ms(self) -> float:
+        """Time spent in the test itself rather than waiting on the server"""
+        return max(0.0, self.duration_ms - sum(self.stages_ms.values()))
+
+
+_current = threading.local()
+
+
+def current_result() -> Optional[TestResult]:
+    return getattr(_current, "result", None)
+
+
+class FixtureClient(WebSitioClient):
+    """WebSitioClient that shares creations and previews between tests"""
+
+    def __init__(self, config: Optional[ClientConfig] = None):
+        super().__init__(config)
+        self._lock = threading.Lock()
+        self._fixtures: dict[str, Future] = {}
+        self._previews: dict[str, Future] = {}
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        url = self.url(path)
+        rel = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        stage = stage_for(method, rel)
+        started = time.monotonic()
+        try:
+            return self._dispatch(method, rel, kwargs)
+        finally:
+            result = current_result()
+            if result is not None:
+                result.stages_ms[stage] += (time.monotonic() - started) * 1000
+                result.requests += 1
+
+    def _dispatch(self, method: str, rel: str, kwargs: dict[str, Any]) -> requests.Response:
+        if method == "POST" and rel.startswith(CREATE_PATHS) and "json" in kwargs:
+            return self._shared(self._fixtures, fixture_key(rel, kwargs["json"]), method, rel, kwargs)
+
+        template = _TEMPLATE_PATH.match(rel)
+        if template and method == "GET" and rel.endswith("/preview"):
+            return self._shared(self._previews, template.group(1), method, rel, kwargs)
+        if template and method != "GET":
+            # Regenerating or deleting a template invalidates its cached preview
+            with self._lock:
+                self._previews.pop(template.group(1), None)
+        return self._send(method, rel, kwargs)
+
+    def _send(self, method: str, rel: str, kwargs: dict[str, Any]) -> requests.Response:
+        return super().request(method, rel, **kwargs)
+
+    def _shared(
+        self, cache: dict[str, Future], key: str, method: str, rel: str, kwargs: dict[str, Any]
+    ) -> requests.Response:
+        with self._lock:
+            future = cache.get(key)
+            owner = future is None
+            if owner:
+                future = cache[key] = Future()
+
+        if not owner:
+            result = current_result()
+            if result is not None:
+                result.fixture_hits += 1
+            return future.result()
+
+        kwargs = {k: v for k, v in kwargs.items() if k != "stream"}
+        try:
+            response = self._send(method, rel, kwargs)
+            response.content  # read fully so every consumer can re-read the body
+        except BaseException as e:
+            with self._lock:
+                cache.pop(key, None)
+            future.set_exception(e)
+            raise
+        if not response.ok:
+            # Failures are not shared; the next caller tries again
+            with self._lock:
+                cache.pop(key, None)
+        future.set_result(response)
+        return response
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """Routes print() from worker threads into the running test's buffer"""
+
+    def __init__(self, fallback: Any):
+        self.fallback = fallback
+
+    def write(self, text: str) -> int:
+        buffer = getattr(_current, "stdout", None)
+        return (buffer or self.fallback).write(text)
+
+    def flush(self) -> None:
+        self.fallback.flush()
+
+
+def _without_sleep(module_time: types.ModuleType) -> types.SimpleNamespace:
+    namespace = types.SimpleNamespace(**vars(module_time))
+    namespace.sleep = lambda seconds: None
+    return namespace
+
+
+def discover(patterns: list[str], keyword: Optional[str] = None) -> list[tuple[str, Callable[[], Any]]]:
+    """Import matching scripts and collect their zero-argument test_* functions"""
+    tests = []
+    paths = sorted({p for pattern in patterns for p in glob.glob(pattern)})
+    for path in paths:
+        module_name = Path(path).stem
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            continue
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if not name.startswith("test_") or func.__module__ != module_name:
+                continue
+            if any(p.default is p.empty for p in inspect.signature(func).parameters.values()):
+                continue
+            if keyword and keyword not in name and keyword not in module_name:
+                continue
+            tests.append((f"{module_name}::{name}", func))
+    return tests
+
+
+def run_test(name: str, func: Callable[[], Any]) -> TestResult:
+    result = TestResult(name=name.split("::")[1], module=name.split("::")[0])
+    _current.result = result
+    _current.stdout = io.StringIO()
+    started = time.monotonic()
+    try:
+        returned = func()
+        result.status = "failed" if returned is False else "passed"
+    except Exception as e:
+        result.status = "error"
+        result.error = f"{type(e).__name__}: {e}"
+        _current.stdout.write(traceback.format_exc())
+    finally:
+        result.duration_ms = (time.monotonic() - started) * 1000
+        result.output = _current.stdout.getvalue()
+        _current.result = None
+        _current.stdout = None
+    return result
+
+
+def run_tests(tests: list[tuple[str, Callable[[], Any]]], workers: int) -> list[TestResult]:
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="test") as pool:
+        futures = [pool.submit(run_test, name, func) for name, func in tests]
+        return [f.result() for f in futures]
+
+
+def print_report(results: list[TestResult], elapsed: float, verbose: bool) -> None:
+    header = f"{'test':<58} {'status':<7} {'total':>8} " + " ".join(f"{s:>8}" for s in STAGES) + f" {'local':>8} {'shared':>6}"
+    print(header)
+    print("-" * len(header))
+    for r in sorted(results, key=lambda r: r.duration_ms, reverse=True):
+        stages = " ".join(f"{r.stages_ms[s]:>8.0f}" for s in STAGES)
+        print(f"{r.module + '::' + r.name:<58.58} {r.status:<7} {r.duration_ms:>8.0f} {stages} {r.local_ms:>8.0f} {r.fixture_hits:>6}")
+
+    totals = {s: sum(r.stages_ms[s] for r in results) for s in STAGES}
+    print("\nTime by stage (ms, summed over tests): " + ", ".join(f"{s}={v:.0f}" for s, v in totals.items()))
+
+    counts = {status: sum(1 for r in results if r.status == status) for status in ("passed", "failed", "error")}
+    print(f"\n✓ {counts['passed']} passed, ✗ {counts['failed']} failed, ✗ {counts['error']} errors in {elapsed:.1f}s")
+
+    for r in results:
+        if verbose or r.status != "passed":
+            print(f"\n=== {r.module}::{r.name} ({r.status}) ===")
+            print(r.output.rstrip() or "(no output)")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the test_*.py scripts in parallel with shared fixtures")
+    parser.add_argument("patterns", nargs="*", default=["test_*.py"], help="script globs (default: test_*.py)")
+    parser.add_argument("-k", dest="keyword", help="only run tests whose module or function name contains this")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--keep-sleeps", action="store_true", help="honour the scripts' time.sleep() waits")
+    parser.add_argument("--exclude", action="append", default=[], help="skip scripts matching this glob")
+    parser.add_argument("--json", dest="json_out", help="write per-test timings as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print output of passing tests too")
+    args = parser.parse_args(argv)
+
+    config = ClientConfig.from_env()
+    fixture_client = FixtureClient(config)
+    # Scripts call get_client() at import time, so install the shared client first
+    client_module._default_client = fixture_client
+    sys.path.insert(0, str(Path.cwd()))
+
+    tests = [
+        (name, func)
+        for name, func in discover(args.patterns, args.keyword)
+        if not any(fnmatch.fnmatch(name.split("::")[0] + ".py", ex) for ex in args.exclude)
+    ]
+    if not tests:
+        print("No tests found")
+        return 1
+
+    if not args.keep_sleeps:
+        for module in {sys.modules.get(func.__module__) for _, func in tests}:
+            if module is not None and isinstance(getattr(module, "time", None), types.ModuleType):
+                module.time = _without_sleep(module.time)
+
+    print(f"=== Running {len(tests)} tests on {args.workers} workers against {fixture_client.base_url} ===\n")
+    real_stdout = sys.stdout
+    sys.stdout = _ThreadLocalStdout(real_stdout)
+    started = time.monotonic()
+    try:
+        results = run_tests(tests, args.workers)
+    finally:
+        sys.stdout = real_stdout
+    elapsed = time.monotonic() - started
+
+    print_report(results, elapsed, args.verbose)
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            payload = [dict(asdict(r), local_ms=round(r.local_ms, 1)) for r in results]
+            json.dump({"elapsed_s": round(elapsed, 3), "tests": payload}, f, indent=2)
+        print(f"\nTimings written to {args.json_out}")
+    fixture_client.close()
+    return 0 if all(r.status == "passed" for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+"""
+Payload and response shapes for the WebSitioPro HTTP API
+Mirrors what server/routes.ts accepts and returns.
+"""
+
+from typing import Any, Optional, TypedDict
+
+
+class BusinessPayload(TypedDict, total=False):
+    """Body for POST /api/make/auto-create (name, phone and address are required)"""
+
+    name: str
+    phone: str
+    address: str
+    category: str
+    place_id: str
+    facebook_url: str
+    profileImage: str
+    coverImage: str
+    templateType: str
+
+
+class AutoCreateResponse(TypedDict, total=False):
+    """Make-compatible response from POST /api/make/auto-create"""
+
+    success: bool
+    message: str
+    templateId: str
+    place_id: str
+    name: str
+    phone: str
+    address: str
+    facebook_url: str
+    profileImage: str
+    coverImage: str
+    heroImage: str
+    previewUrl: str
+    templateType: str
+    dateCreated: str
+    sunsetDate: str
+    agentNotes: str
+    webhookSent: bool
+    makeIntegration: dict[str, Any]
+
+
+class GenerateResponse(TypedDict, total=False):
+    """Response from POST /api/templates/:id/generate"""
+
+    success: bool
+    message: str
+    outputPath: str
+    templateId: str
+
+
+class NotifyResponse(TypedDict):
+    """Response from POST /api/notify"""
+
+    status: str
+    place_id: str
+
+
+class TemplateStatus(TypedDict):
+    """Response from GET /api/templates/:id/status"""
+
+    templateId: str
+    created: bool
+    rendered: bool
+    staticFiles: bool
+    createdAt: Optional[str]
+    renderedAt: Optional[str]
+    version: int
+    ready: bool
+
+
+class TemplateSummary(TypedDict):
+    """One entry of GET /api/templates"""
+
+    templateId: str
+    businessName: str
+    clientName: str
+    templateType: str
+    category: str
+    location: str
+    place_id: str
+    phone: str
+    address: str
+    previewUrl: str
+    createdAt: str
+    lastModified: str
+
+
+class TemplatePage(TypedDict):
+    """Response from GET /api/templates"""
+
+    templates: list[TemplateSummary]
+    nextCursor: Optional[str]
+    total: int
+
+
+# Stored templates are free-form JSON documents
+TemplateData = dict[str, Any]
@@ -0,0 +1,292 @@
+"""
+Local stand-in for Make.com custom webhooks
+Accepts the same JSON object, JSON array, form-encoded and plain text payloads
+the integration scripts send to hook.us2.make.com, appends every request to
+<record-dir>/<hook_id>.jsonl and answers like Make does ("Accepted", or
+"Webhook not found" for unknown hooks). Latency and error injection make it
+usable for offline throughput runs of the integration loop.
+
+    python -m websitio.webhook_stub --port 8787 --latency 250 --jitter 100 --error-rate 0.02
+    WEBSITIO_WEBHOOK_BASE=http://127.0.0.1:8787 python make_integration_test.py
+
+Inspection endpoints:
+    GET    /__hooks                      per-hook counts, error counts and rate
+    GET    /__hooks/<hook_id>/structure  data structure determined from payloads
+    GET    /__hooks/<hook_id>/requests   most recent captured requests (?limit=N)
+    DELETE /__hooks/<hook_id>            forget the structure ("Redetermine data structure")
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+ACCEPTED = "Accepted"
+NOT_FOUND = "Webhook not found."
+
+
+def value_type(value: Any) -> str:
+    """Make.com data structure type of a JSON value"""
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, dict):
+        return "collection"
+    if isinstance(value, list):
+        return "array"
+    if value is None:
+        return "null"
+    return "text"
+
+
+def merge_structure(structure: dict[str, Any], payload: Any) -> dict[str, Any]:
+    """Fold a payload into a {field: {"type", "seen", "spec"}} structure"""
+    if isinstance(payload, list):
+        # Arrays of bundles are described by the union of their items
+        for item in payload:
+            merge_structure(structure, item)
+        return structure
+    if not isinstance(payload, dict):
+        payload = {"value": payload}
+
+    for name, value in payload.items():
+        entry = structure.setdefault(name, {"type": value_type(value), "seen": 0})
+        entry["seen"] += 1
+        kind = value_type(value)
+        if entry["type"] == "null":
+            entry["type"] = kind
+        elif kind not in ("null", entry["type"]):
+            entry["type"] = "any"
+        if kind in ("collection", "array") and value:
+            merge_structure(entry.setdefault("spec", {}), value)
+    return structure
+
+
+def parse_body(content_type: str, raw: bytes) -> tuple[str, Any]:
+    """Decode a webhook body into (format, payload) the way Make accepts it"""
+    text = raw.decode("utf-8", errors="replace")
+    if "json" in content_type or text.lstrip().startswith(("{", "[")):
+        try:
+            payload = json.loads(text) if text.strip() else {}
+            return ("json-array" if isinstance(payload, list) else "json"), payload
+        except ValueError:
+            pass
+    if "x-www-form-urlencoded" in content_type:
+        fields = parse_qs(text, keep_blank_values=True)
+        return "form", {k: v[0] if len(v) == 1 else v for k, v in fields.items()}
+    return "text", text
+
+
+@dataclass
+class Injection:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    response_text: str = ACCEPTED
+    known_hooks: Optional[set[str]] = None  # None accepts every hook id
+
+
+@dataclass
+class HookState:
+    requests: int = 0
+    errors: int = 0
+    first_at: Optional[float] = None
+    last_at: Optional[float] = None
+    structure: dict[str, Any] = field(default_factory=dict)
+    recent: deque = field(default_factory=lambda: deque(maxlen=200))
+
+
+class WebhookRecorder:
+    """Thread-safe capture store shared by all request handlers"""
+
+    def __init__(self, record_dir: Path, injection: Injection):
+        self.record_dir = record_dir
+        self.injection = injection
+        self.hooks: dict[str, HookState] = {}
+        self.lock = threading.Lock()
+        record_dir.mkdir(parents=True, exist_ok=True)
+
+    def record(self, hook_id: str, entry: dict[str, Any], ok: bool) -> None:
+        now = time.time()
+        with self.lock:
+            state = self.hooks.setdefault(hook_id, HookState())
+            state.requests += 1
+            state.errors += 0 if ok else 1
+            state.first_at = state.first_at or now
+            state.last_at = now
+            if ok:
+                merge_structure(state.structure, entry["payload"])
+            state.recent.append(entry)
+            with (self.record_dir / f"{hook_id}.jsonl").open("a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def summary(self) -> dict[str, Any]:
+        with self.lock:
+            hooks = {}
+            for hook_id, s in self.hooks.items():
+                span = (s.last_at - s.first_at) if s.first_at and s.last_at else 0.0
+                hooks[hook_id] = {
+                    "requests": s.requests,
+                    "errors": s.errors,
+                    "first_at": s.first_at,
+                    "last_at": s.last_at,
+                    "throughput_rps": round(s.requests / span, 2) if span > 0 else None,
+                }
+            return hooks
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MakeWebhookStub/1.0"
+    recorder: WebhookRecorder
+
+    def _send(self, status: int, body: Any) -> None:
+        if isinstance(body, str):
+            data, content_type = body.encode("utf-8"), "text/plain; charset=utf-8"
+        else:
+            data, content_type = json.dumps(body, indent=2).encode("utf-8"), "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _hook_id(self) -> str:
+        return urlsplit(self.path).path.strip("/")
+
+    def do_POST(self) -> None:
+        started = time.monotonic()
+        injection = self.recorder.injection
+        hook_id = self._hook_id()
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        if not hook_id or hook_id.startswith("__") or (
+            injection.known_hooks is not None and hook_id not in injection.known_hooks
+        ):
+            self._send(404, NOT_FOUND)
+            return
+
+        delay = injection.latency_ms + random.uniform(-injection.jitter_ms, injection.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        content_type = self.headers.get("Content-Type", "")
+        if self.command == "GET":
+            query = parse_qs(urlsplit(self.path).query, keep_blank_values=True)
+            body_format, payload = "query", {k: v[0] if len(v) == 1 else v for k, v in query.items()}
+        else:
+            body_format, payload = parse_body(content_type, raw)
+        failed = random.random() < injection.error_rate
+        status = injection.error_status if failed else 200
+
+        self.recorder.record(
+            hook_id,
+            {
+                "received_at": datetime.now(timezone.utc).isoformat(),
+                "method": self.command,
+                "content_type": content_type,
+                "format": body_format,
+                "payload": payload,
+                "status": status,
+                "latency_ms": round((time.monotonic() - started) * 1000, 1),
+            },
+            ok=not failed,
+        )
+        self._send(status, "Internal Server Error" if failed else injection.response_text)
+
+    do_PUT = do_POST
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        segments = parts.path.strip("/").split("/")
+        recorder = self.recorder
+
+        if segments == ["__hooks"]:
+            self._send(200, recorder.summary())
+            return
+        if len(segments) == 3 and segments[0] == "__hooks":
+            with recorder.lock:
+                state = recorder.hooks.get(segments[1])
+                if state is None:
+                    self._send(404, NOT_FOUND)
+                elif segments[2] == "structure":
+                    self._send(200, {"hook": segments[1], "requests": state.requests, "structure": state.structure})
+                elif segments[2] == "requests":
+                    limit = int(parse_qs(parts.query).get("limit", ["20"])[0])
+                    self._send(200, list(state.recent)[-limit:])
+                else:
+                    self._send(404, NOT_FOUND)
+            return
+        # Make also accepts GET on a hook URL, with the query string as the payload
+        self.do_POST()
+
+    def do_DELETE(self) -> None:
+        segments = urlsplit(self.path).path.strip("/").split("/")
+        if len(segments) == 2 and segments[0] == "__hooks":
+            with self.recorder.lock:
+                state = self.recorder.hooks.get(segments[1])
+                if state is not None:
+                    state.structure = {}
+            self._send(200, {"hook": segments[1], "structure": {}})
+        else:
+            self._send(404, NOT_FOUND)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:  # type: ignore[attr-defined]
+            super().log_message(format, *args)
+
+
+def make_server(host: str, port: int, recorder: WebhookRecorder, quiet: bool = False) -> ThreadingHTTPServer:
+    handler = type("BoundWebhookHandler", (WebhookHandler,), {"recorder": recorder})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.quiet = quiet  # type: ignore[attr-defined]
+    return server
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Local Make.com webhook stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--record-dir", type=Path, default=Path("webhook-captures"))
+    parser.add_argument("--latency", type=float, default=0.0, help="added response latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- random latency in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--response", default=ACCEPTED, help="body of successful responses")
+    parser.add_argument("--hooks", help="comma-separated hook ids; any other id gets 'Webhook not found'")
+    parser.add_argument("--quiet", action="store_true", help="do not log each request")
+    args = parser.parse_args(argv)
+
+    injection = Injection(
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        response_text=args.response,
+        known_hooks={h.strip() for h in args.hooks.split(",") if h.strip()} if args.hooks else None,
+    )
+    server = make_server(args.host, args.port, WebhookRecorder(args.record_dir, injection), args.quiet)
+    print(f"✓ Webhook stand-in listening on http://{args.host}:{args.port} (recording to {args.record_dir}/)")
+    print(f"  export WEBSITIO_WEBHOOK_BASE=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,8 +8,12 @@ import requests
 import json
 import time
 
+from websitio import get_client
+
+client = get_client()
+
 def test_make_webhook():
-    webhook_url = "https://hook.us2.make.com/6mcqk72uclcv86i1rtkao3bm2hhq3vh6"
+    webhook_url = client.webhook_url("6mcqk72uclcv86i1rtkao3bm2hhq3vh6")
     headers = {"Content-Type": "application/json"}
     
     # Test payloads
@@ -44,7 +48,7 @@ def test_make_webhook():
         
         try:
             # Send request with 30 second timeout
-            response = requests.post(
+            response = client.post(
                 webhook_url,
                 json=payload['data'],
                 headers=headers,